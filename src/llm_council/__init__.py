@@ -19,41 +19,69 @@ For MCP server usage:
     llm-council
 """
 
-from llm_council.facade import CouncilResult, consult_council
-from llm_council.council import (
-    run_full_council,
-    stage1_collect_responses,
-    stage1_5_normalize_styles,
-    stage2_collect_rankings,
-    stage3_synthesize_final,
-    calculate_aggregate_rankings,
-    parse_ranking_from_text,
-)
-
-# ADR-032: Migrated to unified_config
-from llm_council.unified_config import get_config
-
-
-def _get_council_config():
-    """Get council configuration from unified config."""
-    return get_config().council
-
-
-# Module-level aliases for backwards compatibility (re-exports)
-COUNCIL_MODELS = _get_council_config().models
-CHAIRMAN_MODEL = _get_council_config().chairman
-SYNTHESIS_MODE = _get_council_config().synthesis_mode
-EXCLUDE_SELF_VOTES = _get_council_config().exclude_self_votes
-STYLE_NORMALIZATION = _get_council_config().style_normalization
-
-from llm_council.telemetry import (
-    TelemetryProtocol,
-    get_telemetry,
-    set_telemetry,
-    reset_telemetry,
-)
+from typing import Any
+
 from llm_council._version import __version__, __version_tuple__
 
+# PEP 562 lazy namespace: public names resolve on first attribute access, so
+# importing a lightweight submodule (``llm_council.metadata``,
+# ``llm_council.unified_config``) does not drag in the council orchestration,
+# the model clients, or a config-file read.
+_LAZY_MAP = {
+    # Core orchestration
+    "CouncilResult": ("llm_council.facade", "CouncilResult"),
+    "consult_council": ("llm_council.facade", "consult_council"),
+    "run_full_council": ("llm_council.council", "run_full_council"),
+    "stage1_collect_responses": ("llm_council.council", "stage1_collect_responses"),
+    "stage1_5_normalize_styles": ("llm_council.council", "stage1_5_normalize_styles"),
+    "stage2_collect_rankings": ("llm_council.council", "stage2_collect_rankings"),
+    "stage3_synthesize_final": ("llm_council.council", "stage3_synthesize_final"),
+    # Utilities
+    "calculate_aggregate_rankings": ("llm_council.council", "calculate_aggregate_rankings"),
+    "parse_ranking_from_text": ("llm_council.council", "parse_ranking_from_text"),
+    # ADR-032: Migrated to unified_config
+    "get_config": ("llm_council.unified_config", "get_config"),
+    # Telemetry
+    "TelemetryProtocol": ("llm_council.telemetry", "TelemetryProtocol"),
+    "get_telemetry": ("llm_council.telemetry", "get_telemetry"),
+    "set_telemetry": ("llm_council.telemetry", "set_telemetry"),
+    "reset_telemetry": ("llm_council.telemetry", "reset_telemetry"),
+}
+
+# Module-level aliases for backwards compatibility (re-exports), read from the
+# council config section on first access.
+_COUNCIL_CONFIG_ALIASES = {
+    "COUNCIL_MODELS": "models",
+    "CHAIRMAN_MODEL": "chairman",
+    "SYNTHESIS_MODE": "synthesis_mode",
+    "EXCLUDE_SELF_VOTES": "exclude_self_votes",
+    "STYLE_NORMALIZATION": "style_normalization",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its defining submodule on first access."""
+    if name in _COUNCIL_CONFIG_ALIASES:
+        from llm_council.unified_config import get_config
+
+        value = getattr(get_config().council, _COUNCIL_CONFIG_ALIASES[name])
+    else:
+        try:
+            module_name, attr = _LAZY_MAP[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+        import importlib
+
+        value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
+
+
 __all__ = [
     # Core orchestration
     "run_full_council",
@@ -36,6 +36,10 @@ def _cache_enabled() -> bool:
     return _get_cache_config().enabled
 
 
+def _verify_cache_enabled() -> bool:
+    return _get_cache_config().verify_enabled
+
+
 def _cache_ttl() -> int:
     return _get_cache_config().ttl_seconds
 
@@ -69,8 +73,13 @@ def _max_reviewers():
     return _get_council_config().max_reviewers
 
 
+def _reviewer_context() -> str:
+    return _get_council_config().reviewer_context
+
+
 # Module-level aliases for backwards compatibility with tests
 CACHE_ENABLED = _cache_enabled()
+VERIFY_CACHE_ENABLED = _verify_cache_enabled()
 CACHE_TTL = _cache_ttl()
 CACHE_DIR = _cache_dir()
 COUNCIL_MODELS = _council_models()
@@ -79,19 +88,21 @@ SYNTHESIS_MODE = _synthesis_mode()
 EXCLUDE_SELF_VOTES = _exclude_self_votes()
 STYLE_NORMALIZATION = _style_normalization()
 MAX_REVIEWERS = _max_reviewers()
+REVIEWER_CONTEXT = _reviewer_context()
 
 
 def get_cache_key(query: str) -> str:
     """Generate deterministic cache key from query and configuration.
 
     The cache key incorporates all configuration that affects the response:
-    - Query text
+    - Query text (leading/trailing whitespace ignored)
     - Council model list (sorted for determinism)
     - Chairman model
     - Synthesis mode
     - Self-vote exclusion setting
     - Style normalization setting
     - Max reviewers setting
+    - Chairman reviewer-context setting
 
     Args:
         query: The user's query
@@ -99,17 +110,22 @@ def get_cache_key(query: str) -> str:
     Returns:
         16-character hex hash suitable for use as filename
     """
-    cache_input = {
-        "query": query,
+    cache_input = {"query": query.strip(), **_council_key_fields()}
+    serialized = json.dumps(cache_input, sort_keys=True)
+    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+def _council_key_fields() -> Dict[str, Any]:
+    """Council configuration that shapes a response, for cache keys."""
+    return {
         "council_models": sorted(COUNCIL_MODELS),
         "chairman": CHAIRMAN_MODEL,
         "synthesis_mode": SYNTHESIS_MODE,
         "exclude_self_votes": EXCLUDE_SELF_VOTES,
         "style_normalization": STYLE_NORMALIZATION,
         "max_reviewers": MAX_REVIEWERS,
+        "reviewer_context": REVIEWER_CONTEXT,
     }
-    serialized = json.dumps(cache_input, sort_keys=True)
-    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
 
 
 def get_cached_response(cache_key: str) -> Optional[Dict[str, Any]]:
@@ -123,7 +139,11 @@ def get_cached_response(cache_key: str) -> Optional[Dict[str, Any]]:
     """
     if not CACHE_ENABLED:
         return None
+    return _read_cache_entry(cache_key)
 
+
+def _read_cache_entry(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Load a cache file, dropping it if expired or unreadable."""
     cache_file = CACHE_DIR / f"{cache_key}.json"
 
     if not cache_file.exists():
@@ -189,6 +209,71 @@ def save_to_cache(
         pass
 
 
+def get_verification_cache_key(key_input: Dict[str, Any]) -> str:
+    """Generate a cache key for a verification result.
+
+    ``key_input`` must hold everything specific to the verification (the
+    rendered verification prompt, the request fields, the tier's models); the
+    caller builds it. The council configuration that get_cache_key() covers
+    (chairman, self-vote exclusion, reviewer context, ...) is added here.
+    Verification entries share the council cache directory, so keys are
+    prefixed to keep them apart.
+
+    Args:
+        key_input: JSON-serializable description of the verification
+
+    Returns:
+        Prefixed 16-character hex hash suitable for use as filename
+    """
+    serialized = json.dumps({**key_input, "council": _council_key_fields()}, sort_keys=True)
+    return "verify-" + hashlib.sha256(serialized.encode()).hexdigest()[:16]
+
+
+def get_cached_verification(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Retrieve a cached verification result (LLM_COUNCIL_VERIFY_CACHE).
+
+    Args:
+        cache_key: The cache key from get_verification_cache_key()
+
+    Returns:
+        The stored result dict, or None on a miss or when disabled
+    """
+    if not VERIFY_CACHE_ENABLED:
+        return None
+    cached = _read_cache_entry(cache_key)
+    return cached.get("result") if cached else None
+
+
+def save_verification_to_cache(cache_key: str, result: Dict[str, Any]) -> None:
+    """Save a completed verification result to cache.
+
+    Read back with get_cached_verification().
+
+    Args:
+        cache_key: The cache key from get_verification_cache_key()
+        result: Verification result dict, as returned by run_verification()
+    """
+    if not VERIFY_CACHE_ENABLED:
+        return
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    cache_file = CACHE_DIR / f"{cache_key}.json"
+
+    cache_data = {
+        "_cached_at": time.time(),
+        "_cache_key": cache_key,
+        "result": result,
+    }
+
+    try:
+        with open(cache_file, "w") as f:
+            json.dump(cache_data, f, indent=2, default=str)
+    except OSError:
+        # Silently fail on cache write errors
+        pass
+
+
 def clear_cache() -> int:
     """Clear all cached responses.
 
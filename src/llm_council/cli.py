@@ -205,6 +205,13 @@ def calibration_report(
 
 def main():
     """Main CLI entry point - dispatches to MCP or HTTP server."""
+    # Fast path: bare ``llm-council`` (the MCP server, launched by every MCP
+    # client on connect) needs no argument parsing, so skip building the
+    # full subcommand tree.
+    if len(sys.argv) == 1:
+        serve_mcp()
+        return
+
     parser = argparse.ArgumentParser(
         prog="llm-council",
         description="LLM Council - Multi-model deliberation system",
@@ -599,7 +606,7 @@ def serve_mcp():
     Requires the [mcp] extra: pip install 'llm-council-core[mcp]'
     """
     try:
-        from llm_council.mcp_server import mcp
+        from llm_council.mcp_server import run_stdio
     except ImportError as e:
         print(f"Error importing MCP server: {e}", file=sys.stderr)
         print("\nTo use the MCP server, install with:", file=sys.stderr)
@@ -608,7 +615,7 @@ def serve_mcp():
         print("    from llm_council import run_full_council", file=sys.stderr)
         sys.exit(1)
 
-    mcp.run()
+    run_stdio()
 
 
 def setup_key(from_stdin: bool = False):
@@ -119,6 +119,13 @@ def _get_max_reviewers():
     return _get_council_config().max_reviewers
 
 
+def _get_reviewer_context() -> str:
+    patched = _check_patched_attr("REVIEWER_CONTEXT")
+    if patched is not None:
+        return patched
+    return _get_council_config().reviewer_context
+
+
 def _get_cache_enabled() -> bool:
     patched = _check_patched_attr("CACHE_ENABLED")
     if patched is not None:
@@ -210,6 +217,7 @@ _DEPRECATED_CONFIG_ATTRS = {
     "STYLE_NORMALIZATION": _get_style_normalization,
     "NORMALIZER_MODEL": _get_normalizer_model,
     "MAX_REVIEWERS": _get_max_reviewers,
+    "REVIEWER_CONTEXT": _get_reviewer_context,
     "CACHE_ENABLED": _get_cache_enabled,
 }
 
@@ -262,6 +270,7 @@ from llm_council.council_rankings import (  # noqa: E402
 from llm_council.council_stages import (  # noqa: E402
     generate_conversation_title,
     generate_partial_warning,
+    normalize_response_style,
     quick_synthesis,
     should_normalize_styles,
     stage1_5_normalize_styles,
@@ -489,6 +498,21 @@ async def run_council_with_fallback(
             except Exception:
                 pass
 
+    # Stage 1.5 pipelining: with normalization forced on, rewrite each Stage 1
+    # response as soon as its model answers instead of after the slowest one.
+    # ("auto" needs every response to decide, so it keeps the barrier.)
+    prestarted_normalizations: Dict[str, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+    stage1_model_complete = on_model_complete
+    if _get_style_normalization() is True:
+
+        async def stage1_model_complete(model: str, model_result: Dict[str, Any]) -> None:
+            if model_result.get("status") == STATUS_OK:
+                prestarted_normalizations[model] = asyncio.create_task(
+                    normalize_response_style(model_result.get("content", ""))
+                )
+            if on_model_complete is not None:
+                await on_model_complete(model, model_result)
+
     # Generate session_id early to share between bias persistence and telemetry
     session_id = str(uuid.uuid4())
 
@@ -504,7 +528,7 @@ async def run_council_with_fallback(
             user_query,
             timeout=per_model_timeout,  # ADR-012 Section 5: Tier-sovereign timeout
             on_progress=stage1_progress,
-            on_model_complete=on_model_complete,  # ADR-046 P1
+            on_model_complete=stage1_model_complete,  # ADR-046 P1 (+ Stage 1.5 pipelining)
             shared_raw_responses=shared_raw_responses,  # Preserve state on timeout
             models=council_models,  # ADR-022: Use tier-appropriate models
         )
@@ -537,27 +561,43 @@ async def run_council_with_fallback(
         except Exception:
             pass  # Webhook failure shouldn't block council execution
 
-        # Stage 1.5: Style normalization (if enabled)
-        responses_for_review, stage1_5_usage = await stage1_5_normalize_styles(stage1_results)
-
-        # Stage 2: Peer review
-        await report_progress(requested_models + 1, total_steps, "Stage 2: Peer review...")
-        # ADR-046 P3: per-reviewer progress ("<model> reviewed (2/4)") reaches
-        # MCP ctx.report_progress / HTTP progress ONLY when a consumer exists —
-        # a progress wrapper passed unconditionally would flip stage 2 onto
-        # the incremental path for every run.
-        stage2_progress = None
-        if on_progress is not None:
+        if len(stage1_results) == 1:
+            # Single response: nothing to normalize against or rank, so skip
+            # Stage 1.5 and the reviewer fan-out (parity with run_full_council).
+            stage1_5_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            stage2_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+            stage2_results: List[Dict[str, Any]] = []
+            # Enhanced {"model", "display_index"} entries, as stage 2 builds them.
+            label_to_model: Dict[str, Any] = {
+                "Response A": {"model": stage1_results[0]["model"], "display_index": 0}
+            }
+            result["metadata"]["degraded_mode"] = "single_model"
+        else:
+            # Stage 1.5: Style normalization (if enabled)
+            responses_for_review, stage1_5_usage = await stage1_5_normalize_styles(
+                stage1_results, prestarted=prestarted_normalizations
+            )
 
-            async def stage2_progress(completed, total, msg):
-                await report_progress(requested_models + completed, total_steps, f"Stage 2: {msg}")
+            # Stage 2: Peer review
+            await report_progress(requested_models + 1, total_steps, "Stage 2: Peer review...")
+            # ADR-046 P3: per-reviewer progress ("<model> reviewed (2/4)") reaches
+            # MCP ctx.report_progress / HTTP progress ONLY when a consumer exists —
+            # a progress wrapper passed unconditionally would flip stage 2 onto
+            # the incremental path for every run.
+            stage2_progress = None
+            if on_progress is not None:
+
+                async def stage2_progress(completed, total, msg):
+                    await report_progress(
+                        requested_models + completed, total_steps, f"Stage 2: {msg}"
+                    )
 
-        stage2_results, label_to_model, stage2_usage = await stage2_collect_rankings(
-            user_query,
-            responses_for_review,
-            on_progress=stage2_progress,
-            on_review_event=on_review_event,
-        )
+            stage2_results, label_to_model, stage2_usage = await stage2_collect_rankings(
+                user_query,
+                responses_for_review,
+                on_progress=stage2_progress,
+                on_review_event=on_review_event,
+            )
 
         # ADR-027: Track shadow votes for frontier tier
         track_shadows = should_track_shadow_votes(tier_contract)
@@ -838,6 +878,10 @@ async def run_council_with_fallback(
         return result
 
     finally:
+        # Rewrites still in flight after a timeout or failure are abandoned.
+        for task in prestarted_normalizations.values():
+            task.cancel()
+
         # ADR-025a: Always shutdown EventBridge to ensure cleanup
         try:
             await event_bridge.shutdown()
@@ -5,9 +5,10 @@ existing imports and test patch sites on ``llm_council.council.*`` keep
 working (the orchestrators that call these stayed in council.py).
 """
 
+import json
 import logging
 import re
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Collection, Dict, List, Optional, TYPE_CHECKING
 
 from llm_council.layer_contracts import LayerEventType, emit_layer_event
 from llm_council.voting import VotingAuthority, get_vote_weight
@@ -17,6 +18,25 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for parse_ranking_from_text (runs once per reviewer).
+# Refusal patterns are lowercase since they are matched against lowercased text.
+_REFUSAL_RE = re.compile(
+    r"i cannot evaluate"
+    r"|i'm not able to (rank|evaluate|assess)"
+    r"|i don't feel comfortable"
+    r"|i must decline"
+    r"|i can't provide a ranking"
+    r"|i'm unable to rank"
+    r"|i cannot compare"
+    r"|i won't be able to"
+    r"|i apologize,? but i cannot"
+)
+_JSON_FENCE_RE = re.compile(r"```json\s*([\s\S]*?)\s*```")
+_JSON_OBJ_RE = re.compile(r'\{\s*"ranking"\s*:')
+_RESPONSE_LABEL_RE = re.compile(r"Response [A-Z]")
+_NUMBERED_LABEL_RE = re.compile(r"\d+\.\s*(Response [A-Z])")
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _get_exclude_self_votes() -> bool:
     """Call-time lookup through council so patched-attr semantics hold."""
@@ -102,7 +122,9 @@ def detect_score_rank_mismatch(ranking: List[str], scores: Dict[str, Any]) -> bo
     return ranked_with_scores != score_order
 
 
-def parse_ranking_from_text(ranking_text: str) -> Dict[str, Any]:
+def parse_ranking_from_text(
+    ranking_text: str, valid_labels: Optional[Collection[str]] = None
+) -> Dict[str, Any]:
     """
     Parse the ranking JSON from the model's response.
 
@@ -115,40 +137,25 @@ def parse_ranking_from_text(ranking_text: str) -> Dict[str, Any]:
 
     Args:
         ranking_text: The full text response from the model
+        valid_labels: Optional set of labels actually shown to the reviewer
+            (e.g. {"Response A", "Response B"}). When given, the free-text
+            fallbacks drop any other "Response X" mention as hallucinated.
 
     Returns:
         Dict with 'ranking' (list), 'scores' (dict), and optionally:
         - 'abstained' (bool): If model refused to evaluate
         - 'score_rank_mismatch' (bool): If scores contradict ranking
     """
-    import re
-    import json
-
     result = {"ranking": [], "scores": {}}
 
     # Check for safety refusals or inability to evaluate
-    # Note: patterns are lowercase since we search in lowercased text
-    refusal_patterns = [
-        r"i cannot evaluate",
-        r"i'm not able to (rank|evaluate|assess)",
-        r"i don't feel comfortable",
-        r"i must decline",
-        r"i can't provide a ranking",
-        r"i'm unable to rank",
-        r"i cannot compare",
-        r"i won't be able to",
-        r"i apologize,? but i cannot",
-    ]
-
-    ranking_text_lower = ranking_text.lower()
-    for pattern in refusal_patterns:
-        if re.search(pattern, ranking_text_lower):
-            result["abstained"] = True
-            result["abstention_reason"] = "Safety refusal detected"
-            return result
+    if _REFUSAL_RE.search(ranking_text.lower()):
+        result["abstained"] = True
+        result["abstention_reason"] = "Safety refusal detected"
+        return result
 
     # Try to extract JSON block from markdown code fence
-    json_match = re.search(r"```json\s*([\s\S]*?)\s*```", ranking_text)
+    json_match = _JSON_FENCE_RE.search(ranking_text)
     if json_match:
         try:
             parsed = json.loads(json_match.group(1))
@@ -163,23 +170,12 @@ def parse_ranking_from_text(ranking_text: str) -> Dict[str, Any]:
         except json.JSONDecodeError:
             pass
 
-    # Fallback: try to find raw JSON object
-    json_obj_match = re.search(r'\{\s*"ranking"\s*:', ranking_text)
+    # Fallback: try to find raw JSON object. raw_decode stops at the end of
+    # the object, so trailing prose and braces inside strings are handled.
+    json_obj_match = _JSON_OBJ_RE.search(ranking_text)
     if json_obj_match:
-        # Find the matching closing brace
-        start = json_obj_match.start()
-        brace_count = 0
-        end = start
-        for i, char in enumerate(ranking_text[start:], start):
-            if char == "{":
-                brace_count += 1
-            elif char == "}":
-                brace_count -= 1
-                if brace_count == 0:
-                    end = i + 1
-                    break
         try:
-            parsed = json.loads(ranking_text[start:end])
+            parsed, _end = _JSON_DECODER.raw_decode(ranking_text, json_obj_match.start())
             if isinstance(parsed.get("ranking"), list):
                 result["ranking"] = parsed["ranking"]
             if isinstance(parsed.get("scores"), dict):
@@ -196,19 +192,23 @@ def parse_ranking_from_text(ranking_text: str) -> Dict[str, Any]:
         parts = ranking_text.split("FINAL RANKING:")
         if len(parts) >= 2:
             ranking_section = parts[1]
-            numbered_matches = re.findall(r"\d+\.\s*Response [A-Z]", ranking_section)
+            numbered_matches = _NUMBERED_LABEL_RE.findall(ranking_section)
+            if valid_labels is not None:
+                numbered_matches = [m for m in numbered_matches if m in valid_labels]
             if numbered_matches:
-                result["ranking"] = [
-                    re.search(r"Response [A-Z]", m).group() for m in numbered_matches
-                ]
+                result["ranking"] = numbered_matches
                 return result
-            matches = re.findall(r"Response [A-Z]", ranking_section)
+            matches = _RESPONSE_LABEL_RE.findall(ranking_section)
+            if valid_labels is not None:
+                matches = [m for m in matches if m in valid_labels]
             if matches:
                 result["ranking"] = matches
                 return result
 
     # Final fallback: try to find any "Response X" patterns in order
-    matches = re.findall(r"Response [A-Z]", ranking_text)
+    matches = _RESPONSE_LABEL_RE.findall(ranking_text)
+    if valid_labels is not None:
+        matches = [m for m in matches if m in valid_labels]
     result["ranking"] = matches
     return result
 
@@ -269,11 +269,13 @@ def calculate_aggregate_rankings(
             ]
         return []
 
-    # Track normalized Borda scores and raw scores for each model
-    model_borda_scores = defaultdict(list)  # Now stores normalized [0,1] scores
-    model_raw_scores = defaultdict(list)
-    model_positions = defaultdict(list)
+    # Running totals per model, accumulated in a single pass over the votes:
+    # borda_acc = [normalized Borda sum, 1-indexed position sum, vote count],
+    # score_acc = [normalized raw score sum, count].
+    borda_acc: Dict[str, List[float]] = defaultdict(lambda: [0, 0, 0])
+    score_acc: Dict[str, List[float]] = defaultdict(lambda: [0, 0])
     self_votes_excluded = 0
+    exclude_self_votes = _get_exclude_self_votes()
 
     # ADR-027: Track shadow votes separately for observability
     shadow_votes = []
@@ -328,7 +330,7 @@ def calculate_aggregate_rankings(
                 author_model = _get_model_from_label_value(label_to_model[label])
 
                 # Exclude self-votes if configured
-                if _get_exclude_self_votes() and reviewer_model == author_model:
+                if exclude_self_votes and reviewer_model == author_model:
                     self_votes_excluded += 1
                     continue
 
@@ -338,8 +340,10 @@ def calculate_aggregate_rankings(
                     raw_borda = max_borda - position
                     # Normalize to [0, 1]: divide by max possible points
                     normalized_borda = raw_borda / max_borda
-                    model_borda_scores[author_model].append(normalized_borda)
-                    model_positions[author_model].append(position + 1)  # 1-indexed for display
+                    acc = borda_acc[author_model]
+                    acc[0] += normalized_borda
+                    acc[1] += position + 1  # 1-indexed for display
+                    acc[2] += 1
 
         # Also track raw scores (as secondary signal, normalized to [0,1])
         # Only for FULL authority votes
@@ -348,13 +352,14 @@ def calculate_aggregate_rankings(
                 if label in label_to_model:
                     author_model = _get_model_from_label_value(label_to_model[label])
 
-                    if _get_exclude_self_votes() and reviewer_model == author_model:
+                    if exclude_self_votes and reviewer_model == author_model:
                         continue
 
                     # Normalize raw score to [0,1] (assuming 1-10 scale)
-                    normalized_raw = score / 10.0 if isinstance(score, (int, float)) else None
-                    if normalized_raw is not None:
-                        model_raw_scores[author_model].append(normalized_raw)
+                    if isinstance(score, (int, float)):
+                        acc = score_acc[author_model]
+                        acc[0] += score / 10.0
+                        acc[1] += 1
 
     # Calculate aggregates for each model
     aggregate = []
@@ -364,26 +369,21 @@ def calculate_aggregate_rankings(
     all_candidate_models = {
         _get_model_from_label_value(label_to_model[label]) for label in label_to_model
     }
-    all_models = (
-        all_candidate_models | set(model_borda_scores.keys()) | set(model_raw_scores.keys())
-    )
+    all_models = all_candidate_models | borda_acc.keys() | score_acc.keys()
 
     for model in all_models:
-        borda_scores = model_borda_scores.get(model, [])
-        raw_scores = model_raw_scores.get(model, [])
-        positions = model_positions.get(model, [])
+        borda_sum, position_sum, vote_count = borda_acc.get(model, (0, 0, 0))
+        score_sum, score_count = score_acc.get(model, (0, 0))
 
         entry = {
             "model": model,
             # Average of normalized Borda scores [0,1]
-            "borda_score": round(sum(borda_scores) / len(borda_scores), 3)
-            if borda_scores
-            else None,
-            "average_position": round(sum(positions) / len(positions), 2) if positions else None,
+            "borda_score": round(borda_sum / vote_count, 3) if vote_count else None,
+            "average_position": round(position_sum / vote_count, 2) if vote_count else None,
             # Average of normalized raw scores [0,1]
-            "average_score": round(sum(raw_scores) / len(raw_scores), 3) if raw_scores else None,
-            "vote_count": len(borda_scores),
-            "self_votes_excluded": _get_exclude_self_votes(),
+            "average_score": round(score_sum / score_count, 3) if score_count else None,
+            "vote_count": vote_count,
+            "self_votes_excluded": exclude_self_votes,
         }
 
         # ADR-027: Optionally include shadow votes for observability
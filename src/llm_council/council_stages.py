@@ -12,10 +12,11 @@ import time) so ``llm_council.council`` patched-attribute semantics —
 
 import asyncio
 import html
+import json
 import logging
 import random
 import uuid
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 from llm_council.unified_config import get_config
 from llm_council.gateway_adapter import (
@@ -96,6 +97,13 @@ def _get_normalizer_model():
     return council_module._get_normalizer_model()
 
 
+def _get_reviewer_context():
+    """Call-time lookup through council so patched-attr semantics hold."""
+    import llm_council.council as council_module
+
+    return council_module._get_reviewer_context()
+
+
 def _get_style_normalization():
     """Call-time lookup through council so patched-attr semantics hold."""
     import llm_council.council as council_module
@@ -205,6 +213,9 @@ async def stage1_collect_responses_with_status(
         if response.get("retry_after"):
             model_statuses[model]["retry_after"] = response["retry_after"]
 
+        if response.get("attempts"):
+            model_statuses[model]["attempts"] = response["attempts"]
+
         # Only include successful responses in results
         if response.get("status") == STATUS_OK:
             stage1_results.append({"model": model, "response": response.get("content", "")})
@@ -381,8 +392,34 @@ def should_normalize_styles(responses: List[str]) -> bool:
     return False
 
 
+async def normalize_response_style(response_text: str) -> Optional[Dict[str, Any]]:
+    """Rewrite one Stage 1 response in a neutral style via the normalizer model.
+
+    Returns:
+        The normalizer's response dict (``content``, ``usage``), or None if failed
+    """
+    normalize_prompt = f"""Rewrite the following text to have a neutral, consistent style while preserving ALL content and meaning exactly.
+
+Rules:
+- Remove any AI-assistant preambles like "As an AI..." or "I'd be happy to help..."
+- Use consistent markdown formatting (headers, lists, code blocks)
+- Maintain a professional, neutral tone
+- Do NOT add or remove any substantive content
+- Do NOT add opinions or caveats not in the original
+- Keep the same structure and organization
+
+Original text:
+{response_text}
+
+Rewritten text:"""
+
+    messages = [{"role": "user", "content": normalize_prompt}]
+    return await query_model(_get_normalizer_model(), messages, timeout=60.0)
+
+
 async def stage1_5_normalize_styles(
     stage1_results: List[Dict[str, Any]],
+    prestarted: Optional[Mapping[str, Awaitable[Optional[Dict[str, Any]]]]] = None,
 ) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
     """
     Stage 1.5: Normalize response styles to reduce stylistic fingerprinting.
@@ -398,6 +435,9 @@ async def stage1_5_normalize_styles(
 
     Args:
         stage1_results: Results from Stage 1
+        prestarted: Optional model -> in-flight ``normalize_response_style``
+            task, started by the orchestrator as each Stage 1 response
+            arrived. Used in place of a fresh call for that model.
 
     Returns:
         Tuple of (normalized results, usage dict with token counts)
@@ -414,27 +454,18 @@ async def stage1_5_normalize_styles(
         return stage1_results, total_usage
     # else: _get_style_normalization() is True, always normalize
 
-    normalized_results = []
-
-    for result in stage1_results:
-        normalize_prompt = f"""Rewrite the following text to have a neutral, consistent style while preserving ALL content and meaning exactly.
+    prestarted = prestarted or {}
 
-Rules:
-- Remove any AI-assistant preambles like "As an AI..." or "I'd be happy to help..."
-- Use consistent markdown formatting (headers, lists, code blocks)
-- Maintain a professional, neutral tone
-- Do NOT add or remove any substantive content
-- Do NOT add opinions or caveats not in the original
-- Keep the same structure and organization
-
-Original text:
-{result["response"]}
-
-Rewritten text:"""
-
-        messages = [{"role": "user", "content": normalize_prompt}]
-        response = await query_model(_get_normalizer_model(), messages, timeout=60.0)
+    # The rewrites are independent calls; run them concurrently like Stage 1.
+    responses = await asyncio.gather(
+        *(
+            prestarted.get(result["model"]) or normalize_response_style(result["response"])
+            for result in stage1_results
+        )
+    )
 
+    normalized_results = []
+    for result, response in zip(stage1_results, responses):
         if response is not None:
             normalized_results.append(
                 {
@@ -498,6 +529,18 @@ async def stage2_collect_rankings(
         for i, (label, result) in enumerate(zip(labels, shuffled_results))
     }
 
+    # A reviewer's text can be parsed up to three times (stream event,
+    # early-consensus tally, final formatting); parse each text once and hand
+    # out copies so callers can annotate their own result.
+    valid_labels = frozenset(label_to_model)
+    parsed_by_text: Dict[str, Dict[str, Any]] = {}
+
+    def parse_review(text: str) -> Dict[str, Any]:
+        parsed = parsed_by_text.get(text)
+        if parsed is None:
+            parsed = parsed_by_text[text] = parse_ranking_from_text(text, valid_labels)
+        return dict(parsed)
+
     # Build the ranking prompt with XML delimiters for prompt injection defense
     responses_text = "\n\n".join(
         [
@@ -675,7 +718,7 @@ Now provide your evaluation and ranking:"""
                             # ADR-046 P1: per-reviewer stream event (soft-fail)
                             if on_review_event is not None and result is not None:
                                 try:
-                                    _rev_parsed = parse_ranking_from_text(result.get("content", ""))
+                                    _rev_parsed = parse_review(result.get("content", ""))
                                     await on_review_event(
                                         "review",
                                         {
@@ -705,7 +748,7 @@ Now provide your evaluation and ranking:"""
             if ec_terminated or ec_shadow_logged or result is None:
                 continue
             try:
-                parsed = parse_ranking_from_text(result.get("content", ""))
+                parsed = parse_review(result.get("content", ""))
                 borda_update(ec_points, parsed.get("ranking", []), ec_num_candidates)
                 remaining = [m for t, m in tasks.items() if not t.done()]
                 leader = unassailable_leader(ec_points, len(remaining), ec_num_candidates)
@@ -803,11 +846,11 @@ Now provide your evaluation and ranking:"""
                     }
                 else:
                     # Rubric parse failed, fall back to holistic parsing
-                    parsed = parse_ranking_from_text(full_text)
+                    parsed = parse_review(full_text)
                     parsed["rubric_scoring"] = False
             else:
                 # Holistic scoring (original behavior)
-                parsed = parse_ranking_from_text(full_text)
+                parsed = parse_review(full_text)
 
             stage2_results.append(
                 {
@@ -843,6 +886,14 @@ def _record_verdict_parse_error(response: Dict[str, Any], exc: BaseException) ->
         pass
 
 
+def _compact_review(result: Dict[str, Any]) -> str:
+    """Stage 2 review as compact ranking JSON, or its text if it has no ranking."""
+    parsed = result.get("parsed_ranking") or {}
+    if not parsed.get("ranking"):
+        return result["ranking"]
+    return json.dumps(parsed, separators=(",", ":"))
+
+
 async def stage3_synthesize_final(
     user_query: str,
     stage1_results: List[Dict[str, Any]],
@@ -906,9 +957,21 @@ async def stage3_synthesize_final(
         [f"Model: {result['model']}\nResponse: {result['response']}" for result in stage1_results]
     )
 
-    stage2_text = "\n\n".join(
-        [f"Model: {result['model']}\nRanking: {result['ranking']}" for result in stage2_results]
-    )
+    if _get_reviewer_context() == "parsed":
+        # Compact reviewer context: the parsed ranking/scores carry the votes;
+        # the critique prose is dropped. A review that yielded no ranking
+        # (unparseable, or an abstention) keeps its text, since that text is
+        # all the chairman has to go on for that reviewer.
+        stage2_text = "\n\n".join(
+            [
+                f"Model: {result['model']}\nRanking: " + _compact_review(result)
+                for result in stage2_results
+            ]
+        )
+    else:
+        stage2_text = "\n\n".join(
+            [f"Model: {result['model']}\nRanking: {result['ranking']}" for result in stage2_results]
+        )
 
     # Add aggregate rankings context if available
     rankings_context = ""
@@ -1120,12 +1183,19 @@ async def generate_conversation_title(user_query: str) -> str:
     """
     Generate a short title for a conversation based on the first user message.
 
+    Queries that already fit in a title are used as-is (minus trailing
+    punctuation) without a model call.
+
     Args:
         user_query: The first user message
 
     Returns:
         A short title (3-5 words)
     """
+    short_title = user_query.strip().rstrip(".?!")
+    if short_title and len(short_title) <= 50 and "\n" not in short_title:
+        return short_title
+
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
@@ -640,6 +640,23 @@ async def audit(
         )
 
 
+def run_stdio() -> None:
+    """Serve the MCP server over stdio, on uvloop when it is installed.
+
+    Same as ``mcp.run()`` (FastMCP's stdio default) apart from the event loop;
+    uvloop ships with the [uvloop] extra and is skipped where it is absent.
+    """
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+        return
+
+    import anyio
+
+    anyio.run(mcp.run_stdio_async, backend_options={"use_uvloop": True})
+
+
 def main():
     """Entry point for the llm-council command."""
     # ADR-045 P1: feature-detected Tasks exposure — no-op on SDKs < 2.x
@@ -647,7 +664,7 @@ def main():
     from .mcp_tasks import maybe_expose_tasks
 
     maybe_expose_tasks(mcp)
-    mcp.run()
+    run_stdio()
 
 
 if __name__ == "__main__":
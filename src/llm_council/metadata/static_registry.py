@@ -14,7 +14,7 @@ the system must function without external dependencies when offline.
 
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import yaml
 
@@ -29,6 +29,15 @@ DEFAULT_REGISTRY_PATH = Path(__file__).parent.parent / "models" / "registry.yaml
 # Safe default context window per ADR-026
 DEFAULT_CONTEXT_WINDOW = 4096
 
+# libyaml's C loader parses the bundled registry ~10x faster than the
+# pure-Python SafeLoader; PyYAML builds without libyaml fall back to it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed registries keyed by (path, mtime_ns, size). reload_provider() and
+# every fresh provider reuse the parse of an unchanged file; editing the file
+# changes the key, so the next provider re-reads it.
+_parsed_registries: Dict[Tuple[str, int, int], Dict[str, ModelInfo]] = {}
+
 
 class StaticRegistryProvider:
     """Offline-safe metadata provider using bundled YAML registry.
@@ -72,8 +81,15 @@ class StaticRegistryProvider:
                 logger.warning(f"Registry file not found: {path}")
                 return
 
+            stat = path.stat()
+            cache_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+            cached = _parsed_registries.get(cache_key)
+            if cached is not None:
+                self._registry = dict(cached)
+                return
+
             with open(path, "r") as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
 
             if not data or "models" not in data:
                 logger.warning(f"Invalid registry schema in {path}")
@@ -92,6 +108,7 @@ class StaticRegistryProvider:
                 except Exception as e:
                     logger.warning(f"Failed to parse model entry: {e}")
 
+            _parsed_registries[cache_key] = dict(self._registry)
             logger.info(f"Loaded {len(self._registry)} models from registry")
 
         except Exception as e:
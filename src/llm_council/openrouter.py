@@ -5,8 +5,9 @@ ADR-026 Phase 2: Added reasoning_params support for reasoning models.
 
 import httpx
 import asyncio
+import random
 import time
-from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Awaitable
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Awaitable, Tuple
 
 # ADR-032: Migrated to unified_config
 from llm_council.unified_config import get_api_key
@@ -78,6 +79,11 @@ STATUS_RATE_LIMITED = "rate_limited"
 STATUS_AUTH_ERROR = "auth_error"
 STATUS_ERROR = "error"
 
+# Transient failures (5xx, dropped connections) get a few jittered retries
+# inside the caller's timeout instead of silently shrinking the council.
+TRANSIENT_RETRY_ATTEMPTS = 3
+TRANSIENT_RETRY_BASE_DELAY = 0.5
+
 
 async def query_model(
     model: str,
@@ -124,15 +130,20 @@ async def query_model_with_status(
     """
     Query a single model via OpenRouter API with structured status (ADR-012).
 
+    Transient failures (HTTP 5xx, dropped connections) are retried up to
+    TRANSIENT_RETRY_ATTEMPTS times with jittered exponential backoff, as long
+    as the next attempt still fits inside ``timeout``.
+
     Args:
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
         messages: List of message dicts with 'role' and 'content'
-        timeout: Request timeout in seconds
+        timeout: Request timeout in seconds (total, across retries)
         disable_tools: If True, explicitly disable tool/function calling
         reasoning_params: Optional reasoning parameters for reasoning models (ADR-026)
 
     Returns:
-        Response dict with 'status', 'content', 'latency_ms', 'usage', and optional 'error'
+        Response dict with 'status', 'content', 'latency_ms', 'usage', and optional
+        'error'; 'attempts' is present when the call was retried
     """
     api_url, api_key, route = resolve_endpoint()
     model = resolve_model_name(model, route)
@@ -153,9 +164,47 @@ async def query_model_with_status(
     )
 
     start_time = time.time()
-
+    deadline = start_time + timeout
+    attempt = 1
+    while True:
+        result, transient = await _post_completion(
+            api_url, headers, payload, model, route, timeout, start_time, deadline
+        )
+        delay = TRANSIENT_RETRY_BASE_DELAY * 2 ** (attempt - 1) + random.uniform(0, 0.25)
+        if (
+            not transient
+            or attempt >= TRANSIENT_RETRY_ATTEMPTS
+            or time.time() + delay >= deadline
+        ):
+            break
+        await asyncio.sleep(delay)
+        attempt += 1
+
+    if attempt > 1:
+        result["attempts"] = attempt
+    return result
+
+
+async def _post_completion(
+    api_url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    model: str,
+    route: str,
+    timeout: float,
+    start_time: float,
+    deadline: float,
+) -> Tuple[Dict[str, Any], bool]:
+    """Make one completion request for query_model_with_status.
+
+    Returns the structured result and whether the failure is transient
+    (worth retrying). ``latency_ms`` is measured from ``start_time`` so it
+    covers all attempts; each attempt is bounded by what is left of the
+    caller's ``timeout``.
+    """
+    remaining = max(deadline - time.time(), 0.0)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
+        async with httpx.AsyncClient(timeout=remaining) as client:
             # Issue #545: httpx's `timeout=` sets four SEPARATE per-operation
             # timeouts (connect/read/write/pool); `read` is the maximum gap
             # BETWEEN chunks, not total elapsed, and httpx offers no
@@ -166,7 +215,7 @@ async def query_model_with_status(
             # global deadline) still propagates: wait_for re-raises CancelledError,
             # which derives from BaseException and is not caught below.
             response = await asyncio.wait_for(
-                client.post(api_url, headers=headers, json=payload), timeout=timeout
+                client.post(api_url, headers=headers, json=payload), timeout=remaining
             )
             latency_ms = int((time.time() - start_time) * 1000)
 
@@ -178,21 +227,21 @@ async def query_model_with_status(
                     "latency_ms": latency_ms,
                     "error": f"Rate limited by {model}",
                     "retry_after": int(retry_after) if retry_after.isdigit() else 60,
-                }
+                }, False
 
             if response.status_code in (401, 403):
                 return {
                     "status": STATUS_AUTH_ERROR,
                     "latency_ms": latency_ms,
                     "error": f"Authentication failed for {model}: {response.status_code}",
-                }
+                }, False
 
             if response.status_code == 400:
                 return {
                     "status": STATUS_ERROR,
                     "latency_ms": latency_ms,
                     "error": f"Bad request for {model}: {response.text[:200]}",
-                }
+                }, False
 
             response.raise_for_status()
 
@@ -226,7 +275,7 @@ async def query_model_with_status(
                     # ADR-049 D4: cache writes (0 when the route reports none).
                     "cache_write_tokens": _extract_cache_write_tokens(usage),
                 },
-            }
+            }, False
 
     except (httpx.TimeoutException, asyncio.TimeoutError):
         # #545: asyncio.TimeoutError is the wall-clock bound above; httpx's is a
@@ -236,16 +285,21 @@ async def query_model_with_status(
             "status": STATUS_TIMEOUT,
             "latency_ms": latency_ms,
             "error": f"Timeout after {timeout}s",
-        }
+        }, False
 
     except Exception as e:
         latency_ms = int((time.time() - start_time) * 1000)
         print(f"Error querying model {model}: {e}")
+        # Server-side 5xx and dropped connections are usually momentary;
+        # 4xx (billing, not-found) and malformed payloads are not.
+        transient = isinstance(e, httpx.TransportError) or (
+            isinstance(e, httpx.HTTPStatusError) and e.response.status_code >= 500
+        )
         return {
             "status": STATUS_ERROR,
             "latency_ms": latency_ms,
             "error": str(e),
-        }
+        }, transient
 
 
 async def query_models_parallel(
@@ -34,7 +34,7 @@ import re
 from contextvars import ContextVar
 from dataclasses import field
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Literal, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Tuple, Union
 
 import yaml
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, field_validator, model_validator
@@ -761,6 +761,12 @@ class CouncilConfig(BaseModel):
         default=None,
         alias="LLM_COUNCIL_MAX_REVIEWERS",
     )
+    # "parsed" hands the chairman each reviewer's parsed ranking JSON instead
+    # of the full critique prose, cutting Stage 3 input tokens.
+    reviewer_context: Literal["full", "parsed"] = Field(
+        default="full",
+        alias="LLM_COUNCIL_REVIEWER_CONTEXT",
+    )
 
 
 class TierTimeoutConfig(BaseModel):
@@ -832,6 +838,12 @@ class CacheConfig(BaseModel):
         ge=0,
         alias="LLM_COUNCIL_CACHE_TTL",
     )
+    # Separate opt-in for reusing verification verdicts: LLM_COUNCIL_CACHE
+    # predates it and only ever covered council responses.
+    verify_enabled: bool = Field(
+        default=False,
+        alias="LLM_COUNCIL_VERIFY_CACHE",
+    )
     directory: Path = Field(default_factory=lambda: Path.home() / ".cache" / "llm-council")
 
 
@@ -1023,8 +1035,12 @@ class UnifiedConfig(BaseModel):
         Returns:
             YAML representation of the configuration
         """
-        config_dict = {"council": self.to_dict()}
-        return yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
+        # JSON mode renders Paths and enums as plain scalars, so the output
+        # loads back with the safe loader load_config() uses.
+        config_dict = {"council": self.model_dump(mode="json", exclude_none=True)}
+        return yaml.dump(
+            config_dict, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize configuration to dictionary.
@@ -1040,19 +1056,23 @@ class UnifiedConfig(BaseModel):
 # =============================================================================
 
 
+_ENV_VAR_RE = re.compile(r"\$\{([^}]+)\}")
+
+# libyaml's C loader/dumper are ~10x faster than the pure-Python SafeLoader/
+# SafeDumper; PyYAML builds without libyaml fall back to the latter.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
 def _substitute_env_vars(value: Any) -> Any:
     """Recursively substitute environment variables in configuration values.
 
     Supports ${VAR_NAME} syntax.
     """
     if isinstance(value, str):
-        # Find all ${VAR_NAME} patterns
-        pattern = r"\$\{([^}]+)\}"
-        matches = re.findall(pattern, value)
-        for var_name in matches:
-            env_value = os.getenv(var_name, "")
-            value = value.replace(f"${{{var_name}}}", env_value)
-        return value
+        if "${" not in value:
+            return value
+        return _ENV_VAR_RE.sub(lambda m: os.getenv(m.group(1), ""), value)
     elif isinstance(value, dict):
         return {k: _substitute_env_vars(v) for k, v in value.items()}
     elif isinstance(value, list):
@@ -1071,6 +1091,28 @@ def _merge_dicts(base: Dict, override: Dict) -> Dict:
     return result
 
 
+# Last parse of each YAML file, keyed by path and tagged with the file's
+# (inode, mtime, size). reload_config() and repeated get_effective_config()
+# calls re-read the file only when it has changed on disk. Env var
+# substitution still runs on every load, on a fresh copy of the raw tree.
+_yaml_cache: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+
+
+def _read_yaml(config_path: Path) -> Any:
+    """Parse a YAML file, reusing the cached parse while the file is unchanged."""
+    st = os.stat(config_path)
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+    key = str(config_path)
+    cached = _yaml_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    with open(config_path, "r") as f:
+        raw_config = yaml.load(f, Loader=_YAML_LOADER)
+    _yaml_cache[key] = (stamp, raw_config)
+    return raw_config
+
+
 def load_config(
     config_path: Optional[Path] = None,
     strict: bool = False,
@@ -1092,8 +1134,7 @@ def load_config(
         return UnifiedConfig()
 
     try:
-        with open(config_path, "r") as f:
-            raw_config = yaml.safe_load(f)
+        raw_config = _read_yaml(config_path)
 
         if raw_config is None:
             return UnifiedConfig()
@@ -1145,6 +1186,15 @@ def _find_config_file() -> Optional[Path]:
     return None
 
 
+# Env var spellings that switch a boolean override on; anything else is False.
+_TRUTHY_ENV_VALUES = frozenset({"true", "1", "yes"})
+
+
+def _parse_env_bool(value: str) -> bool:
+    """Interpret a non-empty boolean env var override."""
+    return value.lower() in _TRUTHY_ENV_VALUES
+
+
 def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     """Apply environment variable overrides to configuration.
 
@@ -1175,20 +1225,20 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Triage overrides
     triage_env = os.getenv("LLM_COUNCIL_TRIAGE_ENABLED")
     if triage_env:
-        config_dict.setdefault("triage", {})["enabled"] = triage_env.lower() in ("true", "1", "yes")
+        config_dict.setdefault("triage", {})["enabled"] = _parse_env_bool(triage_env)
 
     # Wildcard override
     wildcard_env = os.getenv("LLM_COUNCIL_WILDCARD_ENABLED")
     if wildcard_env:
         config_dict.setdefault("triage", {}).setdefault("wildcard", {})["enabled"] = (
-            wildcard_env.lower() in ("true", "1", "yes")
+            _parse_env_bool(wildcard_env)
         )
 
     # Prompt optimization override
     prompt_opt_env = os.getenv("LLM_COUNCIL_PROMPT_OPTIMIZATION_ENABLED")
     if prompt_opt_env:
         config_dict.setdefault("triage", {}).setdefault("prompt_optimization", {})["enabled"] = (
-            prompt_opt_env.lower() in ("true", "1", "yes")
+            _parse_env_bool(prompt_opt_env)
         )
 
     # Gateway fallback chain
@@ -1222,11 +1272,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Webhook overrides (ADR-025a)
     webhooks_enabled = os.getenv("LLM_COUNCIL_WEBHOOKS_ENABLED")
     if webhooks_enabled:
-        config_dict.setdefault("webhooks", {})["enabled"] = webhooks_enabled.lower() in (
-            "true",
-            "1",
-            "yes",
-        )
+        config_dict.setdefault("webhooks", {})["enabled"] = _parse_env_bool(webhooks_enabled)
     webhook_timeout = os.getenv("LLM_COUNCIL_WEBHOOK_TIMEOUT")
     if webhook_timeout:
         config_dict.setdefault("webhooks", {})["timeout_seconds"] = float(webhook_timeout)
@@ -1237,15 +1283,15 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # Model Intelligence overrides (ADR-026)
     model_intelligence_enabled = os.getenv("LLM_COUNCIL_MODEL_INTELLIGENCE")
     if model_intelligence_enabled:
-        config_dict.setdefault("model_intelligence", {})["enabled"] = (
-            model_intelligence_enabled.lower() in ("true", "1", "yes")
+        config_dict.setdefault("model_intelligence", {})["enabled"] = _parse_env_bool(
+            model_intelligence_enabled
         )
 
     # Reasoning optimization overrides (ADR-026 Phase 2)
     reasoning_enabled = os.getenv("LLM_COUNCIL_REASONING_ENABLED")
     if reasoning_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("reasoning", {})["enabled"] = (
-            reasoning_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(reasoning_enabled)
         )
 
     # Scoring overrides (ADR-030)
@@ -1260,7 +1306,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     if circuit_breaker_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("circuit_breaker", {})[
             "enabled"
-        ] = circuit_breaker_enabled.lower() in ("true", "1", "yes")
+        ] = _parse_env_bool(circuit_breaker_enabled)
 
     circuit_threshold = os.getenv("LLM_COUNCIL_CIRCUIT_THRESHOLD")
     if circuit_threshold:
@@ -1278,7 +1324,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     discovery_enabled = os.getenv("LLM_COUNCIL_DISCOVERY_ENABLED")
     if discovery_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("discovery", {})["enabled"] = (
-            discovery_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(discovery_enabled)
         )
 
     discovery_interval = os.getenv("LLM_COUNCIL_DISCOVERY_INTERVAL")
@@ -1297,7 +1343,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     metrics_enabled = os.getenv("LLM_COUNCIL_METRICS_ENABLED")
     if metrics_enabled:
         config_dict.setdefault("observability", {}).setdefault("metrics", {})["enabled"] = (
-            metrics_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(metrics_enabled)
         )
 
     metrics_backend = os.getenv("LLM_COUNCIL_METRICS_BACKEND")
@@ -1322,7 +1368,7 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     audition_enabled = os.getenv("LLM_COUNCIL_AUDITION_ENABLED")
     if audition_enabled:
         config_dict.setdefault("model_intelligence", {}).setdefault("audition", {})["enabled"] = (
-            audition_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(audition_enabled)
         )
 
     audition_max_seats = os.getenv("LLM_COUNCIL_AUDITION_MAX_SEATS")
@@ -1347,31 +1393,31 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     rubric_enabled = os.getenv("RUBRIC_SCORING_ENABLED")
     if rubric_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("rubric", {})["enabled"] = (
-            rubric_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(rubric_enabled)
         )
 
     accuracy_ceiling_enabled = os.getenv("ACCURACY_CEILING_ENABLED")
     if accuracy_ceiling_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("rubric", {})[
             "accuracy_ceiling_enabled"
-        ] = accuracy_ceiling_enabled.lower() in ("true", "1", "yes")
+        ] = _parse_env_bool(accuracy_ceiling_enabled)
 
     safety_enabled = os.getenv("SAFETY_GATE_ENABLED")
     if safety_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("safety", {})["enabled"] = (
-            safety_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(safety_enabled)
         )
 
     bias_audit_enabled = os.getenv("BIAS_AUDIT_ENABLED")
     if bias_audit_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("bias", {})["audit_enabled"] = (
-            bias_audit_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(bias_audit_enabled)
         )
 
     bias_persistence_enabled = os.getenv("BIAS_PERSISTENCE_ENABLED")
     if bias_persistence_enabled:
         config_dict.setdefault("evaluation", {}).setdefault("bias", {})["persistence_enabled"] = (
-            bias_persistence_enabled.lower() in ("true", "1", "yes")
+            _parse_env_bool(bias_persistence_enabled)
         )
 
     # ADR-032: Council configuration overrides
@@ -1385,8 +1431,8 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
 
     council_chairman_disabled = os.getenv("LLM_COUNCIL_CHAIRMAN_DISABLED")
     if council_chairman_disabled:
-        config_dict.setdefault("council", {})["chairman_disabled"] = (
-            council_chairman_disabled.lower() in ("true", "1", "yes")
+        config_dict.setdefault("council", {})["chairman_disabled"] = _parse_env_bool(
+            council_chairman_disabled
         )
 
     council_mode = os.getenv("LLM_COUNCIL_MODE")
@@ -1395,8 +1441,8 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
 
     council_exclude_self = os.getenv("LLM_COUNCIL_EXCLUDE_SELF_VOTES")
     if council_exclude_self:
-        config_dict.setdefault("council", {})["exclude_self_votes"] = (
-            council_exclude_self.lower() in ("true", "1", "yes")
+        config_dict.setdefault("council", {})["exclude_self_votes"] = _parse_env_bool(
+            council_exclude_self
         )
 
     council_style_norm = os.getenv("LLM_COUNCIL_STYLE_NORMALIZATION")
@@ -1404,8 +1450,8 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
         if council_style_norm.lower() == "auto":
             config_dict.setdefault("council", {})["style_normalization"] = "auto"
         else:
-            config_dict.setdefault("council", {})["style_normalization"] = (
-                council_style_norm.lower() in ("true", "1", "yes")
+            config_dict.setdefault("council", {})["style_normalization"] = _parse_env_bool(
+                council_style_norm
             )
 
     council_normalizer = os.getenv("LLM_COUNCIL_NORMALIZER_MODEL")
@@ -1416,6 +1462,10 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     if council_max_reviewers:
         config_dict.setdefault("council", {})["max_reviewers"] = int(council_max_reviewers)
 
+    council_reviewer_context = os.getenv("LLM_COUNCIL_REVIEWER_CONTEXT")
+    if council_reviewer_context:
+        config_dict.setdefault("council", {})["reviewer_context"] = council_reviewer_context.lower()
+
     # ADR-032: Timeout configuration overrides
     timeout_multiplier = os.getenv("LLM_COUNCIL_TIMEOUT_MULTIPLIER")
     if timeout_multiplier:
@@ -1424,10 +1474,12 @@ def _apply_env_overrides(config: UnifiedConfig) -> UnifiedConfig:
     # ADR-032: Cache configuration overrides
     cache_enabled = os.getenv("LLM_COUNCIL_CACHE")
     if cache_enabled:
-        config_dict.setdefault("cache", {})["enabled"] = cache_enabled.lower() in (
-            "true",
-            "1",
-            "yes",
+        config_dict.setdefault("cache", {})["enabled"] = _parse_env_bool(cache_enabled)
+
+    verify_cache_enabled = os.getenv("LLM_COUNCIL_VERIFY_CACHE")
+    if verify_cache_enabled:
+        config_dict.setdefault("cache", {})["verify_enabled"] = _parse_env_bool(
+            verify_cache_enabled
         )
 
     cache_ttl = os.getenv("LLM_COUNCIL_CACHE_TTL")
@@ -5,72 +5,80 @@ Provides types, context isolation, transcript persistence, and API
 for structured work verification using LLM Council deliberation.
 """
 
-from llm_council.verification.context import (
-    ContextIsolationError,
-    InvalidSnapshotError,
-    IsolatedVerificationContext,
-    VerificationContextManager,
-    create_isolated_context,
-    validate_snapshot_id,
-)
-from llm_council.verification.transcript import (
-    TranscriptError,
-    TranscriptIntegrityError,
-    TranscriptNotFoundError,
-    TranscriptStore,
-    create_transcript_store,
-    get_transcript_path,
-)
-from llm_council.verification.types import (
-    AgentIdentifier,
-    BlockingIssue,
-    ConsensusResult,
-    IssueSeverity,
-    RubricScores,
-    VerdictType,
-    VerificationContext,
-    VerificationRequest,
-    VerificationResult,
-    VerifierResponse,
-)
+from typing import Any
 
-__all__ = [
+# PEP 562 lazy namespace: public names resolve on first attribute access, so
+# ``import llm_council.verification`` (or a submodule such as ``file_ops``)
+# does not drag in the API module, FastAPI, or the council model clients.
+_LAZY_MAP = {
     # Types (ADR-034 A1)
-    "AgentIdentifier",
-    "BlockingIssue",
-    "ConsensusResult",
-    "IssueSeverity",
-    "RubricScores",
-    "VerdictType",
-    "VerificationContext",
-    "VerificationRequest",
-    "VerificationResult",
-    "VerifierResponse",
+    "AgentIdentifier": ("llm_council.verification.types", "AgentIdentifier"),
+    "BlockingIssue": ("llm_council.verification.types", "BlockingIssue"),
+    "ConsensusResult": ("llm_council.verification.types", "ConsensusResult"),
+    "IssueSeverity": ("llm_council.verification.types", "IssueSeverity"),
+    "RubricScores": ("llm_council.verification.types", "RubricScores"),
+    "VerdictType": ("llm_council.verification.types", "VerdictType"),
+    "VerificationContext": ("llm_council.verification.types", "VerificationContext"),
+    "VerificationRequest": ("llm_council.verification.types", "VerificationRequest"),
+    "VerificationResult": ("llm_council.verification.types", "VerificationResult"),
+    "VerifierResponse": ("llm_council.verification.types", "VerifierResponse"),
     # Context isolation (ADR-034 A2)
-    "create_isolated_context",
-    "validate_snapshot_id",
-    "IsolatedVerificationContext",
-    "VerificationContextManager",
-    "InvalidSnapshotError",
-    "ContextIsolationError",
+    "create_isolated_context": ("llm_council.verification.context", "create_isolated_context"),
+    "validate_snapshot_id": ("llm_council.verification.context", "validate_snapshot_id"),
+    "IsolatedVerificationContext": (
+        "llm_council.verification.context",
+        "IsolatedVerificationContext",
+    ),
+    "VerificationContextManager": (
+        "llm_council.verification.context",
+        "VerificationContextManager",
+    ),
+    "InvalidSnapshotError": ("llm_council.verification.context", "InvalidSnapshotError"),
+    "ContextIsolationError": ("llm_council.verification.context", "ContextIsolationError"),
     # Transcript persistence (ADR-034 A3)
-    "create_transcript_store",
-    "get_transcript_path",
-    "TranscriptStore",
-    "TranscriptError",
-    "TranscriptNotFoundError",
-    "TranscriptIntegrityError",
-]
+    "create_transcript_store": (
+        "llm_council.verification.transcript",
+        "create_transcript_store",
+    ),
+    "get_transcript_path": ("llm_council.verification.transcript", "get_transcript_path"),
+    "TranscriptStore": ("llm_council.verification.transcript", "TranscriptStore"),
+    "TranscriptError": ("llm_council.verification.transcript", "TranscriptError"),
+    "TranscriptNotFoundError": (
+        "llm_council.verification.transcript",
+        "TranscriptNotFoundError",
+    ),
+    "TranscriptIntegrityError": (
+        "llm_council.verification.transcript",
+        "TranscriptIntegrityError",
+    ),
+    # API exports (ADR-034 A4)
+    "verification_router": ("llm_council.verification.api", "router"),
+    "run_verification": ("llm_council.verification.api", "run_verification"),
+}
 
-# API exports (ADR-034 A4) - requires fastapi optional dependency
-# Import conditionally to avoid breaking when fastapi is not installed
-try:
-    from llm_council.verification.api import router as verification_router
-    from llm_council.verification.api import run_verification
+__all__ = list(_LAZY_MAP)
 
-    __all__.extend(["verification_router", "run_verification"])
-except ImportError:
-    # FastAPI not installed - API not available
-    # Users should install with: pip install llm-council-core[http]
-    verification_router = None  # type: ignore
-    run_verification = None  # type: ignore
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its defining submodule on first access."""
+    try:
+        module_name, attr = _LAZY_MAP[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    import importlib
+
+    try:
+        value = getattr(importlib.import_module(module_name), attr)
+    except ImportError:
+        if name != "verification_router":
+            raise
+        # FastAPI not installed - API router not available
+        # Users should install with: pip install llm-council-core[http]
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
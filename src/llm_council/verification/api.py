@@ -13,27 +13,32 @@ Exit codes:
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import logging
 import re
+import secrets
 import time
-import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+)
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field, field_validator
+from pydantic import ValidationError
 
-from llm_council.council import (
-    calculate_aggregate_rankings,
-    stage1_collect_responses,
-    stage1_collect_responses_with_status,
-    stage2_collect_rankings,
-    stage3_synthesize_final,
-)
+import llm_council.cache as response_cache
 from llm_council.tier_contract import create_tier_contract, get_tier_timeout
 from llm_council.verdict import VerdictType as CouncilVerdictType
 from llm_council.verification.context import (
@@ -44,6 +49,7 @@ from llm_council.verification.context import (
 from llm_council.verification.transcript import (
     TranscriptStore,
     create_transcript_store,
+    get_transcript_path,
 )
 from llm_council.cache_context import (
     CacheContext,
@@ -71,8 +77,79 @@ from llm_council.verification.verdict_extractor import (
 from llm_council.performance.integration import persist_session_performance_data
 from llm_council.verdict import parse_evidence_dispositions
 
-# Router for verification endpoints
-router = APIRouter(tags=["verification"])
+# FastAPI (optional [http] extra), the council stage functions (which pull
+# in every gateway client) and the HTTP response models (.responses) are
+# resolved lazily via the module ``__getattr__`` below, so importing this module
+# for ``run_verification`` / the request schemas — the MCP and CLI paths — does
+# not pay for them up front. ``router`` is built
+# on first access; the stage functions are bound into module globals on first
+# use, so ``unittest.mock.patch("llm_council.verification.api.stage1_...")``
+# keeps working unchanged. The TYPE_CHECKING imports give the type checker
+# the names those lazy bindings provide at runtime.
+if TYPE_CHECKING:
+    from fastapi import Response
+
+    from llm_council.council import (
+        calculate_aggregate_rankings,
+        stage1_collect_responses,
+        stage1_collect_responses_with_status,
+        stage2_collect_rankings,
+        stage3_synthesize_final,
+    )
+
+_COUNCIL_EXPORTS = (
+    "calculate_aggregate_rankings",
+    "stage1_collect_responses",
+    "stage1_collect_responses_with_status",
+    "stage2_collect_rankings",
+    "stage3_synthesize_final",
+)
+_RESPONSE_EXPORTS = ("BlockingIssueResponse", "RubricScoresResponse", "VerifyResponse")
+
+
+def _load_council() -> None:
+    """Bind the council stage functions into module globals (idempotent).
+
+    ``setdefault`` so a name already rebound by a caller (a test patch) wins.
+    """
+    from llm_council import council
+
+    namespace = globals()
+    for name in _COUNCIL_EXPORTS:
+        namespace.setdefault(name, getattr(council, name))
+
+
+def _build_router() -> Any:
+    """Create the verification ``APIRouter`` (requires the [http] extra)."""
+    from fastapi import APIRouter, Response
+
+    from .responses import VerifyResponse
+
+    # verify_endpoint's ``-> Response`` names a TYPE_CHECKING-only import;
+    # bind it so the annotation resolves once FastAPI is loaded.
+    globals().setdefault("Response", Response)
+    verification_router = APIRouter(tags=["verification"])
+    verification_router.post("/verify", response_model=VerifyResponse)(verify_endpoint)
+    return verification_router
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562: resolve ``router``, the council stages and response models on demand."""
+    if name == "router":
+        value = _build_router()
+        globals()["router"] = value
+        return value
+    if name in _COUNCIL_EXPORTS:
+        _load_council()
+        return globals()[name]
+    if name in _RESPONSE_EXPORTS:
+        # HTTP-only response models (see .responses), re-exported for compat.
+        from . import responses
+
+        value = getattr(responses, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # (#380: GIT_SHA_PATTERN / SOURCE_PATTERN / EVIDENCE_ID_PATTERN moved to
@@ -103,14 +180,11 @@ from .schemas import (  # noqa: F401
     GIT_SHA_PATTERN,
     SOURCE_PATTERN,
     BlockingEvidenceTooLarge,
-    BlockingIssueResponse,
     EvidenceDisposition,
     EvidenceItem,
     EvidenceWarning,
-    RubricScoresResponse,
     SnapshotResolutionError,
     VerifyRequest,
-    VerifyResponse,
     _verdict_to_exit_code,
 )
 from .evidence_render import (  # noqa: F401
@@ -137,21 +211,84 @@ from .file_ops import (  # noqa: F401
     _validate_file_path,
 )
 
-def _persist_result_safe(store: Any, verification_id: str, result: Dict[str, Any]) -> None:
+async def _persist_result_safe(store: Any, verification_id: str, result: Dict[str, Any]) -> None:
     """Best-effort persist of a final ``result.json`` for early-return paths.
 
     The happy path writes the result via ``store.write_stage(..., "result", ...)``;
     the input-cap and timeout early returns previously skipped it, so those
     outcomes vanished from ``.council/logs`` and could not be audited (#356).
     Persistence must never turn a degraded result into a hard failure, so any
-    store error is swallowed.
+    store error is swallowed. The write runs on a worker thread.
     """
     try:
-        store.write_stage(verification_id, "result", result)
+        await asyncio.to_thread(store.write_stage, verification_id, "result", result)
     except Exception:
         logger.debug("Failed to persist partial/timeout result.json", exc_info=True)
 
 
+def _verification_cache_key(
+    request: VerifyRequest, verification_query: str, tier_contract: Any
+) -> str:
+    """Key a verification result on everything that shapes its verdict.
+
+    The rendered prompt already pins the snapshot's file contents, file
+    selection, evidence and rubric focus; the request fields add the tier and
+    threshold, and the tier contract the models that deliberate.
+    """
+    return response_cache.get_verification_cache_key(
+        {
+            "query": verification_query,
+            "request": request.model_dump(mode="json"),
+            "models": sorted(tier_contract.allowed_models),
+            "aggregator": tier_contract.aggregator_model,
+            "calibrated_confidence": calibrated_confidence_enabled(),
+        }
+    )
+
+
+def _load_cached_verification(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Read a cached verdict, treating an entry that fails validation as a miss.
+
+    Entries come back from disk, so one written by an older schema or a
+    damaged file must not reach construct_trusted() in verify_endpoint.
+    """
+    cached = response_cache.get_cached_verification(cache_key)
+    if not cached:
+        return None
+    from .responses import VerifyResponse
+
+    try:
+        VerifyResponse.model_validate(cached)
+    except ValidationError:
+        logger.warning("Ignoring invalid cached verification %s", cache_key)
+        return None
+    return cached
+
+
+def _is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """Only a complete, deliberated verdict is reused; degraded ones are retried."""
+    return (
+        not result.get("partial")
+        and not result.get("error")
+        and result.get("unclear_reason") != "infra_failure"
+    )
+
+
+def _start_stage_write(
+    store: Any, verification_id: str, stage: str, data: Dict[str, Any]
+) -> "asyncio.Future[Any]":
+    """Persist a transcript stage on a worker thread, returning its future.
+
+    The request/stage1/stage2 writes are started just before the next step
+    (prompt building or a council stage) and joined in that step's
+    ``finally``, so transcript disk I/O is hidden behind git and model
+    latency instead of delaying the next call. Joining there
+    (rather than fire-and-forget) keeps write errors surfacing exactly as
+    before and guarantees the file exists once the pipeline moves on.
+    """
+    return asyncio.ensure_future(asyncio.to_thread(store.write_stage, verification_id, stage, data))
+
+
 def _emit_posthog_generations(
     usage: Optional[Dict[str, Any]],
     *,
@@ -184,6 +321,39 @@ def _emit_posthog_generations(
 
 # Maximum characters per file to include in prompt.
 
+@functools.lru_cache(maxsize=32)
+def _render_static_head(rubric_focus: Optional[str], has_evidence: bool) -> str:
+    """Render the ADR-049 static head for one (focus, evidence?) combination.
+
+    The head depends on nothing else, and real traffic uses a handful of
+    focus areas, so it is built once per combination instead of per request.
+    Byte-identical to the inline f-string it replaces (ADR-042 golden hash).
+    """
+    focus_section = ""
+    if rubric_focus:
+        focus_section = f"\n\n**Focus Area**: {rubric_focus}\nPay particular attention to {rubric_focus.lower()}-related concerns."
+    evidence_instructions = _build_evidence_instructions(has_evidence)
+
+    return f"""You are reviewing code for quality verification.{focus_section}
+
+## Instructions
+
+Please provide a thorough review with the following structure:
+
+1. **Summary**: Brief overview of what the code does
+2. **Quality Assessment**: Evaluate code quality, readability, and maintainability
+3. **Potential Issues**: Identify any bugs, security vulnerabilities, or performance concerns
+4. **Recommendations**: Suggest improvements if any
+{evidence_instructions}
+At the end of your review, provide a clear verdict:
+- **APPROVED** if the code is ready for production
+- **REJECTED** if there are critical issues that must be fixed
+- **NEEDS REVIEW** if you're uncertain and recommend human review
+
+Be specific and cite file paths and line numbers when identifying issues.
+"""
+
+
 async def _build_verification_prompt(
     snapshot_id: str,
     target_paths: Optional[List[str]] = None,
@@ -220,10 +390,6 @@ async def _build_verification_prompt(
     chars_rendered = len(evidence_section)
     chars_submitted = sum(len(item.content) for item in (evidence or []))
 
-    focus_section = ""
-    if rubric_focus:
-        focus_section = f"\n\n**Focus Area**: {rubric_focus}\nPay particular attention to {rubric_focus.lower()}-related concerns."
-
     # Fetch actual file contents (async to avoid blocking event loop).
     # Issue #340: use the metadata-aware variant so we can surface
     # expansion warnings on the response — and hard-fail when caller-
@@ -240,32 +406,13 @@ async def _build_verification_prompt(
             expansion_warnings=list(expansion_metadata.get("expansion_warnings", [])),
         )
 
-    evidence_instructions = _build_evidence_instructions(bool(kept_evidence))
-
     # ADR-049 D1: stable-prefix-first assembly. Segments render in stability
     # order — static head (round- AND subject-invariant), evidence, subject,
     # volatile tail — so provider prompt caches can reuse the unchanged
     # prefix across verification rounds. The snapshot SHA is the canonical
     # cache-buster and lives ONLY in the tail; nothing above the tail may
     # contain timestamps, UUIDs, or per-round values.
-    static_head = f"""You are reviewing code for quality verification.{focus_section}
-
-## Instructions
-
-Please provide a thorough review with the following structure:
-
-1. **Summary**: Brief overview of what the code does
-2. **Quality Assessment**: Evaluate code quality, readability, and maintainability
-3. **Potential Issues**: Identify any bugs, security vulnerabilities, or performance concerns
-4. **Recommendations**: Suggest improvements if any
-{evidence_instructions}
-At the end of your review, provide a clear verdict:
-- **APPROVED** if the code is ready for production
-- **REJECTED** if there are critical issues that must be fixed
-- **NEEDS REVIEW** if you're uncertain and recommend human review
-
-Be specific and cite file paths and line numbers when identifying issues.
-"""
+    static_head = _render_static_head(rubric_focus, bool(kept_evidence))
     subject = f"""
 ## Code to Review
 
@@ -276,7 +423,7 @@ Be specific and cite file paths and line numbers when identifying issues.
 
 Commit under review: `{snapshot_id}`"""
 
-    prompt = static_head + evidence_section + subject + volatile_tail
+    prompt = "".join((static_head, evidence_section, subject, volatile_tail))
 
     # Contiguous char-offset segment map (est_tokens = chars // 4), exposed
     # for ADR-049 D2 breakpoint placement and the byte-stability tests.
@@ -397,6 +544,7 @@ async def _run_verification_pipeline(
     Returns:
         Verification result dictionary
     """
+    _load_council()
     num_models = len(tier_contract.allowed_models)
 
     # ADR-041: Initialize timing capture
@@ -453,14 +601,15 @@ async def _run_verification_pipeline(
     # ADR-041: Preserve model_statuses for performance tracker
     partial_state["model_statuses"] = model_statuses
 
-    # Persist Stage 1
-    store.write_stage(
+    # Persist Stage 1 (overlaps Stage 2; joined below)
+    stage1_write = _start_stage_write(
+        store,
         verification_id,
         "stage1",
         {
             "responses": stage1_results,
             "usage": stage1_usage,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         },
     )
 
@@ -502,6 +651,7 @@ async def _run_verification_pipeline(
         partial_state["stage_timings"]["stage2_elapsed_ms"] = int(
             (time.monotonic() - stage2_start) * 1000
         )
+        await stage1_write
     current_step = num_models + num_models
 
     # ADR-040: Persist stage2 results to partial_state
@@ -509,15 +659,16 @@ async def _run_verification_pipeline(
     partial_state["stage2_results"] = stage2_results
     partial_state["label_to_model"] = label_to_model
 
-    # Persist Stage 2
-    store.write_stage(
+    # Persist Stage 2 (overlaps Stage 3; joined below)
+    stage2_write = _start_stage_write(
+        store,
         verification_id,
         "stage2",
         {
             "rankings": stage2_results,
             "label_to_model": label_to_model,
             "usage": stage2_usage,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         },
     )
 
@@ -552,19 +703,21 @@ async def _run_verification_pipeline(
         partial_state["stage_timings"]["stage3_elapsed_ms"] = int(
             (time.monotonic() - stage3_start) * 1000
         )
+        await stage2_write
 
     # ADR-040: Persist stage3 results to partial_state
     partial_state["completed_stages"].append("stage3")
 
     # Persist Stage 3
-    store.write_stage(
+    await asyncio.to_thread(
+        store.write_stage,
         verification_id,
         "stage3",
         {
             "synthesis": stage3_result,
             "aggregate_rankings": aggregate_rankings,
             "usage": stage3_usage,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         },
     )
 
@@ -653,7 +806,8 @@ async def _run_verification_pipeline(
                 }
             )
 
-        store.write_stage(
+        await asyncio.to_thread(
+            store.write_stage,
             verification_id,
             "evidence",
             {
@@ -805,7 +959,7 @@ async def _run_verification_pipeline(
     }
 
     # Persist result
-    store.write_stage(verification_id, "result", result)
+    await asyncio.to_thread(store.write_stage, verification_id, "result", result)
 
     # ADR-050 D2 (#474): opt-in PostHog $ai_generation emission — one event per
     # council-member model, keyed to this verification_id. No-op + soft-fail
@@ -856,18 +1010,23 @@ async def run_verification(
     # pathspec-style `git ... -- <paths>` calls.
     validate_snapshot_id(request.snapshot_id)
 
-    verification_id = str(uuid.uuid4())[:8]
+    # 8 hex chars, same shape as the old str(uuid4())[:8] without the 36-char detour.
+    verification_id = secrets.token_hex(4)
 
     # Create isolated context for this verification
     with VerificationContextManager(
         snapshot_id=request.snapshot_id,
         rubric_focus=request.rubric_focus,
     ) as ctx:
-        # Create transcript directory
-        transcript_dir = store.create_verification_directory(verification_id)
+        # Create transcript directory (all transcript disk I/O below runs on
+        # worker threads so concurrent verifications don't stall the loop).
+        transcript_dir = await asyncio.to_thread(
+            store.create_verification_directory, verification_id
+        )
 
-        # Persist request
-        store.write_stage(
+        # Persist request, overlapped with prompt building (joined below).
+        request_write = _start_stage_write(
+            store,
             verification_id,
             "request",
             {
@@ -876,7 +1035,10 @@ async def run_verification(
                 "rubric_focus": request.rubric_focus,
                 "confidence_threshold": request.confidence_threshold,
                 "context_id": ctx.context_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                # The context was created a moment ago for this request; reuse
+                # its clock read so request.json and the context agree. (The
+                # store renders datetimes as ISO 8601 on its worker thread.)
+                "timestamp": ctx.created_at,
                 # ADR-042: surface evidence presence for fast transcript scanning.
                 "evidence_present": bool(request.evidence),
             },
@@ -884,13 +1046,16 @@ async def run_verification(
 
         # Build verification prompt for council (async to avoid blocking).
         # ADR-042: builder now returns (prompt, evidence_render_info).
-        verification_query, evidence_render_info = await _build_verification_prompt(
-            snapshot_id=request.snapshot_id,
-            target_paths=request.target_paths,
-            rubric_focus=request.rubric_focus,
-            evidence=request.evidence,
-            tier=request.tier,
-        )
+        try:
+            verification_query, evidence_render_info = await _build_verification_prompt(
+                snapshot_id=request.snapshot_id,
+                target_paths=request.target_paths,
+                rubric_focus=request.rubric_focus,
+                evidence=request.evidence,
+                tier=request.tier,
+            )
+        finally:
+            await request_write
 
         # Get tier-appropriate models and timeouts (Issue #325)
         tier_contract = create_tier_contract(request.tier)
@@ -922,9 +1087,32 @@ async def run_verification(
                 "completed_stages": [],
             }
             # #356: persist so input-cap rejections are auditable in the logs.
-            _persist_result_safe(store, verification_id, cap_result)
+            await _persist_result_safe(store, verification_id, cap_result)
             return cap_result
 
+        # Opt-in result cache (LLM_COUNCIL_VERIFY_CACHE): the same prompt at
+        # the same snapshot with the same tier models reuses the earlier
+        # deliberation. The hit still gets its own verification_id and
+        # result.json, with cached_from naming the verification whose
+        # transcript holds the council stages. timing and input_metrics
+        # described that earlier run (its latency, tokens and cost), so the
+        # hit does not repeat them.
+        cache_key: Optional[str] = None
+        if response_cache.VERIFY_CACHE_ENABLED:
+            cache_key = _verification_cache_key(request, verification_query, tier_contract)
+            cached = await asyncio.to_thread(_load_cached_verification, cache_key)
+            if cached:
+                cached_result = {
+                    **cached,
+                    "verification_id": verification_id,
+                    "transcript_location": str(transcript_dir),
+                    "cached_from": cached["verification_id"],
+                    "timing": None,
+                    "input_metrics": None,
+                }
+                await _persist_result_safe(store, verification_id, cached_result)
+                return cached_result
+
         # ADR-049 D2 (#460): publish the D1 segment map + session affinity key
         # to the request-scoped cache context. The session key is the STABLE
         # sequence id (hash of the target paths) — never the per-round SHA,
@@ -989,7 +1177,7 @@ async def run_verification(
                         "acted": True,
                     },
                 }
-                _persist_result_safe(store, verification_id, screen_result)
+                await _persist_result_safe(store, verification_id, screen_result)
                 clear_cache_context()
                 return screen_result
             log_decision(decision)
@@ -1064,6 +1252,11 @@ async def run_verification(
             except Exception:
                 logger.debug("ADR-041: Performance telemetry persistence failed", exc_info=True)
 
+            if cache_key is not None and _is_cacheable_result(result):
+                await asyncio.to_thread(
+                    response_cache.save_verification_to_cache, cache_key, result
+                )
+
             # ADR-047 P3: shadow/ineligible screening audit rides on the result.
             if screening_info is not None:
                 result["screening"] = screening_info
@@ -1172,7 +1365,7 @@ async def run_verification(
             }
             # #356: persist the partial/timeout result so timeouts (the dominant
             # real-world failure mode) are not lost from the transcript logs.
-            _persist_result_safe(store, verification_id, timeout_result)
+            await _persist_result_safe(store, verification_id, timeout_result)
             return timeout_result
         finally:
             # ADR-049 D2: request-scoped cache context must not leak into a
@@ -1180,8 +1373,26 @@ async def run_verification(
             clear_cache_context()
 
 
-@router.post("/verify", response_model=VerifyResponse)
-async def verify_endpoint(request: VerifyRequest) -> VerifyResponse:
+# run_verification builds its result dict itself, so by default the endpoint
+# constructs the response without re-validating every field. Set False to
+# validate (a malformed result then surfaces as a 500) while developing.
+TRUST_INTERNAL_RESULTS = True
+
+
+@functools.lru_cache(maxsize=8)
+def _endpoint_transcript_store(base_path: Path) -> TranscriptStore:
+    """Shared per-path store for the HTTP endpoint.
+
+    Keyed on the resolved transcript path, so a changed
+    ``LLM_COUNCIL_TRANSCRIPT_PATH`` or CWD still gets its own store, while
+    repeat requests skip the construction-time ``mkdir``. The store's
+    id→directory map is bounded, so a long-running server's store does not
+    grow with every verification.
+    """
+    return create_transcript_store(base_path=base_path)
+
+
+async def verify_endpoint(request: VerifyRequest) -> Response:
     """
     Verify code, documents, or implementation using LLM Council.
 
@@ -1200,22 +1411,33 @@ async def verify_endpoint(request: VerifyRequest) -> VerifyResponse:
         request: VerificationRequest with snapshot_id and optional parameters
 
     Returns:
-        VerificationResult with verdict, confidence, and transcript location
+        JSON ``VerifyResponse`` with verdict, confidence, and transcript location.
+        Serialized here by pydantic-core and returned as a ready ``Response``,
+        so FastAPI skips its second ``response_model`` validation pass and
+        ``jsonable_encoder`` walk; ``response_model`` still drives OpenAPI.
     """
-    try:
-        # Validate snapshot ID
-        validate_snapshot_id(request.snapshot_id)
-    except InvalidSnapshotError as e:
-        raise HTTPException(status_code=422, detail=str(e))
+    from fastapi import HTTPException, Response
+
+    from .responses import VerifyResponse, construct_trusted
 
+    # snapshot_id was already checked by VerifyRequest's field validator, and
+    # run_verification re-validates it (#549), so no separate pass here.
     try:
-        # Create transcript store
-        store = create_transcript_store()
+        store = _endpoint_transcript_store(get_transcript_path())
 
         # Run verification
         result = await run_verification(request, store)
 
-        return VerifyResponse(**result)
+        if TRUST_INTERNAL_RESULTS:
+            response = construct_trusted(VerifyResponse, result)
+        else:
+            response = VerifyResponse(**result)
+        return Response(content=response.model_dump_json(), media_type="application/json")
+
+    except InvalidSnapshotError as e:
+        # Only reachable for a request that bypassed model validation
+        # (VerifyRequest.model_construct); run_verification rejects it.
+        raise HTTPException(status_code=422, detail=str(e))
 
     except BlockingEvidenceTooLarge as e:
         # ADR-042: oversized blocking evidence is the exact failure mode
@@ -63,7 +63,7 @@ def load_corpus(logs_dir: Optional[Path] = None) -> List[CalibrationRecord]:
     records: List[CalibrationRecord] = []
     for result_file in sorted(directory.glob("*/result.json")):
         try:
-            data = json.loads(result_file.read_text())
+            data = json.loads(result_file.read_text(encoding="utf-8"))
             records.append(
                 CalibrationRecord(
                     verification_id=data.get("verification_id", result_file.parent.name),
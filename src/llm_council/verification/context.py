@@ -37,8 +37,26 @@ class ContextIsolationError(RuntimeError):
 
 
 # Git SHA validation pattern
-# Valid: 7-40 hexadecimal characters
-GIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{7,40}$", re.IGNORECASE)
+# Valid: 7-40 hexadecimal characters. Kept for callers that want a regex;
+# the validators below use is_hex_sha(). \Z, not $, so a trailing newline
+# is rejected (`$` matches just before one).
+GIT_SHA_PATTERN = re.compile(r"\A[0-9a-f]{7,40}\Z", re.IGNORECASE)
+
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+
+def is_hex_sha(value: str) -> bool:
+    """Return True if ``value`` is 7-40 hexadecimal characters.
+
+    Equivalent to ``GIT_SHA_PATTERN.match`` without entering the regex
+    engine: deleting every hex digit with ``bytes.translate`` (a single C
+    pass over at most 40 bytes) must leave nothing behind.
+    """
+    return (
+        7 <= len(value) <= 40
+        and value.isascii()
+        and not value.encode("ascii").translate(None, _HEX_DIGITS)
+    )
 
 
 def validate_snapshot_id(snapshot_id: Optional[str]) -> bool:
@@ -66,7 +84,7 @@ def validate_snapshot_id(snapshot_id: Optional[str]) -> bool:
     if len(snapshot_id) > 40:
         raise InvalidSnapshotError(f"Snapshot ID too long: {len(snapshot_id)} chars (maximum 40)")
 
-    if not GIT_SHA_PATTERN.match(snapshot_id):
+    if not is_hex_sha(snapshot_id):
         raise InvalidSnapshotError(
             f"Invalid snapshot ID format: must be hexadecimal (got '{snapshot_id}')"
         )
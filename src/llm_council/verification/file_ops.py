@@ -4,11 +4,14 @@ Verbatim move — no logic changes. Back-compat re-exports live in api.py.
 """
 
 import asyncio
+import io
 import logging
 import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from .constants import (
     ASYNC_SUBPROCESS_TIMEOUT,
@@ -21,55 +24,58 @@ from .constants import (
     TEXT_EXTENSIONS,
     TIER_MAX_CHARS,
 )
+from .context import is_hex_sha
 from .schemas import SnapshotResolutionError
 
 logger = logging.getLogger(__name__)
 
 MAX_CONCURRENT_GIT_OPS = 10
 
-# Cached git root to avoid repeated subprocess calls
+# Cached git root to avoid repeated lookups
 _cached_git_root: Optional[str] = None
-_git_root_lock = asyncio.Lock()
 
 
-async def _get_git_root_async() -> Optional[str]:
+def _find_git_root(start: Optional[str] = None) -> Optional[str]:
+    """Walk up from ``start`` (default: CWD) to the nearest ``.git`` entry.
+
+    Same answer as ``git rev-parse --show-toplevel`` for ordinary checkouts,
+    linked worktrees and submodules (where ``.git`` is a file, hence
+    ``exists()`` rather than ``is_dir()``), at the cost of a few ``stat``
+    calls instead of a fork/exec.
     """
-    Get the git repository root directory (async, cached).
+    here = Path(start or os.getcwd()).resolve()
+    for candidate in (here, *here.parents):
+        if (candidate / ".git").exists():
+            return str(candidate)
+    return None
 
-    Uses async subprocess to avoid blocking the event loop.
-    Result is cached to avoid repeated calls.
+
+def _get_git_root() -> Optional[str]:
+    """
+    Get the git repository root directory (cached).
+
+    A plain module global rather than ``functools.cache``: a miss is not
+    cached, so a later call from inside a repo still works, and tests point
+    the pipeline at a fixture repo by setting ``_cached_git_root`` directly.
 
     Returns:
         Git repository root path or None if not in a git repo.
     """
     global _cached_git_root
 
-    # Return cached value if available
-    if _cached_git_root is not None:
-        return _cached_git_root
+    if _cached_git_root is None:
+        _cached_git_root = _find_git_root()
+    return _cached_git_root
 
-    # Use lock to prevent multiple concurrent lookups
-    async with _git_root_lock:
-        # Double-check after acquiring lock
-        if _cached_git_root is not None:
-            return _cached_git_root
 
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                "git",
-                "rev-parse",
-                "--show-toplevel",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=5)
-            if proc.returncode == 0:
-                _cached_git_root = stdout.decode("utf-8").strip()
-                return _cached_git_root
-        except Exception:
-            pass
+async def _get_git_root_async() -> Optional[str]:
+    """Awaitable alias of ``_get_git_root`` for the async fetch pipeline.
 
-    return None
+    The lookup has no ``await`` inside, so unlike the old ``rev-parse``
+    subprocess it needs no lock. The name is kept as the pipeline's single
+    patch point for mocking the repo root.
+    """
+    return _get_git_root()
 
 
 def _validate_file_path(file_path: str) -> bool:
@@ -83,7 +89,7 @@ def _validate_file_path(file_path: str) -> bool:
         True if path is safe, False otherwise.
     """
     # Reject absolute paths
-    if file_path.startswith("/") or file_path.startswith("\\"):
+    if file_path.startswith(("/", "\\")):
         return False
 
     # Reject path traversal attempts. #584: a substring check (`".." in
@@ -93,7 +99,12 @@ def _validate_file_path(file_path: str) -> bool:
     # correct, not more permissive: it still catches ".." anywhere in the
     # path (leading, trailing, or nested), just not as a false positive on
     # an unrelated filename.
-    if any(part == ".." for part in Path(file_path).parts):
+    #
+    # Components come from a plain str split (no Path object per call; this
+    # runs once per candidate file). Splitting on both separators is no more
+    # permissive than Path.parts on any platform: a "..\\" segment is refused
+    # on POSIX too.
+    if ".." in file_path.replace("\\", "/").split("/"):
         return False
 
     # Reject null bytes (path injection)
@@ -103,8 +114,7 @@ def _validate_file_path(file_path: str) -> bool:
     return True
 
 
-# Thread-safe semaphore creation for async contexts
-_semaphore_lock = asyncio.Lock()
+# Created on first use rather than at import so it binds to the running loop.
 _git_semaphore: Optional[asyncio.Semaphore] = None
 
 
@@ -112,17 +122,15 @@ async def _get_git_semaphore() -> asyncio.Semaphore:
     """
     Get or create the git semaphore for limiting concurrency.
 
-    Thread-safe initialization using async lock.
+    No lock needed: the check and the construction run without an ``await``
+    between them, so on the single event-loop thread no other coroutine can
+    interleave and build a second semaphore.
     """
     global _git_semaphore
 
-    if _git_semaphore is not None:
-        return _git_semaphore
-
-    async with _semaphore_lock:
-        if _git_semaphore is None:
-            _git_semaphore = asyncio.Semaphore(MAX_CONCURRENT_GIT_OPS)
-        return _git_semaphore
+    if _git_semaphore is None:
+        _git_semaphore = asyncio.Semaphore(MAX_CONCURRENT_GIT_OPS)
+    return _git_semaphore
 
 
 # =============================================================================
@@ -160,9 +168,7 @@ async def _get_git_object_type(snapshot_id: str, path: str) -> Optional[str]:
                 stderr=asyncio.subprocess.PIPE,
                 cwd=git_root,
             )
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-            )
+            stdout, stderr = await _communicate_or_kill(proc)
             if proc.returncode == 0:
                 return stdout.decode("utf-8").strip()
             # Issue #340: surface stderr instead of swallowing it silently.
@@ -217,9 +223,7 @@ async def _git_ls_tree_z_name_only(snapshot_id: str, tree_path: str) -> List[str
                 stderr=asyncio.subprocess.PIPE,
                 cwd=git_root,
             )
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-            )
+            stdout, stderr = await _communicate_or_kill(proc)
 
             if proc.returncode != 0:
                 # Issue #340: surface git stderr at WARN.
@@ -280,11 +284,13 @@ class SelectedBlob:
     """A path that has passed selection. Only ``select_blobs`` mints these.
 
     The batch fetcher accepts nothing else, so "a path nobody filtered" cannot be
-    fetched by forgetting a call. (The low-level ``_fetch_file_at_commit_async``
-    still takes a ``str``: it is the raw ``git show <sha>:<path>`` primitive and
-    has no notion of policy. The enforced invariant — pinned by an AST test — is
-    that it has exactly one caller, inside the batch fetcher, which only ever
-    iterates ``SelectedBlob``.)
+    fetched by forgetting a call. (The low-level ``_fetch_files_batched_async``
+    and ``_fetch_file_at_commit_async`` still take ``str``: they are the raw
+    ``git cat-file --batch`` / ``git show <sha>:<path>`` primitives and have no
+    notion of policy. The enforced invariant — pinned by an AST test — is that
+    the batched primitive has exactly one caller, the batch fetcher, which only
+    ever iterates ``SelectedBlob``; the per-file primitive is reachable only
+    through the batched one, via its cache-miss reader.)
     """
 
     path: str
@@ -417,6 +423,22 @@ def file_selection_mode() -> str:
     return val if val in ("allowlist", "content", "shadow") else "allowlist"
 
 
+async def _map_argv_chunks(chunk_fn: Any, snapshot_id: str, paths: List[str]) -> List[Any]:
+    """Run ``chunk_fn`` over ``GIT_ARGV_BATCH_SIZE`` slices of ``paths`` concurrently.
+
+    Each chunk function takes the git semaphore itself, so this fans out all
+    slices at once and lets the semaphore do the throttling, rather than
+    waiting for each git call before starting the next. Results come back
+    in slice order.
+    """
+    return await asyncio.gather(
+        *(
+            chunk_fn(snapshot_id, paths[i : i + GIT_ARGV_BATCH_SIZE])
+            for i in range(0, len(paths), GIT_ARGV_BATCH_SIZE)
+        )
+    )
+
+
 async def _blob_sizes(snapshot_id: str, paths: List[str]) -> Dict[str, int]:
     """Byte size per path in the snapshot, via `git ls-tree` (#552).
 
@@ -431,8 +453,8 @@ async def _blob_sizes(snapshot_id: str, paths: List[str]) -> Dict[str, int]:
     if not paths:
         return {}
     sizes: Dict[str, int] = {}
-    for i in range(0, len(paths), GIT_ARGV_BATCH_SIZE):
-        sizes.update(await _blob_sizes_chunk(snapshot_id, paths[i : i + GIT_ARGV_BATCH_SIZE]))
+    for chunk in await _map_argv_chunks(_blob_sizes_chunk, snapshot_id, paths):
+        sizes.update(chunk)
     return sizes
 
 
@@ -453,9 +475,7 @@ async def _blob_sizes_chunk(snapshot_id: str, paths: List[str]) -> Dict[str, int
                     *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
                     cwd=git_root,
                 )
-                stdout, _ = await asyncio.wait_for(
-                    proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-                )
+                stdout, _ = await _communicate_or_kill(proc)
             except Exception as e:
                 logger.warning("git ls-tree (sizes) raised: %s", e)
                 return {}
@@ -496,8 +516,8 @@ async def _text_paths(snapshot_id: str, paths: List[str]) -> set:
     if not paths:
         return set()
     result: set = set()
-    for i in range(0, len(paths), GIT_ARGV_BATCH_SIZE):
-        result |= await _text_paths_chunk(snapshot_id, paths[i : i + GIT_ARGV_BATCH_SIZE])
+    for chunk in await _map_argv_chunks(_text_paths_chunk, snapshot_id, paths):
+        result |= chunk
     return result
 
 
@@ -512,9 +532,7 @@ async def _text_paths_chunk(snapshot_id: str, paths: List[str]) -> set:
                 "-e", "", snapshot_id, "--", *paths,
                 stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=git_root,
             )
-            stdout, _ = await asyncio.wait_for(
-                proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-            )
+            stdout, _ = await _communicate_or_kill(proc)
         except Exception as e:
             logger.warning("git grep (text sniff) raised: %s", e)
             return set()
@@ -579,9 +597,7 @@ async def _load_ignore_spec(snapshot_id: str):
                     "git", "show", f"{snapshot_id}:{fname}",
                     stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=git_root,
                 )
-                stdout, _ = await asyncio.wait_for(
-                    proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-                )
+                stdout, _ = await _communicate_or_kill(proc)
             except Exception:
                 continue
         if proc.returncode != 0:
@@ -617,10 +633,8 @@ async def _reviewability_attrs(snapshot_id: str, paths: List[str]) -> Dict[str,
     if not paths:
         return {}
     out: Dict[str, str] = {}
-    for i in range(0, len(paths), GIT_ARGV_BATCH_SIZE):
-        out.update(
-            await _reviewability_attrs_chunk(snapshot_id, paths[i : i + GIT_ARGV_BATCH_SIZE])
-        )
+    for chunk in await _map_argv_chunks(_reviewability_attrs_chunk, snapshot_id, paths):
+        out.update(chunk)
     return out
 
 
@@ -635,9 +649,7 @@ async def _reviewability_attrs_chunk(snapshot_id: str, paths: List[str]) -> Dict
                 "linguist-generated", "linguist-vendored", "--", *paths,
                 stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=git_root,
             )
-            stdout, _ = await asyncio.wait_for(
-                proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-            )
+            stdout, _ = await _communicate_or_kill(proc)
         except Exception as e:
             logger.warning("git check-attr raised: %s", e)
             return {}
@@ -701,8 +713,10 @@ async def _classify_decodable(
 ) -> Tuple[List[SelectedBlob], List[Omission]]:
     """Content-mode decodability (ADR-053 Q1): size cap → binary/text via git."""
     paths = [p for p, _ in candidates]
-    sizes = await _blob_sizes(snapshot_id, paths)
-    text = await _text_paths(snapshot_id, paths)
+    # Independent git queries: run them side by side, not one after the other.
+    sizes, text = await asyncio.gather(
+        _blob_sizes(snapshot_id, paths), _text_paths(snapshot_id, paths)
+    )
     selected: List[SelectedBlob] = []
     omitted: List[Omission] = []
     for path, origin in candidates:
@@ -924,6 +938,30 @@ async def _wait_killed_process(proc: "asyncio.subprocess.Process") -> None:
         logger.warning("process did not reap within 2s after kill() — abandoning wait")
 
 
+async def _communicate_or_kill(proc: "asyncio.subprocess.Process") -> Tuple[bytes, bytes]:
+    """``proc.communicate()`` bounded by ``ASYNC_SUBPROCESS_TIMEOUT``.
+
+    A bare ``wait_for`` only abandons the wait: on a timeout, or when the
+    caller is cancelled (e.g. a sibling in a ``gather`` failed), git keeps
+    running and holds its pipes open. Kill and reap it before re-raising.
+    """
+    try:
+        return await asyncio.wait_for(proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT)
+    except BaseException:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await _wait_killed_process(proc)
+        raise
+
+
+# One pipe buffer's worth (64 KB on Linux) per read: a tier-sized file arrives
+# in one or two event-loop wakeups instead of one per 8 KB.
+_STREAM_READ_CHUNK = 65536
+
+
 async def _fetch_file_at_commit_async(
     snapshot_id: str,
     file_path: str,
@@ -979,23 +1017,24 @@ async def _fetch_file_at_commit_async(
                 assert proc.stdout is not None  # Type narrowing for mypy
 
                 async def read_with_limit() -> None:
-                    """Read chunks until limit or EOF."""
+                    """Read up to one byte past the limit, or until EOF."""
                     nonlocal bytes_read, truncated
-                    while bytes_read < limit:
-                        # Read in chunks of 8KB
-                        chunk = await proc.stdout.read(8192)  # type: ignore[union-attr]
+                    # The byte past the limit doubles as the truncation probe,
+                    # so no separate read(1) is needed.
+                    wanted = limit + 1
+                    while bytes_read < wanted:
+                        chunk = await proc.stdout.read(  # type: ignore[union-attr]
+                            min(_STREAM_READ_CHUNK, wanted - bytes_read)
+                        )
                         if not chunk:
                             break
                         chunks.append(chunk)
                         bytes_read += len(chunk)
 
-                    # Check if there's more data (truncation needed)
-                    if bytes_read >= limit:
-                        extra = await proc.stdout.read(1)  # type: ignore[union-attr]
-                        if extra:
-                            truncated = True
-                            # Kill process to avoid wasting resources on remaining data
-                            proc.kill()
+                    if bytes_read > limit:
+                        truncated = True
+                        # Kill process to avoid wasting resources on remaining data
+                        proc.kill()
 
                 await asyncio.wait_for(read_with_limit(), timeout=ASYNC_SUBPROCESS_TIMEOUT)
 
@@ -1050,21 +1089,420 @@ async def _fetch_file_at_commit_async(
                 suffix = f": {detail}" if detail else ""
                 return f"[Error: Could not read {file_path} at {snapshot_id}{suffix}]", False
 
-            # Combine chunks and decode
-            content_bytes = b"".join(chunks)
-            content = content_bytes.decode("utf-8", errors="replace")
+            return _decode_blob(b"".join(chunks), limit, truncated)
 
-            if truncated or len(content) > limit:
-                content = (
-                    content[:limit]
-                    + f"\n\n... [truncated, original file larger than {limit} chars]"
+        except Exception as e:
+            return f"[Error: {e}]", False
+
+
+def _decode_blob(content_bytes: bytes, limit: int, truncated: bool) -> Tuple[str, bool]:
+    """Decode fetched blob bytes and apply the per-file char cap + marker.
+
+    Oversized input is cut to ``limit`` bytes *before* decoding, so the full
+    string is never materialised just to be sliced. A UTF-8 sequence split at
+    the cut decodes to a single U+FFFD, and since every char costs at least
+    one byte the decoded head can never exceed ``limit`` chars.
+    """
+    if truncated or len(content_bytes) > limit:
+        head = content_bytes[:limit].decode("utf-8", errors="replace")
+        return f"{head}\n\n... [truncated, original file larger than {limit} chars]", True
+
+    return content_bytes.decode("utf-8", errors="replace"), False
+
+
+# Optional in-process blob reads via libgit2 (`pip install
+# "llm-council-core[git]"`). When pygit2 is importable and the git root opens
+# as a repository, the batch fetcher reads blobs without forking git at all;
+# otherwise it uses the `git cat-file --batch` subprocess. libgit2 repository
+# handles must not be used from two threads at once, and reads run on
+# asyncio.to_thread workers, so each thread opens its own handle per git root
+# and reuses it. Roots pygit2 cannot serve are remembered process-wide.
+_pygit2_local = threading.local()
+_pygit2_unusable: Set[str] = set()
+
+
+def _get_pygit2_repo(git_root: Optional[str]) -> Any:
+    """This thread's ``pygit2.Repository`` for ``git_root``, or None to use subprocesses."""
+    if git_root is None or git_root in _pygit2_unusable:
+        return None
+    repos: Dict[str, Any] = getattr(_pygit2_local, "repos", None) or {}
+    _pygit2_local.repos = repos
+    if git_root not in repos:
+        try:
+            import pygit2
+
+            repos[git_root] = pygit2.Repository(git_root)
+        except ImportError:
+            _pygit2_unusable.add(git_root)
+            return None
+        except Exception as e:  # not a repository / unreadable: fall back
+            logger.debug("pygit2 could not open %s (%s); using git subprocesses", git_root, e)
+            _pygit2_unusable.add(git_root)
+            return None
+    return repos[git_root]
+
+
+def _read_blobs_pygit2(
+    git_root: Optional[str],
+    snapshot_id: str,
+    file_paths: List[str],
+    limit: int,
+) -> List[Tuple[str, bool]]:
+    """Read blobs at ``snapshot_id`` in-process (sync; run off the event loop).
+
+    Uses the calling thread's repository handle (see ``_get_pygit2_repo``).
+    Mirrors ``_read_batch_entry``'s result shapes: ``missing`` for an absent
+    path or unresolvable snapshot, ``not a file (<type>)`` for trees/gitlinks.
+    Each blob is inflated in full before it is cut to ``limit``, so peak
+    memory per worker is the largest blob read, not ``limit``.
+    """
+    import pygit2
+
+    repo = _get_pygit2_repo(git_root)
+    try:
+        tree = repo.revparse_single(snapshot_id).peel(pygit2.Commit).tree
+    except Exception:
+        return [
+            (f"[Error: Could not read {fp} at {snapshot_id}: missing]", False)
+            for fp in file_paths
+        ]
+
+    results: List[Tuple[str, bool]] = []
+    for file_path in file_paths:
+        try:
+            obj = tree[file_path]
+        except (KeyError, ValueError):
+            results.append((f"[Error: Could not read {file_path} at {snapshot_id}: missing]", False))
+            continue
+        if obj.type_str != "blob":
+            results.append(
+                (
+                    f"[Error: Could not read {file_path} at {snapshot_id}: "
+                    f"not a file ({obj.type_str})]",
+                    False,
                 )
-                truncated = True
+            )
+            continue
+        # Unlike the cat-file reader this holds the whole blob: pygit2 has no
+        # size-only read, so the size cannot be checked before inflating it.
+        data = obj.data
+        results.append(_decode_blob(data[:limit], limit, len(data) > limit))
+    return results
 
-            return content, truncated
 
-        except Exception as e:
-            return f"[Error: {e}]", False
+async def _read_batch_entry(
+    stdout: "asyncio.StreamReader",
+    snapshot_id: str,
+    file_path: str,
+    limit: int,
+) -> Tuple[str, bool]:
+    """Consume one ``git cat-file --batch`` response, keeping at most ``limit`` bytes.
+
+    Response framing is ``<oid> <type> <size>\\n<size bytes>\\n``, or a single
+    ``<object> missing`` / ``<object> ambiguous`` line. The whole body must be
+    drained even past the cap, because the next response follows it on the same
+    pipe; bytes beyond ``limit`` are read in 64 KB chunks and discarded.
+    """
+    header = (await stdout.readline()).decode("utf-8", errors="replace").rstrip("\n")
+    if not header:
+        raise asyncio.IncompleteReadError(b"", None)
+    if header.endswith((" missing", " ambiguous")):
+        detail = header.rsplit(" ", 1)[1]
+        return f"[Error: Could not read {file_path} at {snapshot_id}: {detail}]", False
+
+    _oid, obj_type, size_str = header.rsplit(" ", 2)
+    size = int(size_str)
+    head = await stdout.readexactly(min(size, limit))
+    remaining = size - len(head)
+    while remaining:
+        chunk = await stdout.read(min(remaining, 65536))
+        if not chunk:
+            raise asyncio.IncompleteReadError(b"", remaining)
+        remaining -= len(chunk)
+    await stdout.readexactly(1)  # LF terminating the body
+
+    if obj_type != "blob":
+        return (
+            f"[Error: Could not read {file_path} at {snapshot_id}: not a file ({obj_type})]",
+            False,
+        )
+    return _decode_blob(head, limit, size > limit)
+
+
+# Commits are immutable, so anything read at a SHA never goes stale. Results
+# are memoized per (git_root, snapshot_id, ...) for retry / repeated-verify
+# workflows. Only hex SHAs are cached — refs such as HEAD move — and error
+# results are never stored. Blob text is large, so the blob cache is a
+# bounded LRU. Reads still in progress are tracked per key in
+# _blob_inflight, so concurrent fetches of the same blob share one git read
+# while fetches of other blobs or snapshots run alongside it.
+_BLOB_CACHE_MAXSIZE = 512
+_DIFF_TREE_CACHE_MAXSIZE = 128
+_BlobKey = Tuple[Optional[str], str, str, int]  # (git_root, snapshot_id, path, limit)
+_blob_cache: "OrderedDict[_BlobKey, Tuple[str, bool]]" = OrderedDict()
+_blob_inflight: "Dict[_BlobKey, asyncio.Future[Tuple[str, bool]]]" = {}
+_diff_tree_cache: "OrderedDict[Tuple[Optional[str], str], List[str]]" = OrderedDict()
+
+
+def _is_immutable_snapshot(snapshot_id: str) -> bool:
+    return is_hex_sha(snapshot_id)
+
+
+def _lru_get(cache: "OrderedDict[Any, Any]", key: Any) -> Any:
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: "OrderedDict[Any, Any]", key: Any, value: Any, maxsize: int) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+def _clear_snapshot_caches() -> None:
+    """Drop memoized blob and diff-tree results (tests, repo swaps)."""
+    _blob_cache.clear()
+    _diff_tree_cache.clear()
+
+
+async def _fetch_files_batched_async(
+    snapshot_id: str,
+    file_paths: List[str],
+    max_file_chars: Optional[int] = None,
+) -> List[Tuple[str, bool]]:
+    """Fetch many files at one commit through a single ``git cat-file --batch``.
+
+    One fork/exec per verification instead of one ``git show`` per file — or
+    none at all when pygit2 is installed (see ``_get_pygit2_repo``). Results
+    are positionally aligned with ``file_paths`` and carry the same
+    ``(content, was_truncated)`` / ``[Error: ...]`` shapes as
+    ``_fetch_file_at_commit_async``, so the prompt builder's budget loop is
+    unchanged. Each response read is bounded by ``ASYNC_SUBPROCESS_TIMEOUT``;
+    on a timeout the process is killed and every unread path reports the
+    timeout. stderr goes to DEVNULL (``--batch`` reports missing objects on
+    stdout), which rules out the unread-stderr pipe deadlock by construction.
+
+    The batch protocol is line-oriented, so a path containing CR/LF cannot be
+    framed; those (vanishingly rare) paths use the per-file primitive.
+
+    Successful reads at a hex SHA are served from ``_blob_cache`` on repeat
+    calls; only the misses reach git, and a miss another fetch is already
+    reading waits for that read instead of starting its own.
+
+    Args:
+        snapshot_id: Git commit SHA
+        file_paths: Paths relative to repo root, in prompt order
+        max_file_chars: Per-file cap (defaults to MAX_FILE_CHARS)
+
+    Returns:
+        List of (content, was_truncated), one per input path.
+    """
+    limit = MAX_FILE_CHARS if max_file_chars is None else max_file_chars
+    if not _is_immutable_snapshot(snapshot_id):
+        return await _fetch_files_uncached_async(snapshot_id, file_paths, limit)
+
+    git_root = await _get_git_root_async()
+    keys = [(git_root, snapshot_id, fp, limit) for fp in file_paths]
+    results: List[Optional[Tuple[str, bool]]] = [_lru_get(_blob_cache, k) for k in keys]
+
+    # Claim each miss nobody is reading yet; wait on the ones already in
+    # flight. Nothing awaits between the lookup and the claim, so two
+    # fetches on the loop cannot both claim one key.
+    loop = asyncio.get_running_loop()
+    owned: Dict[_BlobKey, "asyncio.Future[Tuple[str, bool]]"] = {}
+    to_read: List[int] = []
+    waiting: List[Tuple[int, "asyncio.Future[Tuple[str, bool]]"]] = []
+    for index, key in enumerate(keys):
+        if results[index] is not None:
+            continue
+        pending = _blob_inflight.get(key)
+        if pending is not None and pending.get_loop() is loop:
+            waiting.append((index, pending))
+        else:
+            owned[key] = _blob_inflight[key] = loop.create_future()
+            to_read.append(index)
+
+    try:
+        if to_read:
+            fetched = await _fetch_files_uncached_async(
+                snapshot_id, [file_paths[i] for i in to_read], limit
+            )
+            for index, blob in zip(to_read, fetched):
+                results[index] = blob
+                if not blob[0].startswith("[Error:"):
+                    _lru_put(_blob_cache, keys[index], blob, _BLOB_CACHE_MAXSIZE)
+                if not owned[keys[index]].done():
+                    owned[keys[index]].set_result(blob)
+    finally:
+        for key, future in owned.items():
+            if _blob_inflight.get(key) is future:
+                del _blob_inflight[key]
+            future.cancel()  # no-op once resolved; waiters fall back below
+
+    if waiting:
+        await asyncio.wait({future for _, future in waiting})
+        retry: List[int] = []
+        for index, future in waiting:
+            if future.cancelled():
+                retry.append(index)
+            else:
+                results[index] = future.result()
+        if retry:
+            # The owning fetch failed or was cancelled; read these directly.
+            fetched = await _fetch_files_uncached_async(
+                snapshot_id, [file_paths[i] for i in retry], limit
+            )
+            for index, blob in zip(retry, fetched):
+                results[index] = blob
+    return results  # type: ignore[return-value]
+
+
+async def _fetch_files_uncached_async(
+    snapshot_id: str,
+    file_paths: List[str],
+    limit: int,
+) -> List[Tuple[str, bool]]:
+    """Read ``file_paths`` at ``snapshot_id`` from git, bypassing the blob cache."""
+    results: List[Optional[Tuple[str, bool]]] = [None] * len(file_paths)
+    batched: List[int] = []
+
+    for index, file_path in enumerate(file_paths):
+        if not _validate_file_path(file_path):
+            results[index] = (f"[Error: Invalid file path: {file_path}]", False)
+        elif "\n" in file_path or "\r" in file_path:
+            results[index] = await _fetch_file_at_commit_async(
+                snapshot_id, file_path, max_file_chars=limit
+            )
+        else:
+            batched.append(index)
+
+    if batched:
+        git_root = await _get_git_root_async()
+        if _get_pygit2_repo(git_root) is not None:
+            blobs = await asyncio.to_thread(
+                _read_blobs_pygit2, git_root, snapshot_id, [file_paths[i] for i in batched], limit
+            )
+            for index, blob in zip(batched, blobs):
+                results[index] = blob
+            return results  # type: ignore[return-value]
+
+        semaphore = await _get_git_semaphore()
+        async with semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "git",
+                    "cat-file",
+                    "--batch",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    cwd=git_root,
+                )
+            except Exception as e:
+                for index in batched:
+                    results[index] = (f"[Error: {e}]", False)
+            else:
+                await _drain_cat_file_batch(proc, snapshot_id, file_paths, batched, limit, results)
+
+    return [r if r is not None else ("[Error: no output from git cat-file]", False) for r in results]
+
+
+async def _drain_cat_file_batch(
+    proc: "asyncio.subprocess.Process",
+    snapshot_id: str,
+    file_paths: List[str],
+    batched: List[int],
+    limit: int,
+    results: List[Optional[Tuple[str, bool]]],
+) -> None:
+    """Feed requests to a running ``cat-file --batch`` and collect replies in order.
+
+    Requests are written from a separate task so a reply larger than the pipe
+    buffer can never block git while we are still blocked writing stdin.
+    """
+    assert proc.stdin is not None and proc.stdout is not None  # Type narrowing for mypy
+
+    async def feed() -> None:
+        try:
+            proc.stdin.write(  # type: ignore[union-attr]
+                "".join(f"{snapshot_id}:{file_paths[i]}\n" for i in batched).encode("utf-8")
+            )
+            await proc.stdin.drain()  # type: ignore[union-attr]
+            proc.stdin.close()  # type: ignore[union-attr]
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # git exited early; the reader reports it
+
+    feeder = asyncio.create_task(feed())
+    try:
+        for index in batched:
+            file_path = file_paths[index]
+            try:
+                results[index] = await asyncio.wait_for(
+                    _read_batch_entry(proc.stdout, snapshot_id, file_path, limit),
+                    timeout=ASYNC_SUBPROCESS_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                logger.warning("git cat-file --batch timed out reading %s:%s", snapshot_id, file_path)
+                for pending in batched[batched.index(index) :]:
+                    results[pending] = (f"[Error: Timeout reading {file_paths[pending]}]", False)
+                break
+            except (asyncio.IncompleteReadError, ValueError) as e:
+                logger.warning("git cat-file --batch stream ended early at %s: %s", file_path, e)
+                for pending in batched[batched.index(index) :]:
+                    results[pending] = (
+                        f"[Error: Could not read {file_paths[pending]} at {snapshot_id}]",
+                        False,
+                    )
+                break
+    finally:
+        feeder.cancel()
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+            await _wait_killed_process(proc)
+
+
+async def _diff_tree_async(snapshot_id: str, git_root: Optional[str]) -> Optional[List[str]]:
+    """List the paths changed by ``snapshot_id`` (``git diff-tree -r``).
+
+    Returns None when git exits non-zero; subprocess errors and timeouts
+    propagate to the caller. Results at a hex SHA are memoized in
+    ``_diff_tree_cache``.
+    """
+    key = (git_root, snapshot_id)
+    cacheable = _is_immutable_snapshot(snapshot_id)
+    if cacheable:
+        cached = _lru_get(_diff_tree_cache, key)
+        if cached is not None:
+            return list(cached)
+
+    semaphore = await _get_git_semaphore()
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "diff-tree",
+            "--no-commit-id",
+            "--name-only",
+            "-r",
+            snapshot_id,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=git_root,  # Use git root to avoid CWD dependency
+        )
+
+        stdout, _ = await _communicate_or_kill(proc)
+
+    if proc.returncode != 0:
+        return None
+    changed = [f for f in stdout.decode("utf-8").strip().split("\n") if f]
+    if cacheable:
+        _lru_put(_diff_tree_cache, key, changed, _DIFF_TREE_CACHE_MAXSIZE)
+    return list(changed)
 
 
 async def _fetch_files_for_verification_async(
@@ -1090,6 +1528,10 @@ async def _fetch_files_for_verification_async(
     return content
 
 
+# Files in the prompt builder's first fetch wave (the old per-batch count).
+_FIRST_FETCH_WAVE = 5
+
+
 async def _fetch_files_for_verification_async_with_metadata(
     snapshot_id: str,
     target_paths: Optional[List[str]] = None,
@@ -1148,40 +1590,20 @@ async def _fetch_files_for_verification_async_with_metadata(
     else:
         # If no target paths, get files changed in this commit
         try:
-            semaphore = await _get_git_semaphore()
-            async with semaphore:
-                proc = await asyncio.create_subprocess_exec(
-                    "git",
-                    "diff-tree",
-                    "--no-commit-id",
-                    "--name-only",
-                    "-r",
-                    snapshot_id,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                    cwd=git_root,  # Use git root to avoid CWD dependency
+            changed = await _diff_tree_async(snapshot_id, git_root)
+            if changed is not None:
+                # #543: THIS is the bug. These paths went straight to the
+                # fetcher — no text check, no garbage check, no warning — so
+                # `target_paths=None` (the default at run_verification and the
+                # MCP verify tool) transmitted secrets, binaries and lockfiles.
+                # Every candidate producer goes through the selector now.
+                selected, omitted = await select_blobs(
+                    snapshot_id, [(f, "discovered") for f in changed]
                 )
-
-                stdout, _ = await asyncio.wait_for(
-                    proc.communicate(), timeout=ASYNC_SUBPROCESS_TIMEOUT
-                )
-
-                if proc.returncode == 0:
-                    changed = [f for f in stdout.decode("utf-8").strip().split("\n") if f]
-                    # #543: THIS is the bug. These paths went straight to the
-                    # fetcher — no text check, no garbage check, no warning — so
-                    # `target_paths=None` (the default at run_verification and the
-                    # MCP verify tool) transmitted secrets, binaries and lockfiles.
-                    # Every candidate producer goes through the selector now.
-                    selected, omitted = await select_blobs(
-                        snapshot_id, [(f, "discovered") for f in changed]
-                    )
-                    files_to_fetch = [b.path for b in selected]
-                    all_omissions = omitted
-                    expansion_metadata["expanded_paths"] = files_to_fetch
-                    expansion_metadata["expansion_warnings"] = [
-                        o.as_warning() for o in omitted
-                    ]
+                files_to_fetch = [b.path for b in selected]
+                all_omissions = omitted
+                expansion_metadata["expanded_paths"] = files_to_fetch
+                expansion_metadata["expansion_warnings"] = [o.as_warning() for o in omitted]
         except Exception as e:
             # #584: this used to be a bare `except Exception: pass` — a real
             # failure (missing git binary, corrupt repo, timeout) left
@@ -1222,28 +1644,26 @@ async def _fetch_files_for_verification_async_with_metadata(
     if not files_to_fetch:
         return "[No files specified and could not determine changed files]", expansion_metadata
 
-    # Fetch files with early termination when limit is reached
-    # This avoids wasting resources on files we won't include
-    sections: List[str] = []
+    # One `git cat-file --batch` process serves each wave of files (was one
+    # `git show` fork per file, five at a time). Sections stream straight into
+    # one buffer (separated by a blank line) rather than a per-file f-string
+    # plus a final join, which re-copied every file body twice.
+    #
+    # Files are fetched in waves so the budget still stops fetching early: the
+    # first wave is the old batch of five, and each later wave is sized to
+    # what the remaining budget holds at the average file size seen so far.
+    # At most one wave's worth of content is read and then dropped.
+    buf = io.StringIO()
     total_chars = 0
-
-    # Limit concurrent fetches to avoid DoS on large commits
-    # Fetch in batches of up to 5 files at a time
-    BATCH_SIZE = 5
-    files_fetched = 0
+    files_included = 0
+    pending = files_to_fetch
+    wave = _FIRST_FETCH_WAVE
     budget_exceeded = False
 
-    for i in range(0, len(files_to_fetch), BATCH_SIZE):
-        # Check limit before fetching next batch
-        if budget_exceeded:
-            break
-
-        batch = files_to_fetch[i : i + BATCH_SIZE]
-        results = await asyncio.gather(
-            *[
-                _fetch_file_at_commit_async(snapshot_id, fp, max_file_chars=per_file_budget)
-                for fp in batch
-            ]
+    while pending and not budget_exceeded:
+        batch, pending = pending[:wave], pending[wave:]
+        results = await _fetch_files_batched_async(
+            snapshot_id, batch, max_file_chars=per_file_budget
         )
 
         for file_path, (content, truncated) in zip(batch, results):
@@ -1263,16 +1683,21 @@ async def _fetch_files_for_verification_async_with_metadata(
             # CLAUDE.md documents "reasoning/high can read a full 50K file"
             # as a guarantee, so the first file is always included.
             if total_chars > 0 and total_chars + len(content) > per_batch_budget:
-                sections.append(
-                    f"\n... [remaining files omitted, {per_batch_budget} char limit reached]"
+                buf.write(
+                    f"\n\n\n... [remaining files omitted, {per_batch_budget} char limit reached]"
                 )
                 budget_exceeded = True
                 break
 
+            if buf.tell():
+                buf.write("\n\n")
             total_chars += len(content)
-            files_fetched += 1
-            section = f"### {file_path}\n```\n{content}\n```"
-            sections.append(section)
+            files_included += 1
+            buf.write("### ")
+            buf.write(file_path)
+            buf.write("\n```\n")
+            buf.write(content)
+            buf.write("\n```")
 
             # Issue #342: surface per-file truncation. Previously the
             # `truncated` boolean was bound and immediately discarded so
@@ -1284,6 +1709,9 @@ async def _fetch_files_for_verification_async_with_metadata(
                     f"({tier} tier per-file budget)"
                 )
 
-    return "\n\n".join(sections), expansion_metadata
+        average = max(1, total_chars // max(1, files_included))
+        wave = max(1, -(-(per_batch_budget - total_chars) // average))
+
+    return buf.getvalue(), expansion_metadata
 
 
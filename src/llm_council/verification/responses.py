@@ -0,0 +1,326 @@
+"""HTTP response schemas for the verification API (split from schemas.py).
+
+Only ``POST /verify`` (FastAPI's ``response_model``) and its callers need these
+models, so they are compiled on first use instead of on every ``schemas``
+import — the MCP and CLI paths never build them. ``schemas`` and ``api``
+re-export every name lazily for backward compatibility.
+"""
+
+from typing import Any, Dict, List, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, Field
+
+from .schemas import EvidenceDisposition, EvidenceWarning, Finding
+
+
+class RubricScoresResponse(BaseModel):
+    """Rubric scores in response."""
+
+    accuracy: Optional[float] = Field(default=None, ge=0, le=10)
+    relevance: Optional[float] = Field(default=None, ge=0, le=10)
+    completeness: Optional[float] = Field(default=None, ge=0, le=10)
+    conciseness: Optional[float] = Field(default=None, ge=0, le=10)
+    clarity: Optional[float] = Field(default=None, ge=0, le=10)
+
+
+class BlockingIssueResponse(BaseModel):
+    """Blocking issue in response."""
+
+    severity: str = Field(..., description="critical, major, or minor")
+    description: str = Field(..., description="Issue description")
+    location: Optional[str] = Field(default=None, description="File/line location")
+
+
+class VerifyDiagnostics(BaseModel):
+    """Telemetry-only diagnostics (ADR-051) — NOT control flow.
+
+    Nested so consumers don't parse ``inner_verdict`` to bypass the
+    low-confidence gate. ``verdict_evidence_mismatch`` is a defensive invariant
+    assertion (should never fire under the mechanical gate).
+    """
+
+    inner_verdict: Optional[str] = Field(
+        default=None, description="Structured verdict before UNCLEAR softening"
+    )
+    inner_confidence: Optional[float] = Field(default=None, ge=0, le=1)
+    inner_confidence_calibrated: Optional[float] = Field(default=None, ge=0, le=1)
+    verdict_evidence_mismatch: Optional[str] = Field(
+        default=None, description="Invariant assertion marker; None in normal operation"
+    )
+    findings_source: Literal["structured", "fallback", "skipped"] = Field(
+        default="fallback", description="Where findings came from"
+    )
+    fallback_reason: Optional[str] = Field(default=None)
+    verdict_source: Literal["mechanical", "legacy", "chairman_disabled"] = Field(
+        default="legacy",
+        description=(
+            "mechanical = policy(findings); legacy = prose parse; "
+            "chairman_disabled = chairman synthesis skipped (PR #519), no verdict computed"
+        ),
+    )
+    verdict_parse: Literal["ok", "error", "absent"] = Field(
+        default="absent",
+        description=(
+            "#544: how the chairman's ADR-025b BINARY verdict block parsed. "
+            "ok = parsed; error = malformed (see verdict_parse_error); "
+            "absent = no structured verdict expected (non-BINARY mode, chairman "
+            "error, or chairman disabled). Set independently of "
+            "LLM_COUNCIL_STRUCTURED_FINDINGS, and distinct from fallback_reason, "
+            "which describes the FINDINGS parser."
+        ),
+    )
+    verdict_parse_error: Optional[str] = Field(
+        default=None,
+        description=(
+            "#544: exception type and message when verdict_parse == 'error'. "
+            "Never contains the offending payload (cf. ADR-050 D3 scrub_exception)."
+        ),
+    )
+    deliberation_agreement: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description=(
+            "#560: the stage-2 reviewer-agreement figure, published under its real "
+            "name. It measures how well the council REVIEWED, not how sure we are of "
+            "the verdict, and it no longer gates anything."
+        ),
+    )
+    pass_blocked_by: Optional[str] = Field(
+        default=None,
+        description=(
+            "#560: why a mechanical `pass` was downgraded to `unclear` — "
+            "'deliberation_invalid' (no well-formed chairman verdict, too few "
+            "reviewers, or a stage-3 error) or 'chairman_contradicts_findings' "
+            "(chairman rejected but labelled no finding critical). None otherwise."
+        ),
+    )
+    # ADR-051 C4 (#488): severity distribution — surfaces severity mis-labelling
+    # (the mechanical gate's residual failure mode) over time.
+    findings_by_severity: Dict[str, int] = Field(default_factory=dict)
+
+
+class CoverageOmission(BaseModel):
+    """One path the verify pipeline did not review, and why (#555, ADR-053)."""
+
+    path: str = Field(description="Repo-relative path that was omitted")
+    reason: str = Field(
+        description=(
+            "Why it was omitted: denied_secret | garbage | non-text | binary | "
+            "generated | vendored | noise | ignored | too_large | not_found. "
+            "denied_secret records the path only, never the matched value."
+        )
+    )
+    origin: str = Field(
+        description="explicit (caller named it) or discovered (directory/diff-tree expansion)"
+    )
+
+
+class CoverageReport(BaseModel):
+    """Structural coverage receipt for a verify run (#555, ADR-053).
+
+    Makes #542's silent-partial-omission failure visible: a caller can tell a
+    `.zig` drop (`non-text`) from a `.png` (`binary`) from a secret
+    (`denied_secret`) without parsing prose. Additive, no verdict effect — the
+    coverage clamp is #556.
+    """
+
+    requested: Optional[List[str]] = Field(
+        default=None, description="Verbatim target_paths (None when the changed set was used)"
+    )
+    reviewed: List[str] = Field(
+        default_factory=list, description="Paths whose contents entered the prompt"
+    )
+    omitted: List[CoverageOmission] = Field(
+        default_factory=list, description="Every candidate path that was not reviewed, typed"
+    )
+    explicit_omitted: bool = Field(
+        default=False,
+        description="True if a caller-named (origin=explicit) path was omitted — the load-bearing signal",
+    )
+    truncated: bool = Field(
+        default=False, description="True if MAX_FILES_EXPANSION capped directory expansion"
+    )
+    conservation_ok: bool = Field(
+        default=True,
+        description="Invariant: reviewed and omitted are disjoint (ADR-051 C4 defensive marker)",
+    )
+
+
+class VerifyResponse(BaseModel):
+    """Response body for POST /v1/council/verify."""
+
+    verification_id: str = Field(..., description="Unique verification ID")
+    verdict: str = Field(..., description="pass, fail, or unclear")
+    confidence: float = Field(..., ge=0, le=1, description="Confidence score")
+    exit_code: int = Field(..., description="0=PASS, 1=FAIL, 2=UNCLEAR")
+    rubric_scores: RubricScoresResponse = Field(
+        default_factory=RubricScoresResponse,
+        description="Multi-dimensional rubric scores",
+    )
+    blocking_issues: List[BlockingIssueResponse] = Field(
+        default_factory=list,
+        description="Issues that caused FAIL verdict (the critical subset of findings)",
+    )
+    # ADR-051 (#485): additive structured findings channel. Empty until the
+    # LLM_COUNCIL_STRUCTURED_FINDINGS flag emits them (C2); non-breaking.
+    findings: List[Finding] = Field(
+        default_factory=list,
+        description="Full structured findings (all severities); blocking_issues = critical subset",
+    )
+    diagnostics: VerifyDiagnostics = Field(
+        default_factory=VerifyDiagnostics,
+        description="Telemetry-only diagnostics (inner verdict, findings_source, ...) — not control flow",
+    )
+    rationale: str = Field(..., description="Chairman synthesis explanation")
+    transcript_location: str = Field(..., description="Path to verification transcript")
+    partial: bool = Field(
+        default=False,
+        description="True if result is partial (timeout/error)",
+    )
+    # #357: distinguishes a non-deliberated failure (e.g. "input_too_large")
+    # from a real verdict so callers don't treat it as a passed/accepted gate.
+    error: Optional[str] = Field(
+        default=None,
+        description="Non-verdict error marker (e.g. 'input_too_large'); None for a real verdict",
+    )
+    # ADR-047 P3 (#415): screening-judge audit trail. None when screening is
+    # off (default). When the ACTIVE screen short-circuited, verdict is
+    # "pass" and screening.acted is True — the full council did not run.
+    screening: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description=(
+            "Screening-judge decision (mode, eligible, reasons, scores,"
+            " acted). Present only when LLM_COUNCIL_SCREENING is shadow or"
+            " active; acted=true means the screen short-circuited to PASS."
+        ),
+    )
+    # Opt-in result cache (LLM_COUNCIL_VERIFY_CACHE): set when this verdict reuses an
+    # earlier deliberation of the same prompt, snapshot and tier models.
+    cached_from: Optional[str] = Field(
+        default=None,
+        description=(
+            "verification_id whose council deliberation this result reuses"
+            " (its transcript holds the stages); None when the council ran."
+        ),
+    )
+    # ADR-047 P2 (#414): calibrated confidence — raw stays in `confidence`.
+    confidence_calibrated: Optional[float] = Field(
+        default=None,
+        ge=0,
+        le=1,
+        description=(
+            "Confidence after the persisted monotonic calibration mapping"
+            " (.council/calibration/mapping.json; identity when absent, so it"
+            " equals the raw value until a mapping is fitted). The PASS"
+            " threshold uses this ONLY when LLM_COUNCIL_CALIBRATED_CONFIDENCE"
+            " is enabled (default off)."
+        ),
+    )
+    # ADR-047 P1 (#413): machine-readable UNCLEAR cause. None unless
+    # verdict == "unclear" (and None on non-deliberated cap results, where
+    # the `error` marker governs). Values: infra_failure | low_confidence
+    # | timeout. Exit code stays 2 for compat — this field is additive.
+    unclear_reason: Optional[str] = Field(
+        default=None,
+        description=(
+            "Why the verdict is unclear: infra_failure (chairman call errored"
+            " — retry after checking billing/auth), low_confidence"
+            " (deliberation completed below threshold — accept-and-audit per"
+            " policy), timeout (global deadline — re-tier or reduce scope)."
+            " None for pass/fail."
+        ),
+    )
+    # ADR-040: Timeout guardrail fields
+    timeout_fired: bool = Field(
+        default=False,
+        description="True if global deadline was exceeded",
+    )
+    completed_stages: Optional[List[str]] = Field(
+        default=None,
+        description="Stages completed before timeout (e.g. ['stage1', 'stage2'])",
+    )
+    # ADR-034 v2.6: Directory expansion metadata (Issue #311)
+    expanded_paths: Optional[List[str]] = Field(
+        default=None,
+        description="Files included after directory expansion",
+    )
+    paths_truncated: Optional[bool] = Field(
+        default=None,
+        description="True if MAX_FILES_EXPANSION limit was reached",
+    )
+    expansion_warnings: Optional[List[str]] = Field(
+        default=None,
+        description="Warnings from directory expansion (skipped files, etc.)",
+    )
+    coverage: Optional["CoverageReport"] = Field(
+        default=None,
+        description=(
+            "#555 (ADR-053): structural coverage receipt — which requested paths "
+            "were reviewed vs omitted (with a typed reason/origin per omission). "
+            "Additive; no verdict effect (the clamp is #556)."
+        ),
+    )
+    # ADR-041: Verification telemetry fields
+    timing: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Per-stage and total timing in milliseconds",
+    )
+    input_metrics: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Input size metrics (content_chars, tier_max_chars, num_models, num_reviewers, tier)",
+    )
+    # ADR-042: Evidence injection
+    evidence_summary: Optional[List[EvidenceDisposition]] = Field(
+        default=None,
+        description=(
+            "Per-evidence-item Council disposition. None when no evidence "
+            "was provided. Contains one entry per submitted item — including "
+            "dropped items with status=not_reviewed_due_to_budget."
+        ),
+    )
+    evidence_warnings: Optional[List[EvidenceWarning]] = Field(
+        default=None,
+        description=(
+            "Structured warnings about evidence handling "
+            "(truncation, format errors, duplicate-source disambiguation)."
+        ),
+    )
+
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+
+def _construct_value(annotation: Any, value: Any) -> Any:
+    """Build nested models inside ``value`` the way validation would, unchecked."""
+    if value is None:
+        return None
+    origin = get_origin(annotation)
+    if origin is Union:  # Optional[X]
+        inner = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _construct_value(inner[0], value) if len(inner) == 1 else value
+    if origin is list and isinstance(value, list):
+        (item,) = get_args(annotation)
+        return [_construct_value(item, v) for v in value]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if isinstance(value, dict):
+            return construct_trusted(annotation, value)
+    return value
+
+
+def construct_trusted(model_cls: Type[_ModelT], data: Dict[str, Any]) -> _ModelT:
+    """``model_construct`` that also builds nested models, for trusted data.
+
+    Skips field validation entirely but keeps the output shape of
+    ``model_cls(**data)``: nested dicts become (constructed) models, so their
+    defaults are filled in and they serialize without warnings. Unknown keys
+    are dropped, as the default ``extra="ignore"`` would.
+    """
+    fields = model_cls.model_fields
+    return model_cls.model_construct(
+        **{
+            name: _construct_value(fields[name].annotation, value)
+            for name, value in data.items()
+            if name in fields
+        }
+    )
@@ -9,10 +9,11 @@ from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
-logger = logging.getLogger(__name__)
+# Git SHA validation, shared with context.validate_snapshot_id so both
+# boundaries agree on what a SHA is.
+from .context import GIT_SHA_PATTERN, is_hex_sha
 
-# Git SHA pattern for validation
-GIT_SHA_PATTERN = re.compile(r"^[0-9a-f]{7,40}$", re.IGNORECASE)
+logger = logging.getLogger(__name__)
 
 # Regex for evidence source strings. Constrains the attribute value that will
 # be interpolated into the rendered XML wrapper, preventing prompt-injection
@@ -244,7 +245,7 @@ class VerifyRequest(BaseModel):
     @classmethod
     def validate_snapshot_id_format(cls, v: str) -> str:
         """Validate snapshot_id is valid git SHA."""
-        if not GIT_SHA_PATTERN.match(v):
+        if not is_hex_sha(v):
             raise ValueError("snapshot_id must be valid git SHA (7-40 hexadecimal characters)")
         return v
 
@@ -266,24 +267,6 @@ class VerifyRequest(BaseModel):
         return v
 
 
-class RubricScoresResponse(BaseModel):
-    """Rubric scores in response."""
-
-    accuracy: Optional[float] = Field(default=None, ge=0, le=10)
-    relevance: Optional[float] = Field(default=None, ge=0, le=10)
-    completeness: Optional[float] = Field(default=None, ge=0, le=10)
-    conciseness: Optional[float] = Field(default=None, ge=0, le=10)
-    clarity: Optional[float] = Field(default=None, ge=0, le=10)
-
-
-class BlockingIssueResponse(BaseModel):
-    """Blocking issue in response."""
-
-    severity: str = Field(..., description="critical, major, or minor")
-    description: str = Field(..., description="Issue description")
-    location: Optional[str] = Field(default=None, description="File/line location")
-
-
 class Finding(BaseModel):
     """A structured finding from the chairman (ADR-051).
 
@@ -304,261 +287,32 @@ class Finding(BaseModel):
     )
 
 
-class VerifyDiagnostics(BaseModel):
-    """Telemetry-only diagnostics (ADR-051) — NOT control flow.
-
-    Nested so consumers don't parse ``inner_verdict`` to bypass the
-    low-confidence gate. ``verdict_evidence_mismatch`` is a defensive invariant
-    assertion (should never fire under the mechanical gate).
-    """
-
-    inner_verdict: Optional[str] = Field(
-        default=None, description="Structured verdict before UNCLEAR softening"
-    )
-    inner_confidence: Optional[float] = Field(default=None, ge=0, le=1)
-    inner_confidence_calibrated: Optional[float] = Field(default=None, ge=0, le=1)
-    verdict_evidence_mismatch: Optional[str] = Field(
-        default=None, description="Invariant assertion marker; None in normal operation"
-    )
-    findings_source: Literal["structured", "fallback", "skipped"] = Field(
-        default="fallback", description="Where findings came from"
-    )
-    fallback_reason: Optional[str] = Field(default=None)
-    verdict_source: Literal["mechanical", "legacy", "chairman_disabled"] = Field(
-        default="legacy",
-        description=(
-            "mechanical = policy(findings); legacy = prose parse; "
-            "chairman_disabled = chairman synthesis skipped (PR #519), no verdict computed"
-        ),
-    )
-    verdict_parse: Literal["ok", "error", "absent"] = Field(
-        default="absent",
-        description=(
-            "#544: how the chairman's ADR-025b BINARY verdict block parsed. "
-            "ok = parsed; error = malformed (see verdict_parse_error); "
-            "absent = no structured verdict expected (non-BINARY mode, chairman "
-            "error, or chairman disabled). Set independently of "
-            "LLM_COUNCIL_STRUCTURED_FINDINGS, and distinct from fallback_reason, "
-            "which describes the FINDINGS parser."
-        ),
-    )
-    verdict_parse_error: Optional[str] = Field(
-        default=None,
-        description=(
-            "#544: exception type and message when verdict_parse == 'error'. "
-            "Never contains the offending payload (cf. ADR-050 D3 scrub_exception)."
-        ),
-    )
-    deliberation_agreement: Optional[float] = Field(
-        default=None,
-        ge=0,
-        le=1,
-        description=(
-            "#560: the stage-2 reviewer-agreement figure, published under its real "
-            "name. It measures how well the council REVIEWED, not how sure we are of "
-            "the verdict, and it no longer gates anything."
-        ),
-    )
-    pass_blocked_by: Optional[str] = Field(
-        default=None,
-        description=(
-            "#560: why a mechanical `pass` was downgraded to `unclear` — "
-            "'deliberation_invalid' (no well-formed chairman verdict, too few "
-            "reviewers, or a stage-3 error) or 'chairman_contradicts_findings' "
-            "(chairman rejected but labelled no finding critical). None otherwise."
-        ),
-    )
-    # ADR-051 C4 (#488): severity distribution — surfaces severity mis-labelling
-    # (the mechanical gate's residual failure mode) over time.
-    findings_by_severity: Dict[str, int] = Field(default_factory=dict)
-
-
-class CoverageOmission(BaseModel):
-    """One path the verify pipeline did not review, and why (#555, ADR-053)."""
-
-    path: str = Field(description="Repo-relative path that was omitted")
-    reason: str = Field(
-        description=(
-            "Why it was omitted: denied_secret | garbage | non-text | binary | "
-            "generated | vendored | noise | ignored | too_large | not_found. "
-            "denied_secret records the path only, never the matched value."
-        )
-    )
-    origin: str = Field(
-        description="explicit (caller named it) or discovered (directory/diff-tree expansion)"
-    )
-
-
-class CoverageReport(BaseModel):
-    """Structural coverage receipt for a verify run (#555, ADR-053).
-
-    Makes #542's silent-partial-omission failure visible: a caller can tell a
-    `.zig` drop (`non-text`) from a `.png` (`binary`) from a secret
-    (`denied_secret`) without parsing prose. Additive, no verdict effect — the
-    coverage clamp is #556.
-    """
-
-    requested: Optional[List[str]] = Field(
-        default=None, description="Verbatim target_paths (None when the changed set was used)"
-    )
-    reviewed: List[str] = Field(
-        default_factory=list, description="Paths whose contents entered the prompt"
-    )
-    omitted: List[CoverageOmission] = Field(
-        default_factory=list, description="Every candidate path that was not reviewed, typed"
-    )
-    explicit_omitted: bool = Field(
-        default=False,
-        description="True if a caller-named (origin=explicit) path was omitted — the load-bearing signal",
-    )
-    truncated: bool = Field(
-        default=False, description="True if MAX_FILES_EXPANSION capped directory expansion"
-    )
-    conservation_ok: bool = Field(
-        default=True,
-        description="Invariant: reviewed and omitted are disjoint (ADR-051 C4 defensive marker)",
-    )
-
-
-class VerifyResponse(BaseModel):
-    """Response body for POST /v1/council/verify."""
-
-    verification_id: str = Field(..., description="Unique verification ID")
-    verdict: str = Field(..., description="pass, fail, or unclear")
-    confidence: float = Field(..., ge=0, le=1, description="Confidence score")
-    exit_code: int = Field(..., description="0=PASS, 1=FAIL, 2=UNCLEAR")
-    rubric_scores: RubricScoresResponse = Field(
-        default_factory=RubricScoresResponse,
-        description="Multi-dimensional rubric scores",
-    )
-    blocking_issues: List[BlockingIssueResponse] = Field(
-        default_factory=list,
-        description="Issues that caused FAIL verdict (the critical subset of findings)",
-    )
-    # ADR-051 (#485): additive structured findings channel. Empty until the
-    # LLM_COUNCIL_STRUCTURED_FINDINGS flag emits them (C2); non-breaking.
-    findings: List[Finding] = Field(
-        default_factory=list,
-        description="Full structured findings (all severities); blocking_issues = critical subset",
-    )
-    diagnostics: VerifyDiagnostics = Field(
-        default_factory=VerifyDiagnostics,
-        description="Telemetry-only diagnostics (inner verdict, findings_source, ...) — not control flow",
-    )
-    rationale: str = Field(..., description="Chairman synthesis explanation")
-    transcript_location: str = Field(..., description="Path to verification transcript")
-    partial: bool = Field(
-        default=False,
-        description="True if result is partial (timeout/error)",
-    )
-    # #357: distinguishes a non-deliberated failure (e.g. "input_too_large")
-    # from a real verdict so callers don't treat it as a passed/accepted gate.
-    error: Optional[str] = Field(
-        default=None,
-        description="Non-verdict error marker (e.g. 'input_too_large'); None for a real verdict",
-    )
-    # ADR-047 P3 (#415): screening-judge audit trail. None when screening is
-    # off (default). When the ACTIVE screen short-circuited, verdict is
-    # "pass" and screening.acted is True — the full council did not run.
-    screening: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description=(
-            "Screening-judge decision (mode, eligible, reasons, scores,"
-            " acted). Present only when LLM_COUNCIL_SCREENING is shadow or"
-            " active; acted=true means the screen short-circuited to PASS."
-        ),
-    )
-    # ADR-047 P2 (#414): calibrated confidence — raw stays in `confidence`.
-    confidence_calibrated: Optional[float] = Field(
-        default=None,
-        ge=0,
-        le=1,
-        description=(
-            "Confidence after the persisted monotonic calibration mapping"
-            " (.council/calibration/mapping.json; identity when absent, so it"
-            " equals the raw value until a mapping is fitted). The PASS"
-            " threshold uses this ONLY when LLM_COUNCIL_CALIBRATED_CONFIDENCE"
-            " is enabled (default off)."
-        ),
-    )
-    # ADR-047 P1 (#413): machine-readable UNCLEAR cause. None unless
-    # verdict == "unclear" (and None on non-deliberated cap results, where
-    # the `error` marker governs). Values: infra_failure | low_confidence
-    # | timeout. Exit code stays 2 for compat — this field is additive.
-    unclear_reason: Optional[str] = Field(
-        default=None,
-        description=(
-            "Why the verdict is unclear: infra_failure (chairman call errored"
-            " — retry after checking billing/auth), low_confidence"
-            " (deliberation completed below threshold — accept-and-audit per"
-            " policy), timeout (global deadline — re-tier or reduce scope)."
-            " None for pass/fail."
-        ),
-    )
-    # ADR-040: Timeout guardrail fields
-    timeout_fired: bool = Field(
-        default=False,
-        description="True if global deadline was exceeded",
-    )
-    completed_stages: Optional[List[str]] = Field(
-        default=None,
-        description="Stages completed before timeout (e.g. ['stage1', 'stage2'])",
-    )
-    # ADR-034 v2.6: Directory expansion metadata (Issue #311)
-    expanded_paths: Optional[List[str]] = Field(
-        default=None,
-        description="Files included after directory expansion",
-    )
-    paths_truncated: Optional[bool] = Field(
-        default=None,
-        description="True if MAX_FILES_EXPANSION limit was reached",
-    )
-    expansion_warnings: Optional[List[str]] = Field(
-        default=None,
-        description="Warnings from directory expansion (skipped files, etc.)",
-    )
-    coverage: Optional["CoverageReport"] = Field(
-        default=None,
-        description=(
-            "#555 (ADR-053): structural coverage receipt — which requested paths "
-            "were reviewed vs omitted (with a typed reason/origin per omission). "
-            "Additive; no verdict effect (the clamp is #556)."
-        ),
-    )
-    # ADR-041: Verification telemetry fields
-    timing: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Per-stage and total timing in milliseconds",
-    )
-    input_metrics: Optional[Dict[str, Any]] = Field(
-        default=None,
-        description="Input size metrics (content_chars, tier_max_chars, num_models, num_reviewers, tier)",
-    )
-    # ADR-042: Evidence injection
-    evidence_summary: Optional[List[EvidenceDisposition]] = Field(
-        default=None,
-        description=(
-            "Per-evidence-item Council disposition. None when no evidence "
-            "was provided. Contains one entry per submitted item — including "
-            "dropped items with status=not_reviewed_due_to_budget."
-        ),
-    )
-    evidence_warnings: Optional[List[EvidenceWarning]] = Field(
-        default=None,
-        description=(
-            "Structured warnings about evidence handling "
-            "(truncation, format errors, duplicate-source disambiguation)."
-        ),
-    )
+_EXIT_CODES: Dict[str, int] = {"pass": 0, "fail": 1, "unclear": 2}
 
 
 def _verdict_to_exit_code(verdict: str) -> int:
-    """Convert verdict to exit code."""
-    if verdict == "pass":
-        return 0
-    elif verdict == "fail":
-        return 1
-    else:  # unclear
-        return 2
-
-
+    """Convert verdict to exit code (anything unrecognised is 2, unclear)."""
+    return _EXIT_CODES.get(verdict, 2)
+
+
+# PEP 562: the HTTP-only response models live in .responses and are compiled
+# on first access, so ``from .schemas import VerifyResponse`` keeps working.
+_RESPONSE_EXPORTS = (
+    "BlockingIssueResponse",
+    "CoverageOmission",
+    "CoverageReport",
+    "RubricScoresResponse",
+    "VerifyDiagnostics",
+    "VerifyResponse",
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve a response model from ``.responses`` on first access."""
+    if name in _RESPONSE_EXPORTS:
+        from . import responses
+
+        value = getattr(responses, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
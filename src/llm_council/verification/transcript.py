@@ -22,10 +22,53 @@ import json
 import os
 import tempfile
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime, time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional: ships with the [http] extra
+    orjson = None  # type: ignore[assignment]
+
+
+def _json_default(obj: Any) -> str:
+    """Encode a value JSON has no type for: ISO 8601 for dates/times, else ``str``."""
+    if isinstance(obj, (date, time)):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _serialize_stage(data: Dict[str, Any]) -> bytes:
+    """Render stage data as indented UTF-8 JSON.
+
+    Uses orjson when installed (stage payloads carry full model responses, so
+    this is the dominant cost of a write), falling back to the stdlib encoder.
+    Datetimes may be passed as-is: orjson formats them natively, and the
+    stdlib path's ``_json_default`` produces the same ``isoformat()`` text.
+    Dataclasses are passed through to ``_json_default`` so both encoders
+    render them identically; anything orjson rejects outright (e.g. integers
+    wider than 64 bits) is retried with the stdlib.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+# Most-recent verification directories a store remembers. The map only saves
+# a base_path scan, so older ids are dropped rather than kept for the life of
+# a long-running server's store.
+_VERIFICATION_DIR_CACHE_MAXSIZE = 256
+
 
 class TranscriptError(Exception):
     """Base exception for transcript operations."""
@@ -105,10 +148,17 @@ class TranscriptStore:
         path.mkdir(parents=True, exist_ok=True)
 
         # Cache the mapping for later retrieval
-        self._verification_dirs[verification_id] = path
+        self._remember_dir(verification_id, path)
 
         return path
 
+    def _remember_dir(self, verification_id: str, path: Path) -> None:
+        """Cache an id's directory, evicting the oldest beyond the bound."""
+        self._verification_dirs.pop(verification_id, None)
+        self._verification_dirs[verification_id] = path
+        while len(self._verification_dirs) > _VERIFICATION_DIR_CACHE_MAXSIZE:
+            del self._verification_dirs[next(iter(self._verification_dirs))]
+
     def _find_verification_dir(self, verification_id: str) -> Path:
         """
         Find the directory for a verification ID.
@@ -134,7 +184,7 @@ class TranscriptStore:
         if self.base_path.exists():
             for item in self.base_path.iterdir():
                 if item.is_dir() and item.name.endswith(f"-{verification_id}"):
-                    self._verification_dirs[verification_id] = item
+                    self._remember_dir(verification_id, item)
                     return item
 
         raise TranscriptNotFoundError(f"No transcript found for verification: {verification_id}")
@@ -167,8 +217,8 @@ class TranscriptStore:
         # Atomic write pattern: write to temp, then rename
         fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=verification_dir, prefix=f"{stage}_")
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            with os.fdopen(fd, "wb") as f:
+                f.write(_serialize_stage(data))
 
             # Atomic rename
             os.rename(tmp_path, target_path)
@@ -202,7 +252,7 @@ class TranscriptStore:
                 f"Stage '{stage}' not found for verification: {verification_id}"
             )
 
-        with open(stage_path) as f:
+        with open(stage_path, encoding="utf-8") as f:
             return json.load(f)
 
     def read_all_stages(self, verification_id: str) -> Dict[str, Dict[str, Any]]:
@@ -220,7 +270,7 @@ class TranscriptStore:
         stages = {}
         for stage_file in verification_dir.glob("*.json"):
             stage_name = stage_file.stem
-            with open(stage_file) as f:
+            with open(stage_file, encoding="utf-8") as f:
                 stages[stage_name] = json.load(f)
 
         return stages
@@ -32,6 +32,11 @@ class TestGetCacheKey:
         key2 = get_cache_key("What is JavaScript?")
         assert key1 != key2
 
+    def test_surrounding_whitespace_ignored(self):
+        """Queries differing only in surrounding whitespace share a key."""
+        assert get_cache_key("What is Python?") == get_cache_key("  What is Python?\n")
+        assert get_cache_key("What is Python?") != get_cache_key("what is python?")
+
     def test_key_length(self):
         """Cache key is 16 hex characters."""
         key = get_cache_key("Test query")
@@ -16,16 +16,28 @@ class TestCLIDispatch:
         """Running 'llm-council' with no args should start MCP server."""
         from llm_council import cli
 
-        mock_mcp = MagicMock()
+        mock_server = MagicMock()
         with patch.object(sys, "argv", ["llm-council"]):
-            with patch.dict("sys.modules", {"llm_council.mcp_server": MagicMock(mcp=mock_mcp)}):
+            with patch.dict("sys.modules", {"llm_council.mcp_server": mock_server}):
                 # Re-import to get fresh module with mocked dependencies
                 import importlib
 
                 importlib.reload(cli)
                 cli.main()
 
-        mock_mcp.run.assert_called_once()
+        mock_server.run_stdio.assert_called_once()
+
+    def test_no_args_skips_argument_parsing(self):
+        """The bare MCP launch should not build the subcommand parser."""
+        from llm_council import cli
+
+        with patch.object(sys, "argv", ["llm-council"]):
+            with patch.object(cli, "serve_mcp") as mock_serve:
+                with patch.object(cli.argparse, "ArgumentParser") as mock_parser:
+                    cli.main()
+
+        mock_serve.assert_called_once_with()
+        mock_parser.assert_not_called()
 
     def test_serve_command_calls_http_server(self):
         """Running 'llm-council serve' should start HTTP server."""
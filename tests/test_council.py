@@ -86,6 +86,31 @@ def test_parse_ranking_json_format():
     assert result["scores"]["Response C"] == 5
 
 
+def test_parse_ranking_unfenced_json_with_braces_in_strings():
+    """Unfenced JSON is decoded as a whole object, even with braces in notes."""
+    test_text = (
+        'My ranking: {"ranking": ["Response B", "Response A"], '
+        '"scores": {"Response A": 6, "Response B": 8}, '
+        '"notes": "B handles the {edge} case}"} Thanks!'
+    )
+
+    result = parse_ranking_from_text(test_text)
+    assert result["ranking"] == ["Response B", "Response A"]
+    assert result["scores"] == {"Response A": 6, "Response B": 8}
+
+
+def test_parse_ranking_fallback_drops_labels_not_shown():
+    """Free-text fallbacks ignore hallucinated labels when valid_labels is given."""
+    text = "FINAL RANKING:\n1. Response B\n2. Response Q\n3. Response A"
+    valid = {"Response A", "Response B"}
+
+    assert parse_ranking_from_text(text)["ranking"] == ["Response B", "Response Q", "Response A"]
+    assert parse_ranking_from_text(text, valid)["ranking"] == ["Response B", "Response A"]
+    assert parse_ranking_from_text("Response Z edges out Response A", valid)["ranking"] == [
+        "Response A"
+    ]
+
+
 def test_parse_ranking_refusal_detection():
     """Test that safety refusals are detected."""
     refusal_texts = [
@@ -342,3 +367,29 @@ def test_parse_ranking_no_mismatch():
     result = parse_ranking_from_text(test_text)
     assert result["ranking"] == ["Response A", "Response B", "Response C"]
     assert result.get("score_rank_mismatch") is not True
+
+
+@pytest.mark.asyncio
+async def test_short_query_is_its_own_title(monkeypatch):
+    """Titles for queries that already fit skip the model call."""
+    from llm_council import council_stages
+
+    async def fail(*a, **kw):
+        raise AssertionError("no model call expected")
+
+    monkeypatch.setattr(council_stages, "query_model", fail)
+
+    assert await council_stages.generate_conversation_title(" What is Python? ") == "What is Python"
+
+
+@pytest.mark.asyncio
+async def test_long_query_title_uses_model(monkeypatch):
+    from llm_council import council_stages
+
+    async def fake(model, messages, timeout=120.0, **kw):
+        return {"content": '"Python Packaging Overview"'}
+
+    monkeypatch.setattr(council_stages, "query_model", fake)
+
+    title = await council_stages.generate_conversation_title("How do I " + "package " * 20)
+    assert title == "Python Packaging Overview"
@@ -432,6 +432,37 @@ async def test_full_council_returns_complete_on_success():
         assert "Full synthesis" in result["synthesis"]
 
 
+@pytest.mark.asyncio
+async def test_single_response_skips_peer_review():
+    """With one Stage 1 response there is nothing to rank; Stage 2 is skipped."""
+    from llm_council.council import run_council_with_fallback
+
+    with (
+        patch("llm_council.council.stage1_collect_responses_with_status") as mock_s1,
+        patch("llm_council.council.stage1_5_normalize_styles") as mock_s15,
+        patch("llm_council.council.stage2_collect_rankings") as mock_s2,
+        patch("llm_council.council.stage3_synthesize_final") as mock_s3,
+        patch("llm_council.council.COUNCIL_MODELS", ["a", "b"]),
+    ):
+        mock_s1.return_value = (
+            [{"model": "a", "response": "A"}],
+            {},
+            {"a": {"status": "ok"}, "b": {"status": "timeout", "error": "Timeout"}},
+        )
+        mock_s3.return_value = ({"model": "chair", "response": "Synthesis"}, {}, None)
+
+        result = await run_council_with_fallback("test")
+
+        mock_s15.assert_not_called()
+        mock_s2.assert_not_called()
+        assert mock_s3.call_args.args[2] == []
+        assert result["metadata"]["degraded_mode"] == "single_model"
+        assert result["metadata"]["label_to_model"] == {
+            "Response A": {"model": "a", "display_index": 0}
+        }
+        assert result["synthesis"] == "Synthesis"
+
+
 # =============================================================================
 # Test 8: All Models Timeout - Failed Status
 # =============================================================================
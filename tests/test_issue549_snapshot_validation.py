@@ -51,3 +51,21 @@ def test_valid_snapshot_is_not_rejected(tmp_path, monkeypatch):
     # The boundary check itself accepts a valid SHA. (Full run_verification needs
     # network + a real commit; the unit under test here is only the guard.)
     assert validate_snapshot_id("a" * 40) is True
+
+
+def test_verify_endpoint_maps_unvalidated_snapshot_to_422(tmp_path, monkeypatch):
+    """The endpoint leans on run_verification's guard; the error still surfaces as 422."""
+    import asyncio
+
+    from fastapi import HTTPException
+
+    import llm_council.verification.api as api_mod
+
+    req = VerifyRequest.model_construct(snapshot_id="not a sha", tier="balanced", target_paths=None)
+    monkeypatch.setenv("LLM_COUNCIL_TRANSCRIPT_PATH", str(tmp_path))
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(api_mod.verify_endpoint(req))
+
+    assert exc_info.value.status_code == 422
+    assert "Invalid snapshot ID" in str(exc_info.value.detail)
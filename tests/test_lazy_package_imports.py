@@ -0,0 +1,40 @@
+"""Lazy resolution of llm_council's top-level exports (PEP 562)."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+
+class TestLazyPackageExports:
+    def test_importing_a_submodule_does_not_load_the_council(self):
+        code = (
+            "import sys, llm_council.metadata; "
+            "print('llm_council.council' in sys.modules, 'llm_council.facade' in sys.modules)"
+        )
+        assert _run(code) == "False False"
+
+    def test_public_names_still_import(self):
+        code = (
+            "import llm_council\n"
+            "from llm_council import COUNCIL_MODELS, consult_council\n"
+            "from llm_council.facade import consult_council as facade_consult\n"
+            "from llm_council.unified_config import get_config\n"
+            "assert consult_council is facade_consult\n"
+            "assert COUNCIL_MODELS == get_config().council.models\n"
+            "names = dir(llm_council)\n"
+            "assert set(llm_council.__all__) <= set(names)\n"
+            "print('consult_council' in names, 'run_full_council' in names)"
+        )
+        assert _run(code) == "True True"
+
+    def test_unknown_attribute_still_raises(self):
+        import llm_council
+
+        with pytest.raises(AttributeError, match="not_a_real_name"):
+            llm_council.not_a_real_name
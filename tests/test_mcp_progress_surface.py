@@ -73,11 +73,17 @@ class TestStage2ProgressWiring:
         # flipped onto the incremental path by a progress wrapper.
         from llm_council import council
 
+        # Two responses: a single response skips Stage 2 entirely.
+        responses = [{"model": "m/a", "response": "A"}, {"model": "m/b", "response": "B"}]
+
         async def fake_stage1(*a, **kw):
             return (
-                [{"model": "m/a", "response": "A"}],
+                responses,
                 {},
-                {"m/a": {"status": "ok", "response": "A"}},
+                {
+                    "m/a": {"status": "ok", "response": "A"},
+                    "m/b": {"status": "ok", "response": "B"},
+                },
             )
 
         with (
@@ -88,7 +94,7 @@ class TestStage2ProgressWiring:
             patch.object(council, "stage3_synthesize_final", new_callable=AsyncMock) as s3,
             patch.object(council, "stage1_5_normalize_styles", new_callable=AsyncMock) as s15,
         ):
-            s15.return_value = ([{"model": "m/a", "response": "A"}], {})
+            s15.return_value = (responses, {})
             s2.return_value = ([], {}, {})
             s3.return_value = ({"model": "c", "response": "s"}, {}, None)
             await council.run_council_with_fallback("q", bypass_cache=True)
@@ -32,6 +32,34 @@ def test_main_entry_point_exists():
     assert callable(main)
 
 
+def test_run_stdio_falls_back_to_default_loop_without_uvloop():
+    """Without uvloop, run_stdio() is plain mcp.run()."""
+    from llm_council import mcp_server
+
+    with (
+        patch.dict("sys.modules", {"uvloop": None}),
+        patch.object(mcp_server, "mcp") as mock_mcp,
+    ):
+        mcp_server.run_stdio()
+
+    mock_mcp.run.assert_called_once_with()
+
+
+def test_run_stdio_uses_uvloop_when_installed():
+    """With uvloop importable, the stdio server runs on it via anyio."""
+    from llm_council import mcp_server
+
+    with (
+        patch.dict("sys.modules", {"uvloop": MagicMock()}),
+        patch.object(mcp_server, "mcp") as mock_mcp,
+        patch("anyio.run") as mock_run,
+    ):
+        mcp_server.run_stdio()
+
+    mock_mcp.run.assert_not_called()
+    mock_run.assert_called_once_with(mock_mcp.run_stdio_async, backend_options={"use_uvloop": True})
+
+
 def test_confidence_configs_defined():
     """Test that confidence level configurations are defined (ADR-012)."""
     from llm_council.mcp_server import CONFIDENCE_CONFIGS
@@ -0,0 +1,107 @@
+"""Transient-failure retry in the direct OpenRouter client.
+
+A momentary 5xx or dropped connection from one model used to drop that model
+from the council outright. query_model_with_status now retries those failures
+a bounded number of times inside the caller's timeout; non-transient failures
+(rate limits, auth, billing, bad requests) are returned immediately.
+"""
+
+import httpx
+import pytest
+
+from llm_council import openrouter
+
+_URL = "https://openrouter.ai/api/v1/chat/completions"
+_OK_BODY = {"choices": [{"message": {"content": "hi"}}], "usage": {"total_tokens": 3}}
+
+
+def _install(monkeypatch, outcomes):
+    """Serve ``outcomes`` (status codes or exceptions) one per POST."""
+    calls = []
+
+    class _ScriptedClient:
+        def __init__(self, *a, **kw):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *a):
+            return False
+
+        async def post(self, *a, **kw):
+            outcome = outcomes[len(calls)]
+            calls.append(outcome)
+            if isinstance(outcome, Exception):
+                raise outcome
+            body = _OK_BODY if outcome == 200 else {}
+            return httpx.Response(outcome, json=body, request=httpx.Request("POST", _URL))
+
+    monkeypatch.setattr(openrouter.httpx, "AsyncClient", _ScriptedClient)
+    monkeypatch.setattr(openrouter, "_get_openrouter_api_key", lambda: "test-key")
+    monkeypatch.setattr(openrouter, "TRANSIENT_RETRY_BASE_DELAY", 0.0)
+    monkeypatch.setattr(openrouter.random, "uniform", lambda a, b: 0.0)
+    return calls
+
+
+async def _query(timeout=10.0):
+    return await openrouter.query_model_with_status(
+        "test/model", [{"role": "user", "content": "hi"}], timeout=timeout
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure", [502, httpx.ConnectError("connection reset")])
+async def test_transient_failure_is_retried(monkeypatch, failure):
+    calls = _install(monkeypatch, [failure, 200])
+
+    result = await _query()
+
+    assert result["status"] == openrouter.STATUS_OK
+    assert result["content"] == "hi"
+    assert result["attempts"] == 2
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded(monkeypatch):
+    calls = _install(monkeypatch, [503] * 5)
+
+    result = await _query()
+
+    assert result["status"] == openrouter.STATUS_ERROR
+    assert result["attempts"] == openrouter.TRANSIENT_RETRY_ATTEMPTS
+    assert len(calls) == openrouter.TRANSIENT_RETRY_ATTEMPTS
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [400, 402, 429])
+async def test_non_transient_failures_are_not_retried(monkeypatch, status):
+    calls = _install(monkeypatch, [status, 200])
+
+    result = await _query()
+
+    assert result["status"] != openrouter.STATUS_OK
+    assert "attempts" not in result
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_no_retry_when_backoff_would_exceed_the_timeout(monkeypatch):
+    calls = _install(monkeypatch, [500, 200])
+    monkeypatch.setattr(openrouter, "TRANSIENT_RETRY_BASE_DELAY", 5.0)
+
+    result = await _query(timeout=1.0)
+
+    assert result["status"] == openrouter.STATUS_ERROR
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_success_has_no_attempts_key(monkeypatch):
+    _install(monkeypatch, [200])
+
+    result = await _query()
+
+    assert result["status"] == openrouter.STATUS_OK
+    assert "attempts" not in result
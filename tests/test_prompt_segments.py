@@ -128,3 +128,20 @@ class TestExistingPinsPreserved:
         # false-positive on the instructions' "security vulnerabilities".
         assert prompt.index("**Focus Area**: Security") < prompt.index("finding-xyz")
         assert prompt.index("finding-xyz") < prompt.index("## Code to Review")
+
+
+class TestStaticHeadCache:
+    @pytest.mark.asyncio
+    async def test_static_head_rendered_once_per_focus(self):
+        from llm_council.verification.api import _render_static_head
+
+        _render_static_head.cache_clear()
+        p1, i1 = await _build("abc1234def", "a\n")
+        p2, i2 = await _build("def5678abc", "b\n")
+        p3, _ = await _build("abc1234def", "a\n", rubric_focus="Performance")
+
+        head = i1["segments"][0]
+        assert p1[: head["end"]] == p2[: head["end"]]
+        assert "**Focus Area**: Performance" in p3
+        info = _render_static_head.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
@@ -0,0 +1,132 @@
+"""Stage 1.5 style normalization runs its rewrites concurrently.
+
+Each response is rewritten by an independent normalizer call, so the stage
+should cost about one call's latency rather than one per council member, while
+keeping results in Stage 1 order and falling back to the original on failure.
+"""
+
+import asyncio
+
+import pytest
+
+from llm_council import council_stages as council_mod
+
+
+def _stage1():
+    return [{"model": f"m{i}", "response": f"text {i}"} for i in range(4)]
+
+
+@pytest.fixture
+def always_normalize(monkeypatch):
+    monkeypatch.setattr(council_mod, "_get_style_normalization", lambda: True)
+    monkeypatch.setattr(council_mod, "_get_normalizer_model", lambda: "normalizer")
+
+
+@pytest.mark.asyncio
+async def test_rewrites_run_concurrently(always_normalize, monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fake_query(model, messages, timeout=120.0, **kw):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        original = messages[0]["content"].split("Original text:\n")[1].split("\n")[0]
+        return {"content": f"neutral {original}", "usage": {"total_tokens": 3}}
+
+    monkeypatch.setattr(council_mod, "query_model", fake_query)
+
+    results, usage = await council_mod.stage1_5_normalize_styles(_stage1())
+
+    assert peak == 4
+    assert [r["model"] for r in results] == ["m0", "m1", "m2", "m3"]
+    assert [r["response"] for r in results] == [f"neutral text {i}" for i in range(4)]
+    assert usage["total_tokens"] == 12
+
+
+@pytest.mark.asyncio
+async def test_failed_rewrite_keeps_original(always_normalize, monkeypatch):
+    async def fake_query(model, messages, timeout=120.0, **kw):
+        if "text 1" in messages[0]["content"]:
+            return None
+        return {"content": "neutral", "usage": {}}
+
+    monkeypatch.setattr(council_mod, "query_model", fake_query)
+
+    results, _usage = await council_mod.stage1_5_normalize_styles(_stage1())
+
+    assert results[1] == {"model": "m1", "response": "text 1", "original_response": "text 1"}
+    assert results[0]["response"] == "neutral"
+
+
+@pytest.mark.asyncio
+async def test_prestarted_rewrites_are_reused(always_normalize, monkeypatch):
+    calls = []
+
+    async def fake_query(model, messages, timeout=120.0, **kw):
+        calls.append(messages[0]["content"])
+        return {"content": "fresh", "usage": {}}
+
+    async def early():
+        return {"content": "early", "usage": {"total_tokens": 2}}
+
+    monkeypatch.setattr(council_mod, "query_model", fake_query)
+    prestarted = {"m0": asyncio.ensure_future(early())}
+
+    results, usage = await council_mod.stage1_5_normalize_styles(_stage1(), prestarted=prestarted)
+
+    assert results[0]["response"] == "early"
+    assert [r["response"] for r in results[1:]] == ["fresh"] * 3
+    assert len(calls) == 3
+    assert usage["total_tokens"] == 2
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_starts_rewrites_as_stage1_responses_arrive(monkeypatch):
+    """run_council_with_fallback overlaps each rewrite with the rest of Stage 1."""
+    from unittest.mock import AsyncMock, patch
+
+    from llm_council import council
+
+    slow_model_answered = asyncio.Event()
+    rewrite_started_before_slow_model = []
+
+    async def fake_stage1(user_query, on_model_complete=None, **kwargs):
+        await on_model_complete("fast", {"status": "ok", "content": "fast text"})
+        await asyncio.sleep(0.01)
+        slow_model_answered.set()
+        await on_model_complete("slow", {"status": "ok", "content": "slow text"})
+        return (
+            [
+                {"model": "fast", "response": "fast text"},
+                {"model": "slow", "response": "slow text"},
+            ],
+            {},
+            {"fast": {"status": "ok"}, "slow": {"status": "ok"}},
+        )
+
+    async def fake_normalize(text):
+        rewrite_started_before_slow_model.append(not slow_model_answered.is_set())
+        return {"content": f"neutral {text}", "usage": {}}
+
+    monkeypatch.setattr(council, "_get_style_normalization", lambda: True)
+    with (
+        patch.object(council, "stage1_collect_responses_with_status", fake_stage1),
+        patch.object(council, "normalize_response_style", fake_normalize),
+        patch.object(
+            council, "stage2_collect_rankings", AsyncMock(return_value=([], {}, {}))
+        ) as mock_s2,
+        patch.object(
+            council,
+            "stage3_synthesize_final",
+            AsyncMock(return_value=({"model": "c", "response": "s"}, {}, None)),
+        ),
+        patch.object(council, "calculate_aggregate_rankings", return_value=[]),
+    ):
+        await council.run_council_with_fallback("q", models=["fast", "slow"])
+
+    assert rewrite_started_before_slow_model == [True, False]
+    reviewed = mock_s2.call_args.args[1]
+    assert [r["response"] for r in reviewed] == ["neutral fast text", "neutral slow text"]
@@ -0,0 +1,79 @@
+"""LLM_COUNCIL_REVIEWER_CONTEXT controls how much of Stage 2 the chairman sees.
+
+"full" (default) passes every reviewer's critique verbatim; "parsed" passes
+only the ranking/scores JSON extracted from it, which is what the votes are
+made of, to cut chairman input tokens.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from llm_council import council_stages as council_mod
+from llm_council.council_rankings import parse_ranking_from_text
+
+_PROSE = "Response A is thorough but long-winded; Response B misses the edge case."
+_UNPARSEABLE = "Both answers are reasonable and I have no strong preference."
+_REFUSAL = "I cannot evaluate these responses."
+
+
+def _review(model, text):
+    return {"model": model, "ranking": text, "parsed_ranking": parse_ranking_from_text(text)}
+
+
+def _stage2():
+    ranked = (
+        f"{_PROSE}\n```json\n"
+        '{"ranking": ["Response A", "Response B"], "scores": {"Response A": 8}}\n```'
+    )
+    return [
+        _review("m1", ranked),
+        _review("m2", _UNPARSEABLE),
+        _review("m3", _REFUSAL),
+    ]
+
+
+async def _chairman_prompt(monkeypatch):
+    prompts = []
+
+    async def fake(model, messages, disable_tools=False, timeout=120.0, **kw):
+        prompts.append(messages[0]["content"])
+        return {"status": "ok", "content": "synthesis", "usage": {}}
+
+    monkeypatch.setattr(council_mod, "query_model_with_status", fake)
+    await council_mod.stage3_synthesize_final(
+        "q", [{"model": "m1", "response": "a"}, {"model": "m2", "response": "b"}], _stage2()
+    )
+    return prompts[0]
+
+
+@pytest.mark.asyncio
+async def test_full_context_is_the_default(monkeypatch):
+    prompt = await _chairman_prompt(monkeypatch)
+
+    assert _PROSE in prompt
+
+
+@pytest.mark.asyncio
+async def test_parsed_context_sends_rankings_without_prose(monkeypatch):
+    with patch("llm_council.council.REVIEWER_CONTEXT", "parsed"):
+        prompt = await _chairman_prompt(monkeypatch)
+
+    assert _PROSE not in prompt
+    compact = '{"ranking":["Response A","Response B"],"scores":{"Response A":8}}'
+    assert f"Model: m1\nRanking: {compact}" in prompt
+    # Reviews that yield no ranking (unparseable or abstained) keep their
+    # text rather than reaching the chairman as an empty vote.
+    assert f"Model: m2\nRanking: {_UNPARSEABLE}" in prompt
+    assert f"Model: m3\nRanking: {_REFUSAL}" in prompt
+    assert '"ranking":[]' not in prompt
+
+
+def test_env_override(monkeypatch):
+    from llm_council.unified_config import _apply_env_overrides, UnifiedConfig
+
+    monkeypatch.setenv("LLM_COUNCIL_REVIEWER_CONTEXT", "Parsed")
+
+    config = _apply_env_overrides(UnifiedConfig())
+
+    assert config.council.reviewer_context == "parsed"
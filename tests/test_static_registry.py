@@ -46,6 +46,39 @@ models:
         assert "custom/model-1" in models
 
 
+class TestStaticRegistryParseReuse:
+    """An unchanged registry file is parsed once across provider instances."""
+
+    def test_unchanged_file_is_not_reparsed(self, tmp_path):
+        from llm_council.metadata import static_registry
+
+        registry = tmp_path / "registry.yaml"
+        registry.write_text('models:\n  - id: "a/one"\n    context_window: 1000\n')
+        static_registry.StaticRegistryProvider(registry_path=registry)
+
+        with patch.object(static_registry.yaml, "load") as mock_load:
+            provider = static_registry.StaticRegistryProvider(registry_path=registry)
+
+        mock_load.assert_not_called()
+        assert provider.list_available_models() == ["a/one"]
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        import os
+
+        from llm_council.metadata.static_registry import StaticRegistryProvider
+
+        registry = tmp_path / "registry.yaml"
+        registry.write_text('models:\n  - id: "a/one"\n    context_window: 1000\n')
+        StaticRegistryProvider(registry_path=registry)
+        registry.write_text('models:\n  - id: "b/two"\n    context_window: 2000\n')
+        stat = registry.stat()
+        os.utime(registry, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        provider = StaticRegistryProvider(registry_path=registry)
+
+        assert provider.list_available_models() == ["b/two"]
+
+
 class TestStaticRegistryGetModelInfo:
     """Test get_model_info() method."""
 
@@ -10,6 +10,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import yaml
 
 # Will be created
 from llm_council.unified_config import (
@@ -172,6 +173,41 @@ council:
             config = load_config(config_file)
             assert config.credentials.openrouter == "sk-test-key"
 
+    def test_load_config_reuses_parse_until_file_changes(self, tmp_path):
+        """Should skip re-parsing an unchanged file and pick up edits."""
+        config_file = tmp_path / "llm_council.yaml"
+        config_file.write_text("council:\n  tiers:\n    default: quick\n")
+
+        with patch("llm_council.unified_config.yaml.load", wraps=yaml.load) as parse:
+            assert load_config(config_file).tiers.default == "quick"
+            assert load_config(config_file).tiers.default == "quick"
+            assert parse.call_count == 1
+
+            config_file.write_text("council:\n  tiers:\n    default: balanced\n")
+            assert load_config(config_file).tiers.default == "balanced"
+            assert parse.call_count == 2
+
+    def test_env_var_substitution_keeps_surrounding_text(self, tmp_path):
+        """Should substitute every ${VAR} in a value, leaving other text intact."""
+        config_file = tmp_path / "llm_council.yaml"
+        config_file.write_text(
+            "council:\n  cache:\n    directory: ${TEST_BASE}/cache/${TEST_MISSING}x\n"
+        )
+
+        with patch.dict(os.environ, {"TEST_BASE": "/srv"}):
+            config = load_config(config_file)
+        assert str(config.cache.directory) == "/srv/cache/x"
+
+    def test_cached_parse_still_substitutes_current_env(self, tmp_path):
+        """Should apply env var substitution afresh on every load."""
+        config_file = tmp_path / "llm_council.yaml"
+        config_file.write_text("council:\n  credentials:\n    openrouter: ${TEST_OPENROUTER_KEY}\n")
+
+        with patch.dict(os.environ, {"TEST_OPENROUTER_KEY": "sk-one"}):
+            assert load_config(config_file).credentials.openrouter == "sk-one"
+        with patch.dict(os.environ, {"TEST_OPENROUTER_KEY": "sk-two"}):
+            assert load_config(config_file).credentials.openrouter == "sk-two"
+
 
 class TestEnvVarOverrides:
     """Test environment variable overrides for configuration."""
@@ -212,6 +248,16 @@ council:
             config = get_effective_config(config_file)
             assert config.triage.enabled is True
 
+    @pytest.mark.parametrize(
+        "value,expected",
+        [("true", True), ("YES", True), ("1", True), ("false", False), ("on", False)],
+    )
+    def test_boolean_env_var_spellings(self, tmp_path, value, expected):
+        """Should accept true/1/yes in any case and treat anything else as False."""
+        with patch.dict(os.environ, {"LLM_COUNCIL_TRIAGE_ENABLED": value}):
+            config = get_effective_config(tmp_path / "missing.yaml")
+            assert config.triage.enabled is expected
+
     def test_env_var_overrides_tier_models(self, tmp_path):
         """Should override tier models via env var (comma-separated)."""
         with patch.dict(os.environ, {"LLM_COUNCIL_MODELS_QUICK": "model-a,model-b"}):
@@ -399,6 +445,17 @@ class TestConfigSerialization:
         assert "tiers:" in yaml_str
         assert "gateways:" in yaml_str
 
+    def test_config_to_yaml_round_trips(self, tmp_path):
+        """to_yaml output should load back through load_config."""
+        config = UnifiedConfig()
+        config_file = tmp_path / "llm_council.yaml"
+        config_file.write_text(config.to_yaml())
+
+        assert "!!python" not in config_file.read_text()
+        loaded = load_config(config_file, strict=True)
+        assert loaded.cache.directory == config.cache.directory
+        assert loaded.tiers == config.tiers
+
     def test_config_to_dict(self):
         """Should be able to serialize config to dict."""
         config = UnifiedConfig()
@@ -1757,6 +1814,18 @@ class TestADR032EnvVarOverrides:
         config = get_effective_config()
 
         assert config.cache.enabled is True
+        assert config.cache.verify_enabled is False
+
+    def test_verify_cache_env_override(self, monkeypatch):
+        """LLM_COUNCIL_VERIFY_CACHE env var should override cache.verify_enabled."""
+        from llm_council.unified_config import get_effective_config, reload_config
+
+        monkeypatch.setenv("LLM_COUNCIL_VERIFY_CACHE", "true")
+        reload_config()
+        config = get_effective_config()
+
+        assert config.cache.verify_enabled is True
+        assert config.cache.enabled is False
 
     def test_cache_ttl_env_override(self, monkeypatch):
         """LLM_COUNCIL_CACHE_TTL env var should override cache.ttl_seconds."""
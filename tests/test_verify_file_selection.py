@@ -177,13 +177,25 @@ def test_garbage_matching_covers_directory_components(redteam_repo):
 
 
 class TestArchitectureNoBypass:
-    def test_fetch_has_exactly_one_caller_across_the_package(self):
-        """The raw `git show` primitive must be reachable from one place only.
+    @pytest.mark.parametrize(
+        "primitive, expected_caller",
+        [
+            ("_fetch_files_batched_async", "_fetch_files_for_verification_async_with_metadata"),
+            ("_fetch_files_uncached_async", "_fetch_files_batched_async"),
+            ("_fetch_file_at_commit_async", "_fetch_files_uncached_async"),
+        ],
+    )
+    def test_fetch_has_exactly_one_caller_across_the_package(
+        self, primitive, expected_caller
+    ):
+        """The raw blob-reading primitives must be reachable from one place only.
 
         Excluding `file_ops.py` wholesale would let a future bypass be added inside
         the very module that owns the gate. So: no callers anywhere else in the
-        package, and inside `file_ops` exactly one -- the batch fetcher, which only
-        ever iterates `SelectedBlob` values produced by `select_blobs`.
+        package, and inside `file_ops` exactly one -- the batch fetcher (which only
+        ever iterates `SelectedBlob` values produced by `select_blobs`) for the
+        cached `git cat-file --batch` primitive, that primitive for its uncached
+        reader, and the reader for the per-file `git show` one.
         """
         pkg = pathlib.Path(file_ops.__file__).parent.parent
         external: List[str] = []
@@ -200,7 +212,7 @@ class TestArchitectureNoBypass:
                 if not isinstance(node, ast.Call):
                     continue
                 name = getattr(node.func, "id", None) or getattr(node.func, "attr", None)
-                if name != "_fetch_file_at_commit_async":
+                if name != primitive:
                     continue
                 if py.name == "file_ops.py":
                     internal_callers.add(enclosing.get(id(node), "<module>"))
@@ -208,8 +220,8 @@ class TestArchitectureNoBypass:
                     external.append(f"{py.name}:{node.lineno}")
 
         assert not external, f"fetch called outside file_ops: {external}"
-        assert internal_callers == {"_fetch_files_for_verification_async_with_metadata"}, (
-            f"fetch called from {sorted(internal_callers)}; expected only the batch fetcher"
+        assert internal_callers == {expected_caller}, (
+            f"{primitive} called from {sorted(internal_callers)}; expected only {expected_caller}"
         )
 
     def test_selected_blob_is_frozen(self):
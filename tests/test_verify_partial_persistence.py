@@ -60,6 +60,33 @@ class TestInputCapPersistenceAndSignal:
         assert len(writes) == 1
         assert writes[0].get("error") == "input_too_large"
 
+    @pytest.mark.asyncio
+    async def test_request_timestamp_is_the_context_creation_time(self):
+        from datetime import datetime
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from llm_council.verification.api import run_verification, VerifyRequest
+
+        with (
+            patch("llm_council.verification.api.VerificationContextManager") as mock_ctx_mgr,
+            patch(
+                "llm_council.verification.api._build_verification_prompt",
+                new_callable=AsyncMock,
+                return_value=("x" * 20000, {"kept": [], "warnings": []}),
+            ),
+        ):
+            mock_ctx = MagicMock(context_id="test-ctx", created_at=datetime(2026, 1, 2, 3, 4, 5))
+            mock_ctx_mgr.return_value.__enter__ = MagicMock(return_value=mock_ctx)
+            mock_ctx_mgr.return_value.__exit__ = MagicMock(return_value=False)
+            mock_store = MagicMock()
+            mock_store.create_verification_directory.return_value = "/tmp/test"
+
+            await run_verification(VerifyRequest(snapshot_id="abc1234", tier="quick"), mock_store)
+
+        request_write = mock_store.write_stage.call_args_list[0].args
+        assert request_write[1] == "request"
+        assert request_write[2]["timestamp"] == datetime(2026, 1, 2, 3, 4, 5)
+
     def test_formatter_flags_input_too_large_distinctly(self):
         result = {
             "verdict": "unclear",
@@ -183,3 +210,106 @@ class TestTimeoutPersistence:
         assert result["rubric_scores"].get("accuracy") == 9.0
         assert result["confidence"] > 0.0
         assert "advisory" in result["rationale"].lower()
+
+
+class TestStageWritesOverlapNextStage:
+    @pytest.mark.asyncio
+    async def test_stage1_write_runs_alongside_stage2(self):
+        """Transcript I/O for a finished stage must not delay the next model call."""
+        import threading
+        import time
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from llm_council.tier_contract import create_tier_contract, get_tier_timeout
+        from llm_council.verification.api import VerifyRequest, _run_verification_pipeline
+
+        stage2_started = threading.Event()
+        overlapped = []
+
+        def write_stage(verification_id, stage, data):
+            if stage == "stage1":
+                # Blocks the write until stage 2 is underway; a serial pipeline
+                # would time out here instead.
+                overlapped.append(stage2_started.wait(timeout=5))
+
+        async def stage2(*args, **kwargs):
+            stage2_started.set()
+            return [], {}, {}
+
+        mock_store = MagicMock()
+        mock_store.write_stage.side_effect = write_stage
+        with (
+            patch(
+                "llm_council.verification.api.stage1_collect_responses_with_status",
+                new_callable=AsyncMock,
+                return_value=([{"model": "m", "response": "ok"}], {}, {}),
+            ),
+            patch("llm_council.verification.api.stage2_collect_rankings", side_effect=stage2),
+            patch(
+                "llm_council.verification.api.stage3_synthesize_final",
+                new_callable=AsyncMock,
+                return_value=({"model": "m", "response": "s"}, {}, None),
+            ),
+            patch("llm_council.verification.api.calculate_aggregate_rankings", return_value=[]),
+            patch(
+                "llm_council.verification.api.build_verification_result",
+                return_value={
+                    "verdict": "pass",
+                    "confidence": 0.9,
+                    "rubric_scores": {},
+                    "blocking_issues": [],
+                    "rationale": "OK",
+                },
+            ),
+        ):
+            await _run_verification_pipeline(
+                request=VerifyRequest(snapshot_id="abc1234", tier="quick"),
+                store=mock_store,
+                on_progress=None,
+                verification_id="test-id",
+                transcript_dir="/tmp/test",
+                verification_query="test query",
+                tier_contract=create_tier_contract("quick"),
+                tier_timeout=get_tier_timeout("quick"),
+                ctx=MagicMock(),
+                partial_state={"completed_stages": []},
+                deadline_at=time.monotonic() + 60,
+            )
+
+        assert overlapped == [True]
+        stages = [call.args[1] for call in mock_store.write_stage.call_args_list]
+        assert stages == ["stage1", "stage2", "stage3", "result"]
+
+    @pytest.mark.asyncio
+    async def test_request_write_runs_alongside_prompt_building(self):
+        """request.json goes to disk off the event loop, while files are fetched."""
+        import threading
+        from unittest.mock import MagicMock, patch
+
+        from llm_council.verification.api import VerifyRequest, run_verification
+
+        prompt_started = threading.Event()
+        overlapped = []
+
+        def write_stage(verification_id, stage, data):
+            if stage == "request":
+                overlapped.append(prompt_started.wait(timeout=5))
+
+        async def build_prompt(**kwargs):
+            prompt_started.set()
+            return "x" * 20000, {"kept": [], "warnings": []}  # over the quick cap
+
+        mock_store = MagicMock()
+        mock_store.create_verification_directory.return_value = "/tmp/test"
+        mock_store.write_stage.side_effect = write_stage
+        with patch(
+            "llm_council.verification.api._build_verification_prompt", side_effect=build_prompt
+        ):
+            result = await run_verification(
+                VerifyRequest(snapshot_id="abc1234", tier="quick"), mock_store
+            )
+
+        assert overlapped == [True]
+        assert result["error"] == "input_too_large"
+        stages = [call.args[1] for call in mock_store.write_stage.call_args_list]
+        assert stages == ["request", "result"]
@@ -0,0 +1,185 @@
+"""Tests for the opt-in verification result cache (LLM_COUNCIL_VERIFY_CACHE).
+
+A repeat verification of the same prompt at the same snapshot with the same
+tier models reuses the earlier deliberation instead of re-running the council.
+Degraded outcomes (partial, errored, infra failure) are never reused.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from llm_council.verification.api import VerifyRequest, run_verification
+
+
+def _result(verification_id, **overrides):
+    result = {
+        "verification_id": verification_id,
+        "verdict": "pass",
+        "confidence": 0.9,
+        "exit_code": 0,
+        "rubric_scores": {},
+        "blocking_issues": [],
+        "rationale": "ok",
+        "transcript_location": f"/tmp/{verification_id}",
+        "partial": False,
+        "timing": {"total_elapsed_ms": 1234},
+        "input_metrics": {"content_chars": 6, "total_tokens": 900},
+    }
+    result.update(overrides)
+    return result
+
+
+@contextmanager
+def _verify_env(
+    cache_dir, enabled=True, prompt="prompt", pipeline_result=None, council_cache=False
+):
+    async def pipeline(**kwargs):
+        if pipeline_result is not None:
+            return pipeline_result(kwargs["verification_id"])
+        return _result(kwargs["verification_id"])
+
+    with (
+        patch("llm_council.cache.VERIFY_CACHE_ENABLED", enabled),
+        patch("llm_council.cache.CACHE_ENABLED", council_cache),
+        patch("llm_council.cache.CACHE_DIR", cache_dir),
+        patch("llm_council.verification.api.VerificationContextManager") as mock_ctx_mgr,
+        patch(
+            "llm_council.verification.api._build_verification_prompt",
+            new_callable=AsyncMock,
+            return_value=(prompt, {"kept": [], "warnings": []}),
+        ),
+        patch(
+            "llm_council.verification.api._run_verification_pipeline",
+            side_effect=pipeline,
+        ) as mock_pipeline,
+        patch("llm_council.verification.api.persist_session_performance_data"),
+    ):
+        mock_ctx_mgr.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        mock_ctx_mgr.return_value.__exit__ = MagicMock(return_value=False)
+        yield mock_pipeline
+
+
+def _store():
+    store = MagicMock()
+    store.create_verification_directory.side_effect = lambda vid: f"/tmp/{vid}"
+    return store
+
+
+class TestVerificationResultCache:
+    @pytest.mark.asyncio
+    async def test_repeat_verification_reuses_the_deliberation(self, tmp_path):
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(tmp_path) as mock_pipeline:
+            first = await run_verification(request, _store())
+            store = _store()
+            second = await run_verification(request, store)
+
+        assert mock_pipeline.call_count == 1
+        assert second["verdict"] == "pass"
+        assert second["cached_from"] == first["verification_id"]
+        assert second["verification_id"] != first["verification_id"]
+        assert second["transcript_location"] == f"/tmp/{second['verification_id']}"
+        # The earlier run's latency and token/cost figures are not this call's.
+        assert second["timing"] is None
+        assert second["input_metrics"] is None
+        # The hit is still auditable under its own id.
+        result_writes = [c.args for c in store.write_stage.call_args_list if c.args[1] == "result"]
+        assert result_writes == [(second["verification_id"], "result", second)]
+
+    @pytest.mark.asyncio
+    async def test_different_prompt_misses(self, tmp_path):
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(tmp_path, prompt="one") as mock_pipeline:
+            await run_verification(request, _store())
+        with _verify_env(tmp_path, prompt="two") as mock_pipeline:
+            result = await run_verification(request, _store())
+
+        assert mock_pipeline.call_count == 1
+        assert "cached_from" not in result
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"partial": True},
+            {"error": "input_too_large"},
+            {"verdict": "unclear", "unclear_reason": "infra_failure"},
+        ],
+    )
+    async def test_degraded_results_are_not_cached(self, tmp_path, overrides):
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(
+            tmp_path, pipeline_result=lambda vid: _result(vid, **overrides)
+        ) as mock_pipeline:
+            await run_verification(request, _store())
+            await run_verification(request, _store())
+
+        assert mock_pipeline.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_writes_nothing(self, tmp_path):
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(tmp_path, enabled=False) as mock_pipeline:
+            await run_verification(request, _store())
+            await run_verification(request, _store())
+
+        assert mock_pipeline.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_council_response_cache_alone_does_not_reuse_verdicts(self, tmp_path):
+        """LLM_COUNCIL_CACHE predates verification caching and must not enable it."""
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(tmp_path, enabled=False, council_cache=True) as mock_pipeline:
+            await run_verification(request, _store())
+            await run_verification(request, _store())
+
+        assert mock_pipeline.call_count == 2
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "setting, value",
+        [("REVIEWER_CONTEXT", "parsed"), ("EXCLUDE_SELF_VOTES", False), ("CHAIRMAN_MODEL", "x/y")],
+    )
+    async def test_council_settings_change_the_key(self, tmp_path, setting, value):
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(tmp_path) as mock_pipeline:
+            await run_verification(request, _store())
+            with patch(f"llm_council.cache.{setting}", value):
+                result = await run_verification(request, _store())
+
+        assert mock_pipeline.call_count == 2
+        assert "cached_from" not in result
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "stored",
+        [
+            {"verification_id": "x"},
+            {"confidence": 7.5},
+        ],
+    )
+    async def test_invalid_cached_entry_is_a_miss(self, tmp_path, stored):
+        import json
+
+        request = VerifyRequest(snapshot_id="abc1234", tier="quick")
+
+        with _verify_env(tmp_path) as mock_pipeline:
+            await run_verification(request, _store())
+            (entry,) = tmp_path.iterdir()
+            data = json.loads(entry.read_text())
+            data["result"] = stored if "verification_id" in stored else {**data["result"], **stored}
+            entry.write_text(json.dumps(data))
+            result = await run_verification(request, _store())
+
+        assert mock_pipeline.call_count == 2
+        assert "cached_from" not in result
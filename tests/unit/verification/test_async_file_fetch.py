@@ -234,6 +234,331 @@ class TestConcurrentFileFetching:
         assert "```" in content  # Code block
 
 
+@pytest.fixture(params=["subprocess", "pygit2"])
+def blob_backend(request):
+    """Run batched-fetch tests against both the cat-file and pygit2 backends."""
+    from llm_council.verification import file_ops
+
+    if request.param == "pygit2":
+        pytest.importorskip("pygit2")
+        yield request.param
+    else:
+        with patch.object(file_ops, "_get_pygit2_repo", return_value=None):
+            yield request.param
+
+
+class TestBatchedFileFetching:
+    """One `git cat-file --batch` process (or none, with pygit2) per verification."""
+
+    @pytest.mark.asyncio
+    async def test_results_align_with_requested_paths(self, blob_backend):
+        from llm_council.verification.file_ops import _fetch_files_batched_async
+
+        results = await _fetch_files_batched_async(
+            "HEAD", ["pyproject.toml", "nonexistent/file.py", "../etc/passwd", "README.md"]
+        )
+
+        assert len(results) == 4
+        assert "[project]" in results[0][0]
+        assert results[1][0].startswith("[Error: Could not read nonexistent/file.py")
+        assert "missing" in results[1][0]
+        assert "Invalid file path" in results[2][0]
+        assert not results[3][0].startswith("[Error:")
+
+    @pytest.mark.asyncio
+    async def test_matches_per_file_fetch(self, blob_backend):
+        from llm_council.verification.file_ops import (
+            _fetch_file_at_commit_async,
+            _fetch_files_batched_async,
+        )
+
+        [batched] = await _fetch_files_batched_async("HEAD", ["pyproject.toml"])
+        single = await _fetch_file_at_commit_async("HEAD", "pyproject.toml")
+
+        assert batched == single
+
+    @pytest.mark.asyncio
+    async def test_truncates_each_file_and_keeps_stream_in_sync(self, blob_backend):
+        from llm_council.verification.file_ops import _fetch_files_batched_async
+
+        results = await _fetch_files_batched_async(
+            "HEAD", ["pyproject.toml", "pyproject.toml"], max_file_chars=50
+        )
+
+        for content, truncated in results:
+            assert truncated is True
+            assert content.startswith("[project]")
+            assert "truncated, original file larger than 50 chars" in content
+
+    @pytest.mark.asyncio
+    async def test_directory_is_reported_not_returned(self, blob_backend):
+        from llm_council.verification.file_ops import _fetch_files_batched_async
+
+        results = await _fetch_files_batched_async("HEAD", ["src", "pyproject.toml"])
+
+        assert "not a file (tree)" in results[0][0]
+        assert "[project]" in results[1][0]
+
+    @pytest.mark.asyncio
+    async def test_spawns_a_single_process_for_many_files(self):
+        from llm_council.verification import file_ops
+
+        real_exec = asyncio.create_subprocess_exec
+        with (
+            patch.object(file_ops, "_get_pygit2_repo", return_value=None),
+            patch("asyncio.create_subprocess_exec", side_effect=real_exec) as spy,
+        ):
+            await file_ops._fetch_files_batched_async(
+                "HEAD", ["pyproject.toml", "README.md", "Makefile", "LICENSE"]
+            )
+
+        argvs = [call.args[:3] for call in spy.call_args_list]
+        assert argvs.count(("git", "cat-file", "--batch")) == 1
+        assert not any(argv[:2] == ("git", "show") for argv in argvs)
+
+    @pytest.mark.asyncio
+    async def test_pygit2_backend_spawns_no_git_process(self):
+        pytest.importorskip("pygit2")
+        from llm_council.verification import file_ops
+
+        await file_ops._get_git_root_async()  # prime the cached root
+        with patch("asyncio.create_subprocess_exec") as spy:
+            results = await file_ops._fetch_files_batched_async(
+                "HEAD", ["pyproject.toml", "README.md"]
+            )
+
+        spy.assert_not_called()
+        assert "[project]" in results[0][0]
+
+    def test_pygit2_handles_are_not_shared_across_threads(self):
+        pytest.importorskip("pygit2")
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from llm_council.verification import file_ops
+
+        git_root = asyncio.run(file_ops._get_git_root_async())
+        both_started = threading.Barrier(2)
+
+        def open_twice():
+            both_started.wait(timeout=5)
+            first = file_ops._get_pygit2_repo(git_root)
+            assert file_ops._get_pygit2_repo(git_root) is first
+            return first
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            handles = list(pool.map(lambda _: open_twice(), range(2)))
+
+        assert handles[0] is not None
+        assert handles[0] is not handles[1]
+
+    def test_pygit2_repo_is_none_outside_a_repository(self, tmp_path):
+        from llm_council.verification import file_ops
+
+        assert file_ops._get_pygit2_repo(None) is None
+        assert file_ops._get_pygit2_repo(str(tmp_path / "not-a-repo")) is None
+
+
+class TestGitRootDiscovery:
+    """The repo root comes from an ancestor walk, not a `git rev-parse` fork."""
+
+    def test_matches_git_rev_parse(self):
+        import subprocess
+
+        from llm_council.verification.file_ops import _find_git_root
+
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        assert _find_git_root() == toplevel
+
+    def test_finds_gitfile_from_nested_directory(self, tmp_path):
+        from llm_council.verification.file_ops import _find_git_root
+
+        (tmp_path / ".git").write_text("gitdir: /elsewhere/worktrees/wt\n")  # worktree/submodule
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+
+        assert _find_git_root(str(nested)) == str(tmp_path.resolve())
+
+    @pytest.mark.asyncio
+    async def test_lookup_spawns_no_process_and_caches(self, monkeypatch):
+        from llm_council.verification import file_ops
+
+        monkeypatch.setattr(file_ops, "_cached_git_root", None)
+        with patch("asyncio.create_subprocess_exec") as spy:
+            first = await file_ops._get_git_root_async()
+            second = await file_ops._get_git_root_async()
+
+        spy.assert_not_called()
+        assert first is not None and first == second == file_ops._cached_git_root
+
+    def test_sync_lookup_does_not_cache_a_miss(self, monkeypatch, tmp_path):
+        from llm_council.verification import file_ops
+
+        monkeypatch.setattr(file_ops, "_cached_git_root", None)
+        monkeypatch.setattr(file_ops, "_find_git_root", lambda: None)
+        assert file_ops._get_git_root() is None
+        assert file_ops._cached_git_root is None
+
+        monkeypatch.setattr(file_ops, "_find_git_root", lambda: str(tmp_path))
+        assert file_ops._get_git_root() == str(tmp_path)
+
+
+@pytest.fixture
+def head_sha():
+    import subprocess
+
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+class TestSnapshotCaches:
+    """Reads at an immutable SHA are memoized across verifications."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_caches(self):
+        from llm_council.verification import file_ops
+
+        file_ops._clear_snapshot_caches()
+        yield
+        file_ops._clear_snapshot_caches()
+
+    @pytest.mark.asyncio
+    async def test_repeat_fetch_at_sha_reads_git_once(self, head_sha):
+        from llm_council.verification import file_ops
+
+        real = file_ops._fetch_files_uncached_async
+        with patch.object(file_ops, "_fetch_files_uncached_async", side_effect=real) as spy:
+            first = await file_ops._fetch_files_batched_async(head_sha, ["pyproject.toml"])
+            second = await file_ops._fetch_files_batched_async(
+                head_sha, ["pyproject.toml", "README.md"]
+            )
+
+        assert second[0] == first[0]
+        assert [call.args[1] for call in spy.call_args_list] == [
+            ["pyproject.toml"],
+            ["README.md"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mutable_refs_and_errors_are_not_cached(self, head_sha):
+        from llm_council.verification import file_ops
+
+        await file_ops._fetch_files_batched_async("HEAD", ["pyproject.toml"])
+        await file_ops._fetch_files_batched_async(head_sha, ["nonexistent/file.py"])
+
+        assert not file_ops._blob_cache
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_coalesce(self, head_sha):
+        from llm_council.verification import file_ops
+
+        real = file_ops._fetch_files_uncached_async
+        with patch.object(file_ops, "_fetch_files_uncached_async", side_effect=real) as spy:
+            results = await asyncio.gather(
+                *(file_ops._fetch_files_batched_async(head_sha, ["pyproject.toml"]) for _ in range(5))
+            )
+
+        assert spy.call_count == 1
+        assert all(r == results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_fetches_of_different_snapshots_overlap(self):
+        from llm_council.verification import file_ops
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_read(snapshot_id, file_paths, limit):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return [(f"{snapshot_id}:{fp}", False) for fp in file_paths]
+
+        shas = [c * 40 for c in "abcd"]
+        with patch.object(file_ops, "_fetch_files_uncached_async", side_effect=fake_read):
+            results = await asyncio.gather(
+                *(file_ops._fetch_files_batched_async(sha, ["a.py"]) for sha in shas)
+            )
+
+        assert peak == len(shas)
+        assert [r[0][0] for r in results] == [f"{sha}:a.py" for sha in shas]
+
+    @pytest.mark.asyncio
+    async def test_waiters_read_for_themselves_if_the_owner_fails(self):
+        from llm_council.verification import file_ops
+
+        calls = 0
+
+        async def flaky_read(snapshot_id, file_paths, limit):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            if calls == 1:
+                raise RuntimeError("git went away")
+            return [("content", False) for _ in file_paths]
+
+        sha = "a" * 40
+        with patch.object(file_ops, "_fetch_files_uncached_async", side_effect=flaky_read):
+            first, second = await asyncio.gather(
+                file_ops._fetch_files_batched_async(sha, ["a.py"]),
+                file_ops._fetch_files_batched_async(sha, ["a.py"]),
+                return_exceptions=True,
+            )
+
+        assert isinstance(first, RuntimeError)
+        assert second == [("content", False)]
+        assert not file_ops._blob_inflight
+
+    def test_works_across_event_loops(self):
+        from llm_council.verification import file_ops
+
+        async def fake_read(snapshot_id, file_paths, limit):
+            await asyncio.sleep(0.01)
+            return [("content", False) for _ in file_paths]
+
+        async def contended(sha):
+            return await asyncio.gather(
+                file_ops._fetch_files_batched_async(sha, ["a.py"]),
+                file_ops._fetch_files_batched_async(sha, ["a.py"]),
+            )
+
+        with patch.object(file_ops, "_fetch_files_uncached_async", side_effect=fake_read):
+            asyncio.run(contended("a" * 40))
+            results = asyncio.run(contended("b" * 40))
+
+        assert results == [[("content", False)]] * 2
+
+    def test_blob_cache_evicts_least_recently_used(self):
+        from collections import OrderedDict
+
+        from llm_council.verification import file_ops
+
+        cache: OrderedDict = OrderedDict()
+        for key in "abc":
+            file_ops._lru_put(cache, key, key, maxsize=2)
+        file_ops._lru_get(cache, "b")
+        file_ops._lru_put(cache, "d", "d", maxsize=2)
+
+        assert list(cache) == ["b", "d"]
+
+    @pytest.mark.asyncio
+    async def test_diff_tree_is_memoized_per_sha(self, head_sha):
+        from llm_council.verification import file_ops
+
+        git_root = await file_ops._get_git_root_async()
+        first = await file_ops._diff_tree_async(head_sha, git_root)
+        with patch("asyncio.create_subprocess_exec") as spy:
+            second = await file_ops._diff_tree_async(head_sha, git_root)
+
+        spy.assert_not_called()
+        assert second == first
+
+
 class TestAsyncTimeout:
     """Tests for timeout handling in async operations."""
 
@@ -290,6 +615,39 @@ class TestAsyncTimeout:
             # Process should have been killed
             mock_proc.kill.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_metadata_query_timeout_kills_git(self):
+        """A timed-out git metadata query must not leave git running."""
+        from llm_council.verification.file_ops import _blob_sizes
+
+        async def hang():
+            await asyncio.sleep(1)
+
+        mock_proc = MagicMock()
+        mock_proc.returncode = None
+        mock_proc.communicate = hang
+        mock_proc.kill = MagicMock()
+        mock_proc.wait = AsyncMock()
+
+        with (
+            patch(
+                "llm_council.verification.file_ops._get_git_root_async",
+                new_callable=AsyncMock,
+                return_value="/mock/root",
+            ),
+            patch(
+                "asyncio.create_subprocess_exec",
+                new_callable=AsyncMock,
+                return_value=mock_proc,
+            ),
+            patch("llm_council.verification.file_ops.ASYNC_SUBPROCESS_TIMEOUT", 0.05),
+        ):
+            sizes = await _blob_sizes("HEAD", ["a.py"])
+
+        assert sizes == {}
+        mock_proc.kill.assert_called_once()
+        mock_proc.wait.assert_awaited()
+
 
 class TestProcessExitDeadlock:
     """Regression tests for the classic Python subprocess pipe deadlock:
@@ -426,6 +784,8 @@ class TestPathValidation:
         assert _validate_file_path("../secret.txt") is False
         assert _validate_file_path("foo/../../../etc/passwd") is False
         assert _validate_file_path("..") is False
+        assert _validate_file_path("foo//../bar") is False
+        assert _validate_file_path("foo\\..\\bar") is False
 
     def test_rejects_null_bytes(self):
         """Should reject null byte injection."""
@@ -503,6 +863,16 @@ class TestConcurrencyLimiting:
             for _ in range(acquired):
                 sem.release()
 
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_share_one_semaphore(self, monkeypatch):
+        """Lock-free lazy init must still hand every caller the same instance."""
+        from llm_council.verification import file_ops
+
+        monkeypatch.setattr(file_ops, "_git_semaphore", None)
+        sems = await asyncio.gather(*(file_ops._get_git_semaphore() for _ in range(20)))
+
+        assert all(sem is sems[0] for sem in sems)
+
     @pytest.mark.asyncio
     async def test_max_concurrent_git_ops_is_reasonable(self):
         """MAX_CONCURRENT_GIT_OPS should be a reasonable limit."""
@@ -570,15 +940,60 @@ class TestStreamingMemoryBounded:
 
             content, truncated = await _fetch_file_at_commit_async("HEAD", "huge_file.txt")
 
-            # Should have read in chunks (8KB each based on implementation)
-            assert len(bytes_read_tracker) > 1, "Should read in multiple chunks"
-            # Total bytes read should be approximately MAX_FILE_CHARS + 1 (for truncation check)
+            # Reads stop one byte past the cap (that byte is the truncation probe)
             total_read = sum(bytes_read_tracker)
             assert (
-                total_read <= MAX_FILE_CHARS + 8192 + 1
+                total_read == MAX_FILE_CHARS + 1
             ), f"Should not buffer entire file: read {total_read} bytes"
             assert truncated is True
 
+    @pytest.mark.asyncio
+    async def test_reads_pipe_sized_chunks(self):
+        """A file well under 64 KB should not need one read per 8 KB."""
+        read_sizes: list = []
+        payload = b"z" * 40_000
+        read_pos = 0
+
+        async def tracking_read(size: int) -> bytes:
+            nonlocal read_pos
+            read_sizes.append(size)
+            chunk = payload[read_pos : read_pos + size]
+            read_pos += size
+            return chunk
+
+        mock_proc = MagicMock()
+        mock_proc.stdout = MagicMock(read=tracking_read)
+        mock_proc.stderr = MagicMock(read=AsyncMock(return_value=b""))
+        mock_proc.returncode = 0
+        mock_proc.wait = AsyncMock()
+
+        with (
+            patch(
+                "llm_council.verification.file_ops._get_git_root_async",
+                new_callable=AsyncMock,
+                return_value="/mock/root",
+            ),
+            patch(
+                "llm_council.verification.file_ops._get_git_semaphore",
+                new_callable=AsyncMock,
+                return_value=asyncio.Semaphore(10),
+            ),
+            patch(
+                "asyncio.create_subprocess_exec",
+                new_callable=AsyncMock,
+                return_value=mock_proc,
+            ),
+        ):
+            from llm_council.verification.api import _fetch_file_at_commit_async
+
+            content, truncated = await _fetch_file_at_commit_async(
+                "HEAD", "mid.txt", max_file_chars=50_000
+            )
+
+        assert truncated is False
+        assert len(content) == 40_000
+        assert len(read_sizes) == 2  # one data read, one EOF
+
     @pytest.mark.asyncio
     async def test_process_killed_on_large_file_truncation(self):
         """Process should be killed when large file is truncated to save resources."""
@@ -633,6 +1048,32 @@ class TestStreamingMemoryBounded:
             mock_proc.kill.assert_called_once()
 
 
+class TestDecodeBlob:
+    """The per-file cap is applied to the bytes before they are decoded."""
+
+    def test_small_blob_decodes_unchanged(self):
+        from llm_council.verification.file_ops import _decode_blob
+
+        assert _decode_blob("héllo".encode(), 100, False) == ("héllo", False)
+
+    def test_oversized_blob_is_cut_before_decoding(self):
+        from llm_council.verification.file_ops import _decode_blob
+
+        content, truncated = _decode_blob(b"a" * 11, 10, True)
+
+        assert truncated is True
+        assert content == "a" * 10 + "\n\n... [truncated, original file larger than 10 chars]"
+
+    def test_split_codepoint_becomes_single_replacement_char(self):
+        from llm_council.verification.file_ops import _decode_blob
+
+        # "é" is two bytes; a 5-byte cut lands inside the third one
+        content, truncated = _decode_blob("ééé".encode(), 5, True)
+
+        assert truncated is True
+        assert content.startswith("éé\ufffd\n\n...")
+
+
 class TestEventLoopNotBlocked:
     """Tests that event loop is not blocked by file operations."""
 
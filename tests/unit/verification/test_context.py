@@ -59,6 +59,42 @@ class TestSnapshotValidation:
             validate_snapshot_id("a" * 41)
         assert "too long" in str(exc_info.value).lower()
 
+    def test_validate_snapshot_id_rejects_trailing_newline(self):
+        """`$` used to match before a final newline, letting "sha\\n" through."""
+        with pytest.raises(InvalidSnapshotError):
+            validate_snapshot_id("abc1234\n")
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "abc1234",
+            "ABCDEF0",
+            "a" * 40,
+            "abc123",
+            "a" * 41,
+            "abc123g",
+            "abc 1234",
+            "\u0661" * 7,
+            "",
+        ],
+    )
+    def test_is_hex_sha_agrees_with_pattern(self, value):
+        from llm_council.verification.context import GIT_SHA_PATTERN, is_hex_sha
+
+        assert is_hex_sha(value) is bool(GIT_SHA_PATTERN.match(value))
+
+    @pytest.mark.parametrize("value", ["abc1234\n", "abc1234 ", "a" * 41, "abc123g"])
+    def test_verify_request_rejects_what_context_rejects(self, value):
+        """Both boundaries anchor the whole string, so one check is enough."""
+        from pydantic import ValidationError
+
+        from llm_council.verification.schemas import VerifyRequest
+
+        with pytest.raises(ValidationError):
+            VerifyRequest(snapshot_id=value)
+        with pytest.raises(InvalidSnapshotError):
+            validate_snapshot_id(value)
+
     def test_validate_snapshot_id_empty(self):
         """Empty string should fail."""
         with pytest.raises(InvalidSnapshotError):
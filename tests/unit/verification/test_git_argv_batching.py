@@ -112,3 +112,27 @@ class TestReviewabilityAttrsChunking:
             assert len(_argv_paths(call)) <= 5
         assert set(attrs.keys()) == set(paths), "results from every chunk must be merged"
         assert all(v == "generated" for v in attrs.values())
+
+
+class TestChunksFanOut:
+    @pytest.mark.asyncio
+    async def test_chunks_run_concurrently_in_slice_order(self, monkeypatch):
+        import asyncio
+
+        monkeypatch.setattr(file_ops, "GIT_ARGV_BATCH_SIZE", 5)
+        in_flight = 0
+        peak = 0
+
+        async def chunk_fn(snapshot_id, chunk):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return chunk
+
+        results = await file_ops._map_argv_chunks(chunk_fn, "HEAD", _paths(12))
+
+        assert peak == 3, "every slice should be in flight before any finishes"
+        assert [len(r) for r in results] == [5, 5, 2]
+        assert sum(results, []) == _paths(12)
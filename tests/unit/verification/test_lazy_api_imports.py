@@ -0,0 +1,93 @@
+"""Lazy resolution of FastAPI and council imports in verification.api."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+import llm_council.verification.api as api
+
+
+class TestLazyRouter:
+    def test_router_is_built_once_and_cached(self):
+        first = api.router
+        assert api.router is first
+        assert "router" in vars(api)
+
+    def test_router_registers_verify_route(self):
+        paths = [getattr(route, "path", None) for route in api.router.routes]
+        assert "/verify" in paths
+
+    def test_endpoint_annotations_resolve_once_router_is_built(self):
+        import typing
+
+        from fastapi import Response
+
+        api.router
+        assert typing.get_type_hints(api.verify_endpoint)["return"] is Response
+
+
+class TestLazyCouncilExports:
+    def test_stage_functions_resolve_to_council(self):
+        from llm_council import council
+
+        assert api.stage2_collect_rankings is council.stage2_collect_rankings
+
+    def test_load_council_keeps_patched_names(self):
+        fake = AsyncMock()
+        with patch("llm_council.verification.api.stage3_synthesize_final", fake):
+            api._load_council()
+            assert api.stage3_synthesize_final is fake
+
+        from llm_council import council
+
+        assert api.stage3_synthesize_final is council.stage3_synthesize_final
+
+    def test_unknown_attribute_still_raises(self):
+        with pytest.raises(AttributeError, match="not_a_real_name"):
+            api.not_a_real_name
+
+
+class TestLazyPackageNamespace:
+    def test_public_names_resolve_lazily(self):
+        import llm_council.verification as verification
+        from llm_council.verification.transcript import TranscriptStore
+
+        assert verification.TranscriptStore is TranscriptStore
+        assert verification.run_verification is api.run_verification
+        assert verification.verification_router is api.router
+        assert set(verification.__all__) <= set(dir(verification))
+
+    def test_importing_package_does_not_import_fastapi(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, llm_council.verification, llm_council.verification.api; "
+            "print('fastapi' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+
+class TestLazyResponseModels:
+    def test_response_models_resolve_to_one_class(self):
+        from llm_council.verification import responses, schemas
+
+        assert schemas.VerifyResponse is responses.VerifyResponse
+        assert api.VerifyResponse is responses.VerifyResponse
+        assert api.RubricScoresResponse is responses.RubricScoresResponse
+
+    def test_mcp_import_path_does_not_build_response_models(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys, llm_council.verification.api; "
+            "print('llm_council.verification.responses' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
@@ -16,6 +16,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 
+def _batched(fake_fetch):
+    """Adapt a per-file fake fetcher to the `_fetch_files_batched_async` seam."""
+
+    async def fake_batch(snapshot_id, file_paths, max_file_chars=None):
+        return [
+            await fake_fetch(snapshot_id, fp, max_file_chars=max_file_chars) for fp in file_paths
+        ]
+
+    return fake_batch
+
+
 # ---------------------------------------------------------------------------
 # Tier-aware per-file streaming cap
 # ---------------------------------------------------------------------------
@@ -159,7 +170,7 @@ class TestFetchFilesUsesTierLimit:
             return list(target_paths), False, [], []
 
         with (
-            patch.object(api, "_fetch_file_at_commit_async", side_effect=fake_fetch),
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
             patch.object(api, "_expand_target_paths", side_effect=fake_expand),
             patch.object(
                 api,
@@ -191,7 +202,7 @@ class TestFetchFilesUsesTierLimit:
             return list(target_paths), False, [], []
 
         with (
-            patch.object(api, "_fetch_file_at_commit_async", side_effect=fake_fetch),
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
             patch.object(api, "_expand_target_paths", side_effect=fake_expand),
             patch.object(
                 api,
@@ -227,7 +238,7 @@ class TestBatchBudgetDoesNotOvershoot:
             return list(target_paths), False, [], []
 
         with (
-            patch.object(api, "_fetch_file_at_commit_async", side_effect=fake_fetch),
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
             patch.object(api, "_expand_target_paths", side_effect=fake_expand),
             patch.object(
                 api,
@@ -247,6 +258,38 @@ class TestBatchBudgetDoesNotOvershoot:
         )
         assert "omitted" in content
 
+    @pytest.mark.asyncio
+    async def test_section_layout_is_byte_stable(self):
+        """Sections are separated by one blank line; the omission marker follows."""
+        from llm_council.verification import file_ops as api
+
+        bodies = {"a.py": "x = 1", "b.py": "", "c.py": "z" * 49_999}
+
+        async def fake_fetch(snapshot_id, file_path, max_file_chars=None):
+            return bodies[file_path], False
+
+        async def fake_expand(snapshot_id, target_paths):
+            return list(target_paths), False, [], []
+
+        with (
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
+            patch.object(api, "_expand_target_paths", side_effect=fake_expand),
+            patch.object(
+                api,
+                "_get_git_root_async",
+                new_callable=AsyncMock,
+                return_value="/mock/root",
+            ),
+        ):
+            content, _ = await api._fetch_files_for_verification_async_with_metadata(
+                "HEAD", list(bodies), tier="reasoning"
+            )
+
+        assert content == (
+            "### a.py\n```\nx = 1\n```\n\n### b.py\n```\n\n```\n\n"
+            "\n... [remaining files omitted, 50000 char limit reached]"
+        )
+
     @pytest.mark.asyncio
     async def test_first_file_is_never_dropped_even_if_its_own_truncation_marker_overshoots(
         self,
@@ -278,7 +321,7 @@ class TestBatchBudgetDoesNotOvershoot:
             return list(target_paths), False, [], []
 
         with (
-            patch.object(api, "_fetch_file_at_commit_async", side_effect=fake_fetch),
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
             patch.object(api, "_expand_target_paths", side_effect=fake_expand),
             patch.object(
                 api,
@@ -296,6 +339,58 @@ class TestBatchBudgetDoesNotOvershoot:
             "truncation marker makes it slightly exceed the batch budget"
         )
 
+    @pytest.mark.asyncio
+    async def test_fetching_stops_once_the_budget_is_spent(self):
+        """Files past the budget are not read only to be thrown away."""
+        from llm_council.verification import file_ops as api
+
+        paths = [f"docs/{i}.md" for i in range(100)]
+        fetched: list = []
+
+        async def fake_batch(snapshot_id, file_paths, max_file_chars=None):
+            fetched.append(list(file_paths))
+            return [("y" * 20_000, False) for _ in file_paths]
+
+        async def fake_expand(snapshot_id, target_paths):
+            return list(target_paths), False, [], []
+
+        with (
+            patch.object(api, "_fetch_files_batched_async", side_effect=fake_batch),
+            patch.object(api, "_expand_target_paths", side_effect=fake_expand),
+        ):
+            content, _ = await api._fetch_files_for_verification_async_with_metadata(
+                "HEAD", paths, tier="reasoning"
+            )
+
+        assert content.count("### ") == 2
+        assert sum(len(batch) for batch in fetched) == api._FIRST_FETCH_WAVE
+
+    @pytest.mark.asyncio
+    async def test_small_files_are_fetched_in_few_waves(self):
+        from llm_council.verification import file_ops as api
+
+        paths = [f"src/{i}.py" for i in range(100)]
+        fetched: list = []
+
+        async def fake_batch(snapshot_id, file_paths, max_file_chars=None):
+            fetched.append(list(file_paths))
+            return [("x = 1\n" * 10, False) for _ in file_paths]
+
+        async def fake_expand(snapshot_id, target_paths):
+            return list(target_paths), False, [], []
+
+        with (
+            patch.object(api, "_fetch_files_batched_async", side_effect=fake_batch),
+            patch.object(api, "_expand_target_paths", side_effect=fake_expand),
+        ):
+            content, _ = await api._fetch_files_for_verification_async_with_metadata(
+                "HEAD", paths, tier="reasoning"
+            )
+
+        assert content.count("### ") == 100
+        assert [p for batch in fetched for p in batch] == paths
+        assert len(fetched) == 2
+
 
 # ---------------------------------------------------------------------------
 # expansion_warnings plumbing
@@ -319,7 +414,7 @@ class TestPerFileTruncationSurfacesAsWarning:
             return list(target_paths), False, [], []
 
         with (
-            patch.object(api, "_fetch_file_at_commit_async", side_effect=fake_fetch),
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
             patch.object(api, "_expand_target_paths", side_effect=fake_expand),
             patch.object(
                 api,
@@ -352,7 +447,7 @@ class TestPerFileTruncationSurfacesAsWarning:
             return list(target_paths), False, [], []
 
         with (
-            patch.object(api, "_fetch_file_at_commit_async", side_effect=fake_fetch),
+            patch.object(api, "_fetch_files_batched_async", side_effect=_batched(fake_fetch)),
             patch.object(api, "_expand_target_paths", side_effect=fake_expand),
             patch.object(
                 api,
@@ -239,6 +239,57 @@ class TestAtomicWrites:
             assert "readonly" in str(exc_info.value).lower()
 
 
+class TestStageSerialization:
+    """Stage files read back identically whichever JSON encoder wrote them."""
+
+    PAYLOAD = {
+        "responses": [{"model": "m", "response": "caf\u00e9 \u2713"}],
+        "label_to_model": {1: "m"},
+        "path": Path("src/app.py"),
+        "timestamp": datetime(2026, 1, 2, 3, 4, 5),
+    }
+
+    @pytest.fixture(params=["orjson", "stdlib"])
+    def encoder(self, request, monkeypatch):
+        from llm_council.verification import transcript
+
+        if request.param == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(transcript, "orjson", None)
+        return request.param
+
+    def test_round_trip_matches_stdlib_semantics(self, encoder, tmp_path):
+        store = create_transcript_store(base_path=tmp_path)
+        store.create_verification_directory("abc1234")
+
+        store.write_stage("abc1234", "stage1", self.PAYLOAD)
+
+        assert store.read_stage("abc1234", "stage1") == {
+            "responses": [{"model": "m", "response": "caf\u00e9 \u2713"}],
+            "label_to_model": {"1": "m"},
+            "path": "src/app.py",
+            "timestamp": "2026-01-02T03:04:05",
+        }
+
+    def test_datetimes_render_as_iso_8601(self, encoder):
+        from llm_council.verification.transcript import _serialize_stage
+
+        stamp = datetime(2026, 1, 2, 3, 4, 5, 678901)
+
+        assert json.loads(_serialize_stage({"t": stamp})) == {"t": stamp.isoformat()}
+
+    def test_output_is_indented(self, encoder):
+        from llm_council.verification.transcript import _serialize_stage
+
+        assert _serialize_stage({"a": [1]}) == b'{\n  "a": [\n    1\n  ]\n}'
+
+    def test_values_orjson_rejects_fall_back_to_stdlib(self):
+        from llm_council.verification.transcript import _serialize_stage
+
+        assert json.loads(_serialize_stage({"big": 2**70})) == {"big": 2**70}
+
+
 class TestTranscriptRetrieval:
     """Tests for reading transcripts back."""
 
@@ -428,3 +479,34 @@ class TestConcurrentWrites:
                     assert data["vid"] == vid
 
         asyncio.run(run_concurrent())
+
+
+class TestEndpointStoreReuse:
+    """verify_endpoint shares one store per transcript path across requests."""
+
+    def test_same_path_reuses_store(self, tmp_path):
+        from llm_council.verification.api import _endpoint_transcript_store
+
+        assert _endpoint_transcript_store(tmp_path) is _endpoint_transcript_store(tmp_path)
+
+    def test_new_path_gets_its_own_store(self, tmp_path):
+        from llm_council.verification.api import _endpoint_transcript_store
+
+        other = tmp_path / "other"
+        store = _endpoint_transcript_store(other)
+
+        assert store is not _endpoint_transcript_store(tmp_path)
+        assert store.base_path == other and other.is_dir()
+
+    def test_directory_map_is_bounded(self, tmp_path, monkeypatch):
+        from llm_council.verification import transcript
+
+        monkeypatch.setattr(transcript, "_VERIFICATION_DIR_CACHE_MAXSIZE", 3)
+        store = transcript.create_transcript_store(base_path=tmp_path)
+        for i in range(5):
+            store.create_verification_directory(f"v{i}")
+
+        assert list(store._verification_dirs) == ["v2", "v3", "v4"]
+        # An evicted id is still found by scanning base_path.
+        store.write_stage("v0", "request", {"ok": True})
+        assert store.read_stage("v0", "request") == {"ok": True}
@@ -0,0 +1,85 @@
+"""The /verify endpoint serializes its own response body."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+fastapi = pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+import llm_council.verification.api as api
+
+RESULT = {
+    "verification_id": "abc12345",
+    "verdict": "pass",
+    "confidence": 0.91,
+    "exit_code": 0,
+    "rubric_scores": {"accuracy": 9.0},
+    "blocking_issues": [],
+    "rationale": "Looks good — no issues.",
+    "transcript_location": ".council/logs/x-abc12345",
+}
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setenv("LLM_COUNCIL_TRANSCRIPT_PATH", str(tmp_path))
+    app = fastapi.FastAPI()
+    app.include_router(api._build_router())
+    return TestClient(app)
+
+
+def test_body_matches_validated_response_model(client):
+    with patch.object(api, "run_verification", AsyncMock(return_value=dict(RESULT))):
+        response = client.post("/verify", json={"snapshot_id": "abc1234"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == api.VerifyResponse(**RESULT).model_dump(mode="json")
+
+
+def test_invalid_result_is_a_500_when_validating(client, monkeypatch):
+    monkeypatch.setattr(api, "TRUST_INTERNAL_RESULTS", False)
+    broken = {**RESULT, "confidence": 7}
+    with patch.object(api, "run_verification", AsyncMock(return_value=broken)):
+        response = client.post("/verify", json={"snapshot_id": "abc1234"})
+
+    assert response.status_code == 500
+
+
+@pytest.mark.filterwarnings("error")
+def test_trusted_construction_matches_validation():
+    from llm_council.verification.responses import construct_trusted
+
+    result = {
+        **RESULT,
+        "blocking_issues": [{"severity": "critical", "description": "x"}],
+        "findings": [{"severity": "critical", "description": "x", "location": "a.py:1"}],
+        "diagnostics": {"findings_source": "structured", "findings_by_severity": {"critical": 1}},
+        "coverage": {
+            "requested": ["a.py"],
+            "reviewed": [],
+            "omitted": [{"path": "a.py", "reason": "binary", "origin": "explicit"}],
+        },
+        "evidence_warnings": [
+            {
+                "request_index": 0,
+                "source": "lint@1",
+                "reason": "budget_overflow_dropped",
+                "detail": "cut",
+                "chars_attempted": 9,
+                "chars_kept": 0,
+            }
+        ],
+        "timing": {"total_ms": 12},
+        "not_a_field": 1,
+    }
+    trusted = construct_trusted(api.VerifyResponse, result)
+
+    assert trusted.model_dump_json() == api.VerifyResponse(**result).model_dump_json()
+
+
+def test_openapi_still_documents_response_model(client):
+    schema = client.get("/openapi.json").json()
+    ok = schema["paths"]["/verify"]["post"]["responses"]["200"]
+    assert ok["content"]["application/json"]["schema"]["$ref"].endswith("/VerifyResponse")